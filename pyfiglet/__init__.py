@@ -9,11 +9,12 @@ from __future__ import print_function, unicode_literals
 
 # import pkg_resources  # This causes issues with Sublime Text's limited standard library.
 import importlib        # This should be generally available.
+import io
 import os
-import re
 import sys
-from optparse import OptionParser
-import time
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
 
 from .version import __version__
 
@@ -41,6 +42,30 @@ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA
 
 DEFAULT_FONT = 'standard'
 
+# Fewest distinct strings Figlet.renderBatch spreads over processes.
+# Starting a pool and loading the font in each worker takes tens of
+# milliseconds with fork and hundreds with spawn; a string renders in
+# well under one.
+PARALLEL_MIN_TEXTS = 1000
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+try:
+    # Much cheaper to import than threading
+    from _thread import RLock as _RLock
+except ImportError:
+    # python2's thread module has no RLock
+    from threading import RLock as _RLock
+
+try:
+    from types import MappingProxyType as _frozendict
+except ImportError:
+    # python2 has no read-only dict view; shared tables stay plain dicts
+    _frozendict = dict
+
 
 #### Replacements for pkg_resources  ####
 
@@ -65,13 +90,13 @@ def resource_exists(pkg, resource):
 
 def resource_string(pkg, resource):
     path = get_res_path(pkg, resource)
-    with open(path) as fd:
+    with open(path, 'rb') as fd:
         res_str = fd.read()
     return res_str
 
 def resource_stream(pkg, resource):
     path = get_res_path(pkg, resource)
-    fd = open(path)
+    fd = open(path, 'rb')
     return fd
 
 def resource_listdir(pkg, resource):
@@ -80,6 +105,206 @@ def resource_listdir(pkg, resource):
     return os.listdir(path)
 
 
+### Regular expressions ###
+
+class LazyRegex(object):
+    """
+    Class attribute compiling its regular expression the first time it is
+    used, so importing pyfiglet doesn't load re or compile patterns that
+    may never be needed
+    """
+
+    def __init__(self, pattern, flags=0):
+        self.pattern = pattern
+        self.flags = flags
+        self.regex = None
+
+    def __get__(self, obj, cls=None):
+        if self.regex is None:
+            import re
+            self.regex = re.compile(self.pattern, self.flags)
+        return self.regex
+
+
+### Caches ###
+
+class LRUCache(object):
+    """
+    Thread-safe, bounded mapping that evicts the least recently used
+    entry once it holds more than `capacity` items, or more than
+    `maxBytes` as measured by sizeOf if that is set
+    """
+
+    def __init__(self, capacity=32, maxBytes=None):
+        self._lock = _RLock()
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._capacity = capacity
+        self._maxBytes = maxBytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def getCapacity(self):
+        return self._capacity
+
+    def setCapacity(self, capacity):
+        with self._lock:
+            self._capacity = capacity
+            self._evict()
+
+    capacity = property(getCapacity, setCapacity)
+
+    def getMaxBytes(self):
+        return self._maxBytes
+
+    def setMaxBytes(self, maxBytes):
+        with self._lock:
+            self._maxBytes = maxBytes
+            self._evict()
+
+    maxBytes = property(getMaxBytes, setMaxBytes)
+
+    def sizeOf(self, key, value):
+        """
+        Bytes an entry counts for against maxBytes
+        """
+        return 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._remove(key)
+            size = self.sizeOf(key, value)
+            if self._maxBytes is not None and size > self._maxBytes:
+                # Would evict everything else and still not fit
+                return
+            self._data[key] = value
+            self._sizes[key] = size
+            self.bytes += size
+            self._evict()
+
+    def _remove(self, key):
+        if key in self._data:
+            del self._data[key]
+            self.bytes -= self._sizes.pop(key)
+
+    def _evict(self):
+        while self._data and (
+                len(self._data) > max(self._capacity, 0)
+                or (self._maxBytes is not None
+                    and self.bytes > self._maxBytes)):
+            key, value = self._data.popitem(last=False)
+            self.bytes -= self._sizes.pop(key)
+            self.evictions += 1
+
+    def discard(self, predicate):
+        """
+        Drop every entry whose key satisfies predicate
+        """
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                self._remove(key)
+
+    def clear(self):
+        """
+        Drop every entry and reset the counters
+        """
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'capacity': self._capacity,
+                'bytes': self.bytes,
+                'maxBytes': self._maxBytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hitRate': float(self.hits) / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+            }
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
+class FontCache(LRUCache):
+    """
+    Parsed FigletFont objects shared by every Figlet instance, keyed by
+    font name, smushMode override and whether glyphs are decoded lazily
+    """
+
+    @staticmethod
+    def cacheKey(font=DEFAULT_FONT, **kwargs):
+        return (font, kwargs.get('smushMode'), bool(kwargs.get('lazy')))
+
+    def reserve(self, n):
+        """
+        Raise the capacity, if it is too small, so that n more fonts fit
+        next to those cached without evicting any
+        """
+        with self._lock:
+            wanted = len(self._data) + n
+            if self._capacity < wanted:
+                self._capacity = wanted
+
+    def getFont(self, font=DEFAULT_FONT, **kwargs):
+        Font = self.get(self.cacheKey(font, **kwargs))
+        if Font is None:
+            Font = self.loadFont(font, **kwargs)
+        return Font
+
+    def loadFont(self, font=DEFAULT_FONT, **kwargs):
+        """
+        Parse font and cache it, without looking it up first
+        """
+        # Parse outside the lock; a racing thread at worst parses twice
+        Font = FigletFont(font=font, **kwargs)
+        self.put(self.cacheKey(font, **kwargs), Font)
+        return Font
+
+
+class RenderCache(LRUCache):
+    """
+    Rendered FigletStrings keyed by the full render configuration and the
+    text: font, smushMode, direction, justify, width, paragraph and text.
+    Bounded both by entry count and by the memory the cached strings take
+    up.
+    """
+
+    def __init__(self, capacity=1024, maxBytes=8 * 1024 * 1024):
+        LRUCache.__init__(self, capacity, maxBytes)
+
+    def sizeOf(self, key, value):
+        return sys.getsizeof(value) + sys.getsizeof(key[-1])
+
+    def invalidate(self, font, smushMode):
+        """
+        Drop every render made with font at smushMode
+        """
+        self.discard(lambda key: key[0] == font and key[1] == smushMode)
+
+
 ### Utility functions ###
 
 def figlet_format(text, font=DEFAULT_FONT, **kwargs):
@@ -87,10 +312,33 @@ def figlet_format(text, font=DEFAULT_FONT, **kwargs):
     return fig.renderText(text)
 
 
+def figlet_format_batch(texts, font=DEFAULT_FONT, jobs=1, **kwargs):
+    fig = Figlet(font, **kwargs)
+    return fig.renderBatch(texts, jobs=jobs)
+
+
 def print_figlet(text, font=DEFAULT_FONT, **kwargs):
     print(figlet_format(text, font, **kwargs))
 
 
+def preload(fonts='all', parallel=True, progress=None, wait=True,
+            **fontkwargs):
+    """
+    Load fonts into FONT_CACHE ahead of time, so the first render in each
+    doesn't have to. fonts is a list of font names or 'all'. parallel is
+    the number of loader threads, True for a few. progress, if given, is
+    called from the loader threads as progress(done, total, font, error)
+    after each font, one call at a time and with done counting up by one
+    each call. A font that fails to load is recorded and skipped.
+    FONT_CACHE's capacity is raised to hold every font if it is too small.
+
+    Returns a pyfiglet.warmup.Preload with the loaded fonts and the
+    failures, once it is finished unless wait is False.
+    """
+    from .warmup import preload
+    return preload(fonts, parallel, progress, wait, **fontkwargs)
+
+
 ### Error classes ###
 
 class FigletError(Exception):
@@ -113,23 +361,164 @@ class FontError(FigletError):
     """
 
 
+def readChar(data, pos, height):
+    """
+    Read the character whose rows start at line pos of data, stripping the
+    end marks. Returns its width and rows.
+    """
+    letter = data[pos:pos + height]
+
+    # The end mark is the last non-blank character of the first row
+    end = letter[0].rstrip()
+    end = end[-1] if end else letter[0][0]
+    endEnd = end * 2
+
+    width = 0
+    for j, line in enumerate(letter):
+        if line.endswith(endEnd):
+            line = letter[j] = line[:-2]
+        elif line.endswith(end):
+            line = letter[j] = line[:-1]
+        if len(line) > width:
+            width = len(line)
+    return width, tuple(letter)
+
+
+def rowEdges(row):
+    """
+    Length, index of the first and index of the last non-blank character
+    of a character row; first is the length and last -1 for a blank row
+    """
+    stripped = row.lstrip()
+    if not stripped:
+        return len(row), len(row), -1
+    return len(row), len(row) - len(stripped), len(row.rstrip()) - 1
+
+
+class LazyGlyphs(object):
+    """
+    Decodes each glyph of a font the first time it is looked up and
+    memoizes it. Subclasses, TextGlyphs and bundle.ArchiveGlyphs, provide:
+
+    codes() -- every code point the font may hold a glyph for
+    decode(code) -- (width, rows) of the glyph for code, None if it is
+    blank, or KeyError if the font has no such glyph
+    """
+
+    def __init__(self):
+        self.decoded = {}
+
+    def glyph(self, code):
+        try:
+            return self.decoded[code]
+        except KeyError:
+            pass
+        glyph = self.decoded[code] = self.decode(code)
+        return glyph
+
+
+class TextGlyphs(LazyGlyphs):
+    """
+    Glyphs indexed by the start and end offsets of their rows in the text
+    of the font file, which are sliced out of it when decoded. The index
+    is kept in arrays sorted by code point, so it costs a few bytes per
+    glyph.
+    """
+
+    def __init__(self, data, height, index):
+        LazyGlyphs.__init__(self)
+        self.data = data
+        self.height = height
+        spans = {}
+        # Earlier definitions of a code, used if the last one is blank
+        self.shadowed = {}
+        for i, start, end in index:
+            if i in spans:
+                self.shadowed.setdefault(i, []).append(spans[i])
+            spans[i] = (start, end)
+        self.index = array(str('l'), sorted(spans))
+        self.starts = array(str('L'), [spans[i][0] for i in self.index])
+        self.ends = array(str('L'), [spans[i][1] for i in self.index])
+
+    def codes(self):
+        return self.index
+
+    def decode(self, code):
+        n = bisect_left(self.index, code)
+        if n == len(self.index) or self.index[n] != code:
+            raise KeyError(code)
+        span = (self.starts[n], self.ends[n])
+        for start, end in [span] + self.shadowed.get(code, [])[::-1]:
+            try:
+                width, letter = readChar(
+                    self.data[start:end].splitlines(), 0, self.height)
+            except IndexError:
+                raise FontError('problem parsing character %d' % code)
+            if width:
+                return width, letter
+
+
+class GlyphView(Mapping):
+    """
+    Read-only code point -> rows (field 1) or width (field 0) table over
+    LazyGlyphs, used as FigletFont.chars and FigletFont.width
+    """
+
+    def __init__(self, glyphs, field):
+        self.glyphs = glyphs
+        self.field = field
+
+    def __getitem__(self, code):
+        try:
+            glyph = self.glyphs.glyph(code)
+        except TypeError:
+            raise KeyError(code)
+        if glyph is None:
+            raise KeyError(code)
+        return glyph[self.field]
+
+    def __contains__(self, code):
+        try:
+            return self.glyphs.glyph(code) is not None
+        except (KeyError, TypeError):
+            return False
+
+    def __iter__(self):
+        return (code for code in self.glyphs.codes() if code in self)
+
+    def __len__(self):
+        return sum(1 for code in self)
+
+
 class FigletFont(object):
     """
     This class represents the currently loaded font, including
     meta-data about how it should be displayed by default
     """
 
-    reMagicNumber = re.compile(r'^[tf]lf2.')
-    reEndMarker = re.compile(r'(.)\s*$')
+    reMagicNumber = LazyRegex(r'^[tf]lf2.')
+    # Code tags may be decimal, octal (leading 0) or hex (leading 0x)
+    reCodeTag = LazyRegex(
+        r'\s*(-?)(0[xX][0-9a-fA-F]+|0[0-7]*|[1-9][0-9]*)(?:\s|$)')
 
-    def __init__(self, font=DEFAULT_FONT, **kwargs):
+    # Characters stored after ASCII without code tags: A, O, U umlauts,
+    # lower case a, o, u umlauts and sharp s
+    deutsch = (196, 214, 220, 228, 246, 252, 223)
+
+    def __init__(self, font=DEFAULT_FONT, data=None, lazy=False, **kwargs):
         self.font = font
+        self.lazy = lazy
 
         self.comment = ''
         self.chars = {}
         self.width = {}
-        self.data = self.preloadFont(font)
-        self.loadFont()
+        self.edges = {}
+        self.data = data
+        if data is not None:
+            self.loadFont()
+        elif not self.loadArchivedFont():
+            self.data = self.preloadFont(font)
+            self.loadFont()
         if 'smushMode' in kwargs:
             # Override the smushMode inferred by loadFont():
             self.smushMode = kwargs['smushMode']
@@ -155,6 +544,13 @@ class FigletFont(object):
         else:
             raise FontNotFound(font)
 
+    def loadArchivedFont(self):
+        """
+        Load the font from the precompiled font archive if it was built
+        """
+        from . import bundle
+        return bundle.loadArchivedFont(self)
+
     @classmethod
     def isValidFont(cls, font):
         if not font.endswith(('.flf', '.tlf')):
@@ -165,17 +561,26 @@ class FigletFont(object):
 
     @classmethod
     def getFonts(cls):
-        return [font.rsplit('.', 2)[0] for font
-                #in pkg_resources.resource_listdir('pyfiglet', 'fonts')
-                in resource_listdir('pyfiglet', 'fonts')
-                if cls.isValidFont(font)]
+        from . import manifest
+        return manifest.getManifest().getFonts()
 
     @classmethod
     def infoFont(cls, font, short=False):
         """
         Get informations of font
         """
+        if short:
+            return cls.getMetadata(font)['comment']
         data = FigletFont.preloadFont(font)
+        return '\n'.join(cls.infoLines(data.splitlines()[0:100]))
+
+    @classmethod
+    def infoLines(cls, lines):
+        """
+        Lines of a font file that describe it, skipping the header,
+        BDF-style properties and character rows
+        """
+        import re
         infos = []
         reStartMarker = re.compile(r"""
             ^(FONT|COMMENT|FONTNAME_REGISTRY|FAMILY_NAME|FOUNDRY|WEIGHT_NAME|
@@ -184,12 +589,70 @@ class FigletFont(object):
               FONT_DESCENT|FONT_ASCENT|CAP_HEIGHT|X_HEIGHT|FACE_NAME|FULL_NAME|
               COPYRIGHT|_DEC_|DEFAULT_CHAR|NOTICE|RELATIVE_).*""", re.VERBOSE)
         reEndMarker = re.compile(r'^.*[@#$]$')
-        for line in data.splitlines()[0:100]:
+        for line in lines:
             if (cls.reMagicNumber.search(line) is None
                     and reStartMarker.search(line) is None
                     and reEndMarker.search(line) is None):
                 infos.append(line)
-        return '\n'.join(infos) if not short else infos[0]
+        return infos
+
+    @classmethod
+    def getMetadata(cls, font):
+        """
+        Manifest entry of an installed font: name, format, height,
+        direction, layout and comment summary
+        """
+        from . import manifest
+        return manifest.getManifest().getFont(font)
+
+    @classmethod
+    def findFonts(cls, **query):
+        """
+        Names of installed fonts whose manifest entries match every given
+        field, e.g. findFonts(height=6, format='flf')
+        """
+        from . import manifest
+        return manifest.getManifest().findFonts(**query)
+
+    @classmethod
+    def parseHeader(cls, header, font=None):
+        """
+        Parse the first line of a font file into hardBlank, height,
+        baseLine, maxLength, oldLayout, commentLines, printDirection and
+        the full layout
+        """
+        if cls.reMagicNumber.search(header) is None:
+            raise FontError('%s is not a valid figlet font' % font)
+
+        header = cls.reMagicNumber.sub('', header)
+        header = header.split()
+
+        if len(header) < 6:
+            raise FontError('malformed header for %s' % font)
+
+        hardBlank = header[0]
+        height, baseLine, maxLength, oldLayout, commentLines = map(
+            int, header[1:6])
+        printDirection = fullLayout = None
+
+        # these are all optional for backwards compat
+        if len(header) > 6:
+            printDirection = int(header[6])
+        if len(header) > 7:
+            fullLayout = int(header[7])
+
+        # if the new layout style isn't available,
+        # convert old layout style. backwards compatability
+        if fullLayout is None:
+            if oldLayout == 0:
+                fullLayout = 64
+            elif oldLayout < 0:
+                fullLayout = 0
+            else:
+                fullLayout = (oldLayout & 31) | 128
+
+        return (hardBlank, height, baseLine, maxLength, oldLayout,
+                commentLines, printDirection, fullLayout)
 
     def loadFont(self):
         """
@@ -199,93 +662,98 @@ class FigletFont(object):
             # Parse first line of file, the header
             data = self.data.splitlines()
 
-            header = data.pop(0)
-            if self.reMagicNumber.search(header) is None:
-                raise FontError('%s is not a valid figlet font' % self.font)
-
-            header = self.reMagicNumber.sub('', header)
-            header = header.split()
-
-            if len(header) < 6:
-                raise FontError('malformed header for %s' % self.font)
-
-            hardBlank = header[0]
-            height, baseLine, maxLength, oldLayout, commentLines = map(
-                int, header[1:6])
-            printDirection = fullLayout = None
-
-            # these are all optional for backwards compat
-            if len(header) > 6:
-                printDirection = int(header[6])
-            if len(header) > 7:
-                fullLayout = int(header[7])
-
-            # if the new layout style isn't available,
-            # convert old layout style. backwards compatability
-            if fullLayout is None:
-                if oldLayout == 0:
-                    fullLayout = 64
-                elif oldLayout < 0:
-                    fullLayout = 0
-                else:
-                    fullLayout = (oldLayout & 31) | 128
+            (hardBlank, height, baseLine, maxLength, oldLayout, commentLines,
+             printDirection, fullLayout) = self.parseHeader(data[0], self.font)
 
             # Some header information is stored for later, the rendering
             # engine needs to know this stuff.
             self.height = height
+            self.baseLine = baseLine
+            self.maxLength = maxLength
+            self.oldLayout = oldLayout
+            self.commentLines = commentLines
             self.hardBlank = hardBlank
             self.printDirection = printDirection
             self.smushMode = fullLayout
 
             # Strip out comment lines
-            for i in range(0, commentLines):
-                self.comment += data.pop(0)
-
-            def __char(data):
-                """
-                Function loads one character in the internal array from font
-                file content
-                """
-                end = None
-                width = 0
-                chars = []
-                for j in range(0, height):
-                    line = data.pop(0)
-                    if end is None:
-                        end = self.reEndMarker.search(line).group(1)
-                        end = re.compile(re.escape(end) + r'{1,2}$')
-
-                    line = end.sub('', line)
-
-                    if len(line) > width:
-                        width = len(line)
-                    chars.append(line)
-                return width, chars
-
-            # Load ASCII standard character set (32 - 127)
+            pos = 1 + commentLines
+            if pos > len(data):
+                raise FontError('missing comment lines')
+            self.comment = ''.join(data[1:pos])
+
+            # Index where each character starts: ASCII (32 - 126) and the
+            # required Deutsch characters in order, then code-tagged ones
+            index = []
             for i in range(32, 127):
-                width, letter = __char(data)
-                if ''.join(letter) != '':
+                if pos + height > len(data):
+                    raise FontError('truncated character %d' % i)
+                index.append((i, pos))
+                pos += height
+
+            for i in self.deutsch:
+                if pos + height > len(data):
+                    break
+                index.append((i, pos))
+                pos += height
+
+            while pos < len(data):
+                match = self.reCodeTag.match(data[pos])
+                pos += 1
+                if match is None:
+                    continue
+                sign, tag = match.groups()
+                if tag[:2] in ('0x', '0X'):
+                    i = int(tag, 16)
+                elif tag[0] == '0':
+                    i = int(tag, 8)
+                else:
+                    i = int(tag)
+                if sign:
+                    i = -i
+                if pos + height > len(data):
+                    raise FontError('truncated character %d' % i)
+                index.append((i, pos))
+                pos += height
+
+            if self.lazy:
+                # Offsets of the lines in the font's text, so that only
+                # it and the glyph offsets are kept rather than its lines
+                starts = [0]
+                for line in self.data.splitlines(True):
+                    starts.append(starts[-1] + len(line))
+                glyphs = TextGlyphs(self.data, height, [
+                    (i, starts[pos], starts[pos + height])
+                    for i, pos in index])
+                self.chars = GlyphView(glyphs, 1)
+                self.width = GlyphView(glyphs, 0)
+                return
+
+            for i, pos in index:
+                width, letter = readChar(data, pos, height)
+                if width:
                     self.chars[i] = letter
                     self.width[i] = width
 
-            # Load ASCII extended character set
-            while data:
-                line = data.pop(0).strip()
-                i = line.split(' ', 1)[0]
-                if (i == ''):
-                    continue
-                hex_match = re.search('^0x', i, re.IGNORECASE)
-                if hex_match is not None:
-                    i = int(i, 16)
-                    width, letter = __char(data)
-                    if ''.join(letter) != '':
-                        self.chars[i] = letter
-                        self.width[i] = width
-
         except Exception as e:
             raise FontError('problem parsing %s font: %s' % (self.font, e))
 
+        # Glyph tables are read-only so cached fonts can be shared
+        self.chars = _frozendict(self.chars)
+        self.width = _frozendict(self.width)
+
+    def getEdges(self, c):
+        """
+        Edge profile of the glyph for c, as rowEdges of each of its rows.
+        Glyphs never change, so it is worked out once and kept.
+        """
+        try:
+            return self.edges[c]
+        except KeyError:
+            pass
+        edges = self.edges[c] = tuple(rowEdges(row) for row in self.chars[c])
+        return edges
+
     def __str__(self):
         return '<FigletFont object: %s>' % self.font
 
@@ -354,80 +822,76 @@ class FigletString(unicode_string):
         return FigletString('\n'.join(list) + '\n')
 
 
-class FigletRenderingEngine(object):
+class SmushTable(dict):
     """
-    This class handles the rendering of a FigletFont,
-    including smushing/kerning/justification/direction
+    Maps a (left, right) pair of touching non-blank characters to the
+    character they smush into, or None if they can't be smushed, for one
+    hard blank, smush mode and print direction. Pairs of the characters
+    the smushing rules single out are computed up front, any other pair
+    the first time it is looked up.
     """
 
-    def __init__(self, base=None):
-        self.base = base
+    special = '|/\\[]{}()<>_XY'
 
-        # constants.. lifted from figlet222
-        self.SM_EQUAL = 1    # smush equal chars (not hardblanks)
-        self.SM_LOWLINE = 2    # smush _ with any char in hierarchy
-        self.SM_HIERARCHY = 4    # hierarchy: |, /\, [], {}, (), <>
-        self.SM_PAIR = 8    # hierarchy: [ + ] -> |, { + } -> |, ( + ) -> |
-        self.SM_BIGX = 16    # / + \ -> X, > + < -> X
-        self.SM_HARDBLANK = 32    # hardblank + hardblank -> hardblank
-        self.SM_KERN = 64
-        self.SM_SMUSH = 128
+    def __init__(self, hardBlank, smushMode, rtl):
+        dict.__init__(self)
+        self.hardBlank = hardBlank
+        self.smushMode = smushMode
+        self.rtl = rtl
+        alphabet = self.special + hardBlank
+        for left in alphabet:
+            for right in alphabet:
+                self[left, right] = self.smush(left, right)
 
-    def smushChars(self, left='', right=''):
+    def __missing__(self, pair):
+        smushed = self[pair] = self.smush(*pair)
+        return smushed
+
+    def smush(self, left, right):
         """
-        Given 2 characters which represent the edges rendered figlet
-        fonts where they would touch, see if they can be smushed together.
-        Returns None if this cannot or should not be done.
+        Apply the smushing rules of the smush mode to a pair
         """
-        if left.isspace() is True:
-            return right
-        if right.isspace() is True:
-            return left
-
-        # Disallows overlapping if previous or current char has a width of 1 or
-        # zero
-        if (self.prevCharWidth < 2) or (self.curCharWidth < 2):
-            return
+        smushMode = self.smushMode
+        hardBlank = self.hardBlank
+        Engine = FigletRenderingEngine
 
         # kerning only
-        if (self.base.Font.smushMode & self.SM_SMUSH) == 0:
+        if (smushMode & Engine.SM_SMUSH) == 0:
             return
 
         # smushing by universal overlapping
-        if (self.base.Font.smushMode & 63) == 0:
+        if (smushMode & 63) == 0:
             # Ensure preference to visiable characters.
-            if left == self.base.Font.hardBlank:
+            if left == hardBlank:
                 return right
-            if right == self.base.Font.hardBlank:
+            if right == hardBlank:
                 return left
 
             # Ensures that the dominant (foreground)
             # fig-character for overlapping is the latter in the
             # user's text, not necessarily the rightmost character.
-            if self.base.direction == 'right-to-left':
+            if self.rtl:
                 return left
             else:
                 return right
 
-        if self.base.Font.smushMode & self.SM_HARDBLANK:
-            if (left == self.base.Font.hardBlank
-                    and right == self.base.Font.hardBlank):
+        if smushMode & Engine.SM_HARDBLANK:
+            if left == hardBlank and right == hardBlank:
                 return left
 
-        if (left == self.base.Font.hardBlank
-                or right == self.base.Font.hardBlank):
+        if left == hardBlank or right == hardBlank:
             return
 
-        if self.base.Font.smushMode & self.SM_EQUAL:
+        if smushMode & Engine.SM_EQUAL:
             if left == right:
                 return left
 
         smushes = ()
 
-        if self.base.Font.smushMode & self.SM_LOWLINE:
+        if smushMode & Engine.SM_LOWLINE:
             smushes += (('_', r'|/\[]{}()<>'),)
 
-        if self.base.Font.smushMode & self.SM_HIERARCHY:
+        if smushMode & Engine.SM_HIERARCHY:
             smushes += (
                 ('|', r'|/\[]{}()<>'),
                 (r'\/', '[]{}()<>'),
@@ -442,12 +906,12 @@ class FigletRenderingEngine(object):
             if right in a and left in b:
                 return left
 
-        if self.base.Font.smushMode & self.SM_PAIR:
+        if smushMode & Engine.SM_PAIR:
             for pair in [left+right, right+left]:
                 if pair in ['[]', '{}', '()']:
                     return '|'
 
-        if self.base.Font.smushMode & self.SM_BIGX:
+        if smushMode & Engine.SM_BIGX:
             if (left == '/') and (right == '\\'):
                 return '|'
             if (right == '/') and (left == '\\'):
@@ -456,7 +920,66 @@ class FigletRenderingEngine(object):
                 return 'X'
         return
 
-    def smushAmount(self, left=None, right=None, buffer=[], curChar=[]):
+
+class FigletRenderingEngine(object):
+    """
+    This class handles the rendering of a FigletFont,
+    including smushing/kerning/justification/direction
+    """
+
+    # constants.. lifted from figlet222
+    SM_EQUAL = 1    # smush equal chars (not hardblanks)
+    SM_LOWLINE = 2    # smush _ with any char in hierarchy
+    SM_HIERARCHY = 4    # hierarchy: |, /\, [], {}, (), <>
+    SM_PAIR = 8    # hierarchy: [ + ] -> |, { + } -> |, ( + ) -> |
+    SM_BIGX = 16    # / + \ -> X, > + < -> X
+    SM_HARDBLANK = 32    # hardblank + hardblank -> hardblank
+    SM_KERN = 64
+    SM_SMUSH = 128
+
+    # Smush tables shared by every engine, keyed by hard blank, smush mode
+    # and whether rendering right-to-left
+    smushTables = {}
+
+    def __init__(self, base=None):
+        self.base = base
+        self.smushTable = None
+
+    def updateSmushTable(self):
+        """
+        Look up the smush table for the current font and direction
+        """
+        key = (self.base.Font.hardBlank, self.base.Font.smushMode,
+               self.base.direction == 'right-to-left')
+        table = self.smushTables.get(key)
+        if table is None:
+            table = self.smushTables[key] = SmushTable(*key)
+        self.smushTable = table
+        return table
+
+    def smushChars(self, left='', right=''):
+        """
+        Given 2 characters which represent the edges rendered figlet
+        fonts where they would touch, see if they can be smushed together.
+        Returns None if this cannot or should not be done.
+        """
+        if left.isspace() is True:
+            return right
+        if right.isspace() is True:
+            return left
+
+        # Disallows overlapping if previous or current char has a width of 1 or
+        # zero
+        if (self.prevCharWidth < 2) or (self.curCharWidth < 2):
+            return
+
+        table = self.smushTable
+        if table is None:
+            table = self.updateSmushTable()
+        return table[left, right]
+
+    def smushAmount(self, left=None, right=None, buffer=[], curChar=[],
+                    edges=None, lasts=None):
         """
         Calculate the amount of smushing we can do between this char and the
         last If this is the first char it will throw a series of exceptions
@@ -464,35 +987,65 @@ class FigletRenderingEngine(object):
 
         This differs from C figlet which will just get bogus values from
         memory and then discard them after.
+
+        buffer holds the rows rendered so far as lists of characters, each
+        reversed when rendering right-to-left (see render). edges is the
+        edge profile of curChar (see FigletFont.getEdges) and lasts the
+        index of the last non-blank character of each buffer row; both are
+        worked out from scratch if not given.
         """
         if (self.base.Font.smushMode & (self.SM_SMUSH | self.SM_KERN)) == 0:
             return 0
 
+        if edges is None:
+            edges = [rowEdges(row) for row in curChar]
+        if lasts is None:
+            lasts = [rowEdges(''.join(line))[2] for line in buffer]
+
+        rtl = self.base.direction == 'right-to-left'
         maxSmush = self.curCharWidth
         for row in range(0, self.base.Font.height):
-            lineLeft = buffer[row]
-            lineRight = curChar[row]
-            if self.base.direction == 'right-to-left':
-                lineLeft, lineRight = lineRight, lineLeft
-
-            linebd = len(lineLeft.rstrip()) - 1
-            if linebd < 0:
-                linebd = 0
+            line = buffer[row]
+            last = lasts[row]
+            length, first, lastChar = edges[row]
+
+            if rtl:
+                # The new character is on the left, the buffer row is
+                # stored reversed so its last is the left edge
+                linebd = lastChar
+                if linebd < 0:
+                    linebd = 0
+                if linebd < length:
+                    ch1 = curChar[row][linebd]
+                else:
+                    linebd = 0
+                    ch1 = ''
+                leftLength = length
 
-            if linebd < len(lineLeft):
-                ch1 = lineLeft[linebd]
+                if last >= 0:
+                    charbd = len(line) - 1 - last
+                    ch2 = line[last]
+                else:
+                    charbd = len(line)
+                    ch2 = ''
             else:
-                linebd = 0
-                ch1 = ''
+                linebd = last
+                if linebd < 0:
+                    linebd = 0
+                if linebd < len(line):
+                    ch1 = line[linebd]
+                else:
+                    linebd = 0
+                    ch1 = ''
+                leftLength = len(line)
 
-            charbd = len(lineRight) - len(lineRight.lstrip())
-            if charbd < len(lineRight):
-                ch2 = lineRight[charbd]
-            else:
-                charbd = len(lineRight)
-                ch2 = ''
+                charbd = first
+                if charbd < length:
+                    ch2 = curChar[row][charbd]
+                else:
+                    ch2 = ''
 
-            amt = charbd + len(lineLeft) - 1 - linebd
+            amt = charbd + leftLength - 1 - linebd
 
             if ch1 == '' or ch1 == ' ':
                 amt += 1
@@ -509,65 +1062,430 @@ class FigletRenderingEngine(object):
         """
         Render an ASCII text string in figlet
         """
-        self.curCharWidth = self.prevCharWidth = 0
-        buffer = ['' for i in range(self.base.Font.height)]
-
-        for c in map(ord, list(text)):
-            if c not in self.base.Font.chars:
-                continue
-            curChar = self.base.Font.chars[c]
-            self.curCharWidth = self.base.Font.width[c]
-            maxSmush = self.smushAmount(buffer=buffer, curChar=curChar)
+        rows = list(self.iterRender(text))
+        return FigletString('\n'.join(rows) + '\n')
 
-            # Add a character to the buffer and do smushing/kerning
-            for row in range(0, self.base.Font.height):
-                addLeft = buffer[row]
-                addRight = curChar[row]
+    def reset(self):
+        """
+        Start rendering a new string with the current font and direction
+        """
+        self.curCharWidth = self.prevCharWidth = 0
+        self.Font = self.base.Font
+        self.rtl = self.base.direction == 'right-to-left'
+        self.updateSmushTable()
+
+        # Rows are grown in place as lists of characters and joined once
+        # at the end. Right-to-left rows are stored reversed so that a new
+        # character is always appended rather than prepended. lasts tracks
+        # the index of the last non-blank character of each stored row.
+        self.buffer = [[] for i in range(self.Font.height)]
+        self.lasts = [-1] * self.Font.height
+
+    def addChar(self, c, undo=False, limit=None):
+        """
+        Add the character with code point c to the buffer, smushing or
+        kerning it against what is there. With undo, returns a record that
+        undoChar takes to remove it again. With limit, a character that
+        would make the rows wider than limit is not added and None is
+        returned.
+        """
+        Font = self.Font
+        buffer = self.buffer
+        lasts = self.lasts
+        rtl = self.rtl
+
+        if c not in Font.chars:
+            return () if undo else None
+        curChar = Font.chars[c]
+        edges = Font.getEdges(c)
+        self.curCharWidth = Font.width[c]
+        maxSmush = self.smushAmount(buffer=buffer, curChar=curChar,
+                                    edges=edges, lasts=lasts)
+        if (limit is not None
+                and len(buffer[0]) + self.curCharWidth - maxSmush > limit):
+            return None
+
+        if undo:
+            record = (self.prevCharWidth, list(lasts),
+                      [len(line) for line in buffer],
+                      maxSmush and [line[-maxSmush:] for line in buffer])
+
+        # Add a character to the buffer and do smushing/kerning
+        for row in range(0, Font.height):
+            line = buffer[row]
+            addRight = curChar[row]
+            length, first, last = edges[row]
+            if rtl:
+                addRight = addRight[::-1]
+                if last >= 0:
+                    last = length - 1 - first
+
+            # The last maxSmush stored characters overlap the start of
+            # the new character row
+            start = len(line) - maxSmush
+            for i in range(max(-start, 0), maxSmush):
+                if rtl:
+                    smushed = self.smushChars(
+                        left=addRight[i], right=line[start + i])
+                else:
+                    smushed = self.smushChars(
+                        left=line[start + i], right=addRight[i])
+                line[start + i] = smushed
 
-                if self.base.direction == 'right-to-left':
-                    addLeft, addRight = addRight, addLeft
+            line.extend(addRight[maxSmush:])
 
-                for i in range(0, maxSmush):
+            # Smushing never blanks a character, so the row's last
+            # non-blank character is either the old one or the new
+            # character's
+            if last >= 0 and start + last > lasts[row]:
+                lasts[row] = start + last
 
-                    idx = len(addLeft) - maxSmush + i
-                    if idx >= 0 and idx < len(addLeft):
-                        left = addLeft[idx]
-                    else:
-                        left = ''
+        self.prevCharWidth = self.curCharWidth
+        if undo:
+            return record
 
-                    right = addRight[i]
+    def undoChar(self, record):
+        """
+        Remove the character addChar returned record for. Characters have
+        to be undone last first.
+        """
+        if not record:
+            return
+        self.prevCharWidth, lasts, lengths, overlaps = record
+        self.lasts[:] = lasts
+        for line, length in zip(self.buffer, lengths):
+            del line[length:]
+        if overlaps:
+            for line, overlap in zip(self.buffer, overlaps):
+                line[len(line) - len(overlap):] = overlap
+
+    def finish(self):
+        """
+        Justify the buffer and return it as a FigletString, leaving the
+        buffer as it is
+        """
+        return FigletString('\n'.join(self.finishRows()) + '\n')
 
-                    smushed = self.smushChars(left=left, right=right)
+    def lineLength(self):
+        """
+        Width of the line rendered so far
+        """
+        return len(self.buffer[0])
 
-                    l = list(addLeft)
-                    idx = len(l)-maxSmush+i
-                    if idx >= 0 and idx < len(l):
-                        l[idx] = smushed
-                        addLeft = ''.join(l)
+    def joinRows(self):
+        """
+        The rows of the buffer as strings, in reading order
+        """
+        if self.rtl:
+            return [''.join(reversed(line)) for line in self.buffer]
+        return [''.join(line) for line in self.buffer]
 
-                buffer[row] = addLeft + addRight[maxSmush:]
+    def finishRows(self):
+        """
+        Justify the buffer and return its rows with hardblanks replaced
+        """
+        buffer = self.joinRows()
 
-            self.prevCharWidth = self.curCharWidth
+        # FIGlet cuts rows down to the line, which only rows of fonts
+        # with ragged glyphs can run past
+        if self.base.width > 1:
+            buffer = [row[:self.base.width - 1] for row in buffer]
 
         # Justify text. This does not use str.rjust/str.center
         # specifically because the output would not match FIGlet
         if self.base.justify == 'right':
-            for row in range(0, self.base.Font.height):
+            for row in range(0, self.Font.height):
                 buffer[row] = (
                     ' ' * (self.base.width - len(buffer[row]) - 1)
                 ) + buffer[row]
 
         elif self.base.justify == 'center':
-            for row in range(0, self.base.Font.height):
+            for row in range(0, self.Font.height):
                 buffer[row] = (
                     ' ' * int((self.base.width - len(buffer[row])) / 2)
                 ) + buffer[row]
 
-        # return rendered ASCII with hardblanks replaced
-        buffer = '\n'.join(buffer) + '\n'
-        buffer = buffer.replace(self.base.Font.hardBlank, ' ')
+        hardBlank = self.Font.hardBlank
+        return [row.replace(hardBlank, ' ') for row in buffer]
+
+    def iterRender(self, text):
+        """
+        Render text, which is a string or an iterable of string chunks,
+        yielding each output row as soon as the line of FIGcharacters it
+        belongs to is complete.
+
+        Lines are laid out as FIGlet does: a newline ends a line, and text
+        that would run past width - 1 columns is broken after the last
+        word that fits, or between characters for a word that doesn't fit
+        on a line of its own. A character wider than the line is output on
+        a line of its own, cut down to it. In paragraph mode a single
+        newline between two lines of text is taken as a space. A line left
+        empty at the end of the input is not output, unless the input was
+        empty altogether.
+        """
+        self.startLayout()
+        rows = self.rows
+        for c in self.layoutChars(text):
+            self.layoutChar(c)
+            if rows:
+                for row in rows:
+                    yield row
+                del rows[:]
+        for row in self.endLayout():
+            yield row
+
+    def layoutChars(self, text):
+        """
+        The characters of text, a string or an iterable of string chunks,
+        that line layout takes: tabs as spaces, newlines joined in
+        paragraph mode and other control characters dropped
+        """
+        if isinstance(text, (str, unicode_string)):
+            text = (text,)
+        chars = (c for chunk in text for c in chunk)
+        if self.base.paragraph:
+            chars = self.joinParagraphs(chars)
+        for c in chars:
+            if c == '\t':
+                yield ' '
+            elif c == '\n' or not (c < ' ' or c == '\x7f'):
+                yield c
+
+    def startLayout(self):
+        """
+        Start laying out a new text. Completed rows are appended to rows.
+        """
+        self.reset()
+        self.limit = self.base.width - 1
+        self.rows = []
+        # The characters of the current line with their undo records, so
+        # that a line can be broken at its last run of spaces by undoing
+        # the characters after it rather than rendering the line again
+        self.line = []
+        # FIGlet's wordbreakmode: 0 at the start of a line or after leading
+        # spaces, 1 in a word, 2 in spaces after a word, 3 in a word after
+        # such spaces, -1 right after a line was broken
+        self.wordBreak = 0
+        self.printed = False
+
+    def endLayout(self):
+        """
+        The rows of the line left at the end of the text
+        """
+        if self.lineLength() or not self.printed:
+            return self.finishRows()
+        return []
+
+    def layoutChar(self, c, undo=False):
+        """
+        Lay out the character c, appending the rows of any lines it
+        completes to rows. With undo, returns a record that undoLayoutChar
+        takes to lay it out again.
+        """
+        line = self.line
+        record = saved = None
+        if undo:
+            record = [self.wordBreak, self.printed, len(line), None]
+
+        while True:
+            if self.wordBreak == -1:
+                # Drop the spaces at a break
+                if c == ' ':
+                    break
+                elif c == '\n':
+                    self.wordBreak = 0
+                    break
+                self.wordBreak = 0
+
+            if c != '\n':
+                added = self.addChar(ord(c), undo=True, limit=self.limit)
+                if added is not None:
+                    line.append((c, added))
+                    if c != ' ':
+                        self.wordBreak = 3 if self.wordBreak >= 2 else 1
+                    else:
+                        self.wordBreak = 2 if self.wordBreak > 0 else 0
+                    break
+
+            # The line ends here; the whole of it is saved, once, to be
+            # put back on undo
+            if undo and saved is None:
+                saved = record[3] = self.saveLine()
+
+            if c == '\n':
+                self.rows.extend(self.finishLine())
+                self.printed = True
+                self.wordBreak = 0
+                break
+
+            if not self.lineLength():
+                # Too wide for a line of its own, output it anyway
+                self.putChar(ord(c), self.limit)
+                self.rows.extend(self.finishLine())
+                self.printed = True
+                self.wordBreak = -1
+                break
+
+            if c == ' ':
+                if self.wordBreak == 2:
+                    self.rows.extend(self.splitLine())
+                else:
+                    self.rows.extend(self.finishLine())
+                self.printed = True
+                self.wordBreak = -1
+                break
+
+            if self.wordBreak >= 2:
+                self.rows.extend(self.splitLine())
+            else:
+                self.rows.extend(self.finishLine())
+            self.printed = True
+            self.wordBreak = 1 if self.wordBreak == 3 else 0
+            # and try c again on the new line
+
+        return record
+
+    def saveLine(self):
+        """
+        Everything a line break changes, for undoLayoutChar to put back
+        """
+        return (len(self.rows), self.saveBuffer(), self.prevCharWidth,
+                list(self.line))
+
+    def saveBuffer(self):
+        """
+        A copy of the buffer that restoreBuffer puts back
+        """
+        return [list(row) for row in self.buffer], list(self.lasts)
 
-        return FigletString(buffer)
+    def restoreBuffer(self, saved):
+        self.buffer, self.lasts = saved
+
+    def undoLayoutChar(self, record):
+        """
+        Undo the character layoutChar returned record for, as undoChar
+        does for addChar. Characters have to be undone last first.
+        """
+        self.wordBreak, self.printed, length, saved = record
+        if saved is not None:
+            rows, buffer, self.prevCharWidth, line = saved
+            self.restoreBuffer(buffer)
+            del self.rows[rows:]
+            self.line = line
+        elif len(self.line) > length:
+            self.undoChar(self.line.pop()[1])
+
+    def putChar(self, c, limit):
+        """
+        Fill the buffer with the rows of the character with code point c
+        as they are, without smushing, cut down to limit columns from the
+        end they are read from, as FIGlet outputs a character too wide for
+        a line of its own
+        """
+        rows = self.Font.chars[c]
+        if limit > 0:
+            if self.rtl:
+                rows = [row[-limit:] for row in rows]
+            else:
+                rows = [row[:limit] for row in rows]
+        if self.rtl:
+            self.buffer = [list(reversed(row)) for row in rows]
+        else:
+            self.buffer = [list(row) for row in rows]
+
+    def finishLine(self):
+        """
+        Return the rows of the current line and start a new one
+        """
+        rows = self.finishRows()
+        self.reset()
+        self.line = []
+        return rows
+
+    def splitLine(self):
+        """
+        Break the current line at its last run of spaces: return the rows
+        of the words before them and start a new line with the word after
+        them
+        """
+        line = self.line
+        chars = [c for c, record in line]
+        end = len(chars) - 1
+        while end >= 0 and chars[end] != ' ':
+            end -= 1
+        space = end
+        while end >= 0 and chars[end] == ' ':
+            end -= 1
+
+        while len(line) > end + 1:
+            self.undoChar(line.pop()[1])
+        rows = self.finishLine()
+        for c in chars[space + 1:]:
+            self.line.append((c, self.addChar(ord(c), undo=True)))
+        return rows
+
+    @staticmethod
+    def joinParagraphs(chars):
+        """
+        Turn each newline that is followed by text, rather than by more
+        whitespace, into a space
+        """
+        eol = False
+        newline = False
+        for c in chars:
+            if newline:
+                newline = False
+                if c.isspace():
+                    eol = True
+                    yield '\n'
+                else:
+                    eol = False
+                    yield ' '
+            if c == '\n' and not eol:
+                newline = True
+                continue
+            eol = c.isspace() and c not in ' \t'
+            yield c
+        if newline:
+            # FIGlet takes the end of the input for text too
+            yield ' '
+
+    def renderBatch(self, texts):
+        """
+        Render many strings, in order. Each distinct string is rendered
+        once, and the strings are visited in sorted order so that each one
+        starts from the layout of the previous one with only the characters
+        after their common prefix undone, wrapped lines included.
+        """
+        results = {}
+        for text in texts:
+            results[text] = None
+        chars = {}
+        for text in results:
+            chars[text] = ''.join(self.layoutChars(text))
+
+        self.startLayout()
+        records = []
+        previous = ''
+        for text in sorted(results, key=chars.get):
+            current = chars[text]
+            common = 0
+            for a, b in zip(previous, current):
+                if a != b:
+                    break
+                common += 1
+            while len(records) > common:
+                self.undoLayoutChar(records.pop())
+            for c in current[common:]:
+                records.append(self.layoutChar(c, undo=True))
+            previous = current
+            results[text] = FigletString(
+                '\n'.join(self.rows + self.endLayout()) + '\n')
+
+        return [results[text] for text in texts]
+
+FONT_CACHE = FontCache()
+RENDER_CACHE = RenderCache()
 
 
 class Figlet(object):
@@ -576,22 +1494,49 @@ class Figlet(object):
     """
 
     def __init__(self, font=DEFAULT_FONT, direction='auto', justify='auto',
-                 width=80, fontkwargs=None):
+                 width=80, fontkwargs=None, renderCache=None,
+                 paragraph=False, backend='python', observer=None):
         if fontkwargs is None:
             fontkwargs = {}
+        if renderCache is True:
+            renderCache = RENDER_CACHE
         self.font = font    # font name (string)
         self.Font = None    # Actual Font object, set by setFont()
         self._direction = direction
         self._justify = justify
         self.width = width
+        # Join lines of text separated by a single newline
+        self.paragraph = paragraph
+        # Optional RenderCache, True for the shared RENDER_CACHE
+        self.renderCache = renderCache
+        # 'python', or 'numpy' for the glyph-grid engine in pyfiglet.grid
+        self.backend = backend
+        # Optional observer of timings and counters, see pyfiglet.profiler
+        self.observer = observer
         self.setFont(**fontkwargs)
-        self.engine = FigletRenderingEngine(base=self)
+        if backend == 'numpy':
+            from .grid import GridRenderingEngine as Engine
+        elif backend == 'python':
+            Engine = FigletRenderingEngine
+        else:
+            raise FigletError('unknown backend %r' % backend)
+        if observer is not None:
+            from .profiler import profilingEngine
+            Engine = profilingEngine(Engine)
+        self.engine = Engine(base=self)
 
     def setFont(self, **kwargs):
         if 'font' in kwargs:
             self.font = kwargs.pop('font')
+        self.fontkwargs = kwargs
 
-        self.Font = FigletFont(font=self.font, **kwargs)
+        # Renders are keyed by font and smushMode, so the render cache,
+        # which other instances may share, never has to be invalidated
+        if self.observer is None:
+            self.Font = FONT_CACHE.getFont(font=self.font, **kwargs)
+        else:
+            from .profiler import getFont
+            self.Font = getFont(self.observer, self.font, **kwargs)
 
     def getDirection(self):
         if self._direction == 'auto':
@@ -622,7 +1567,126 @@ class Figlet(object):
 
     def renderText(self, text):
         # wrapper method to engine
-        return self.engine.render(text)
+        if self.renderCache is None:
+            return self.engine.render(text)
+
+        key = (self.Font.font, self.Font.smushMode, self.direction,
+               self.justify, self.width, self.paragraph, text)
+        result = self.renderCache.get(key)
+        if self.observer is not None:
+            self.observer.count('renderCache.misses' if result is None
+                                else 'renderCache.hits')
+        if result is None:
+            result = self.engine.render(text)
+            self.renderCache.put(key, result)
+        return result
+
+    def renderTo(self, stream, text, reverse=False, flip=False,
+                 encoding='UTF-8'):
+        """
+        Render text, a string or an iterable of string chunks, straight
+        into stream, writing each line of FIGcharacters as it is completed.
+        Text streams are written str, anything else bytes in encoding.
+        reverse and flip transform the rows on their way out as
+        FigletString.reverse and flip do; flip turns the whole output
+        upside down, so then nothing is written before the last line.
+        """
+        binary = not isinstance(stream, io.TextIOBase)
+        flush = getattr(stream, 'flush', None)
+
+        if self.renderCache is not None and isinstance(
+                text, (str, unicode_string)):
+            rows = self.renderText(text).split('\n')[:-1]
+        else:
+            rows = self.iterRender(text)
+        if flip:
+            rows = reversed(list(rows))
+
+        reverseMap = FigletString.__reverse_map__
+        flipMap = FigletString.__flip_map__
+        height = self.Font.height
+        block = []
+        for row in rows:
+            if reverse:
+                row = row.translate(reverseMap)[::-1]
+            if flip:
+                row = row.translate(flipMap)
+            block.append(row)
+            if len(block) == height:
+                data = '\n'.join(block) + '\n'
+                stream.write(data.encode(encoding) if binary else data)
+                if flush is not None:
+                    flush()
+                block = []
+
+    def iterRender(self, text):
+        """
+        Yield the output rows of text, a string or an iterable of string
+        chunks, as each line of FIGcharacters is completed
+        """
+        return self.engine.iterRender(text)
+
+    def renderBatch(self, texts, jobs=1):
+        """
+        Render each of texts, returning the FigletStrings in the same order.
+        With jobs > 1 the strings are split across that many worker
+        processes, if there are at least PARALLEL_MIN_TEXTS distinct ones;
+        fewer render in-process.
+        """
+        texts = list(texts)
+        if self.renderCache is None:
+            return self._renderMissing(texts, jobs)
+
+        key = (self.Font.font, self.Font.smushMode, self.direction,
+               self.justify, self.width, self.paragraph)
+        results = [self.renderCache.get(key + (text,)) for text in texts]
+        missing = [text for text, result in zip(texts, results)
+                   if result is None]
+        rendered = dict(zip(missing, self._renderMissing(missing, jobs)))
+        for text, result in rendered.items():
+            self.renderCache.put(key + (text,), result)
+        return [rendered[text] if result is None else result
+                for text, result in zip(texts, results)]
+
+    def _renderMissing(self, texts, jobs):
+        if jobs > 1:
+            distinct = sorted(set(texts))
+            if len(distinct) >= max(PARALLEL_MIN_TEXTS, 2 * jobs):
+                rendered = dict(zip(distinct,
+                                    self.renderParallel(distinct, jobs)))
+                return [rendered[text] for text in texts]
+        return self.engine.renderBatch(texts)
+
+    def renderParallel(self, texts, jobs):
+        """
+        Render texts in a pool of jobs processes. Each worker loads the
+        font once when it starts; texts are sent in contiguous chunks, about
+        four per worker so a slow chunk doesn't hold the others up, and the
+        results come back in order.
+        """
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+        except ImportError:
+            # python2 without the futures backport
+            return self.engine.renderBatch(texts)
+
+        chunkSize = max(1, -(-len(texts) // (4 * jobs)))
+        chunks = [texts[i:i + chunkSize]
+                  for i in range(0, len(texts), chunkSize)]
+        options = (self.font, self._direction, self._justify, self.width,
+                   self.fontkwargs, self.paragraph, self.backend)
+
+        kwargs = {}
+        if sys.version_info >= (3, 7):
+            kwargs = {'initializer': _initWorker, 'initargs': options}
+        else:
+            chunks = [(options, chunk) for chunk in chunks]
+
+        with ProcessPoolExecutor(max_workers=jobs, **kwargs) as executor:
+            results = []
+            for rendered in executor.map(_renderChunk, chunks):
+                results.extend(FigletString(r) for r in rendered)
+        return results
 
     def getFonts(self):
         return self.Font.getFonts()
@@ -631,22 +1695,8 @@ class Figlet(object):
         """
         Devuelve una lista de textos con cada "frame" de la animación.
         """
-        full_frame = self.renderText(text)
-        len_texto = len(full_frame.split("\n")[0])
-        res = []
-        p = 0   # principio del slice.
-        f = 0   # fin del slice
-        rows, columns = map(int, os.popen('stty size', 'r').read().split()) # FIXME: Size of console. Only Linux, I think.
-        lineas = full_frame.split("\n")
-        for nframe in range(len_texto-1)*2:
-            frame = "\n" * ((rows - len(lineas)) / 2)
-            for linea in lineas:
-                frame += linea[p:f] + "\n"
-            res.append(frame)
-            f += 1
-            if f > columns:
-                p += 1
-        return res
+        from .cli import renderAnimate
+        return renderAnimate(self, text)
 
     def animate(self, text, fps = 12):
         """
@@ -654,84 +1704,41 @@ class Figlet(object):
         "slice" del texto completo desde el principio hasta el final añadiendo
         y después quitando una columna de cada línea.
         """
-        for frame in self.renderAnimate(text):
-            print(frame)
-            time.sleep(1.0 / fps)
-            os.system("clear")  # FIXME: Solo sistemas UNIX
-        exit(0)
+        from .cli import animate
+        animate(self, text, fps)
+
+
+### Process pool workers ###
 
+_worker = None
+
+
+def _initWorker(font, direction, justify, width, fontkwargs, paragraph,
+                backend):
+    global _worker
+    _worker = Figlet(font=font, direction=direction, justify=justify,
+                     width=width, fontkwargs=fontkwargs, paragraph=paragraph,
+                     backend=backend)
+
+
+def _renderChunk(chunk):
+    if isinstance(chunk, tuple):
+        # No pool initializer before python 3.7, the options come along
+        options, chunk = chunk
+        if _worker is None:
+            _initWorker(*options)
+    return [unicode_string(r) for r in _worker.engine.renderBatch(chunk)]
+
+
+### Command line ###
 
 def main():
-    parser = OptionParser(version=__version__,
-                          usage='%prog [options] [text..]')
-    parser.add_option('-f', '--font', default=DEFAULT_FONT,
-                      help='font to render with (default: %default)',
-                      metavar='FONT')
-    parser.add_option('-D', '--direction', type='choice',
-                      choices=('auto', 'left-to-right', 'right-to-left'),
-                      default='auto', metavar='DIRECTION',
-                      help='set direction text will be formatted in '
-                           '(default: %default)')
-    parser.add_option('-j', '--justify', type='choice',
-                      choices=('auto', 'left', 'center', 'right'),
-                      default='auto', metavar='SIDE',
-                      help='set justification, defaults to print direction')
-    parser.add_option('-w', '--width', type='int', default=80, metavar='COLS',
-                      help='set terminal width for wrapping/justification '
-                           '(default: %default)')
-    parser.add_option('-r', '--reverse', action='store_true', default=False,
-                      help='shows mirror image of output text')
-    parser.add_option('-F', '--flip', action='store_true', default=False,
-                      help='flips rendered output text over')
-    parser.add_option('-l', '--list_fonts', action='store_true', default=False,
-                      help='show installed fonts list')
-    parser.add_option('-i', '--info_font', action='store_true', default=False,
-                      help='show font\'s information, use with -f FONT')
-    parser.add_option('-s', '--smushmode', type='int',
-                      help='Set how much the text is smushed (forced together). Provided as binary options (power of 2 integers, see manual). Default is 128 (a lot of smushing).')
-    parser.add_option('-a', '--animate', action='store_true', default=False,
-                      help='Animate text across the screen cleaning and drawing slices of it. Incompatible with flip and reverse.')
-    opts, args = parser.parse_args()
-
-    if opts.list_fonts:
-        print('\n'.join(sorted(FigletFont.getFonts())))
-        exit(0)
-
-    if opts.info_font:
-        print(FigletFont.infoFont(opts.font))
-        exit(0)
-
-    if len(args) == 0:
-        parser.print_help()
-        return 1
-
-    fontkwargs = {}
-    if opts.smushmode:
-        fontkwargs['smushMode'] = opts.smushmode
-
-    text = ' '.join(args)
-
-    f = Figlet(
-        font=opts.font, direction=opts.direction,
-        justify=opts.justify, width=opts.width, fontkwargs=fontkwargs,
-    )
-
-    r = f.renderText(text)
-    if opts.reverse:
-        r = r.reverse()
-    if opts.flip:
-        r = r.flip()
-
-    if sys.version_info > (3,):
-        # Set stdout to binary mode
-        sys.stdout = sys.stdout.detach()
-
-    if not opts.animate:
-        sys.stdout.write((r + '\n').encode('UTF-8'))
-    else:
-        r = f.animate(text)
-        sys.stdout.write((r + '\n').encode('UTF-8'))
-    return 0
+    """
+    Entry point of the pyfiglet command. The command line lives in
+    pyfiglet.cli, so importing pyfiglet doesn't load the option parser.
+    """
+    from .cli import main
+    return main()
 
 
 if __name__ == '__main__':
@@ -1,6 +1,6 @@
 import sys
 
-from pyfiglet import main
+from pyfiglet.cli import main
 
 """
 
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+asyncio facade for rendering from an event loop
+
+Loading a font reads and parses a font file and rendering is pure CPU
+work, so calling Figlet from a coroutine stalls the event loop for as
+long as either takes. AsyncFiglet loads fonts in the loop's default
+executor and renders texts longer than inlineLimit in an executor as
+well; short texts render inline, where the round trip to a thread would
+cost more than the render itself.
+
+Fonts go into the shared FONT_CACHE, so the Figlet objects used to render
+find them there. Concurrent requests for a font that isn't loaded yet
+wait on the same load instead of each parsing the font again.
+
+    figlet = AsyncFiglet(preload=['standard', 'slant'])
+    await figlet.start()
+    text = await figlet.renderText('hello', font='slant')
+
+Python 3.7 or later.
+"""
+
+import asyncio
+import functools
+
+from . import DEFAULT_FONT, FONT_CACHE, Figlet
+
+# Longest text rendered on the event loop itself, in characters
+INLINE_LIMIT = 64
+
+
+def _render(options, text):
+    """
+    Render text with a fresh Figlet, as Figlet objects are not thread-safe.
+    Module level so process pools can pickle it.
+    """
+    font, smushMode, kwargs = options
+    fontkwargs = {} if smushMode is None else {'smushMode': smushMode}
+    return Figlet(font=font, fontkwargs=fontkwargs, **kwargs).renderText(text)
+
+
+class AsyncFiglet(object):
+    """
+    Renders texts for coroutines without blocking the event loop.
+
+    kwargs are passed on to Figlet (direction, justify, width, paragraph,
+    renderCache, backend). Renders go to executor, the loop's default
+    executor if None; a ProcessPoolExecutor works as long as renderCache
+    is None or True. preload names the fonts start() loads.
+    """
+
+    def __init__(self, font=DEFAULT_FONT, smushMode=None, executor=None,
+                 inlineLimit=INLINE_LIMIT, preload=(), **kwargs):
+        self.font = font
+        self.smushMode = smushMode
+        self.executor = executor
+        self.inlineLimit = inlineLimit
+        self.preload = list(preload)
+        self.kwargs = kwargs
+        # FONT_CACHE key -> Future of the load in progress
+        self._loading = {}
+        # (font, smushMode) -> Figlet for inline renders
+        self._figlets = {}
+
+    async def start(self):
+        """
+        Load every font in preload, and the default font, concurrently.
+        A font that fails to load raises once all loads are done.
+        FONT_CACHE's capacity is raised to hold every font if it is too
+        small, so none is evicted before it is first used.
+        """
+        fonts = [self.font] + [f for f in self.preload if f != self.font]
+        FONT_CACHE.reserve(len(fonts))
+        results = await asyncio.gather(
+            *[self.loadFont(font) for font in fonts], return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def loadFont(self, font=None, smushMode=None):
+        """
+        Load font into FONT_CACHE without blocking the loop, returning the
+        FigletFont. Concurrent calls for the same font share one load, and
+        one FONT_CACHE miss. A load that fails raises in every call waiting
+        on it; the next call tries again.
+        """
+        font = font or self.font
+        if smushMode is None:
+            smushMode = self.smushMode
+        kwargs = {} if smushMode is None else {'smushMode': smushMode}
+        key = FONT_CACHE.cacheKey(font, **kwargs)
+
+        future = self._loading.get(key)
+        if future is None:
+            Font = FONT_CACHE.get(key)
+            if Font is not None:
+                return Font
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(
+                None, functools.partial(FONT_CACHE.loadFont, font, **kwargs))
+            self._loading[key] = future
+            future.add_done_callback(
+                lambda done: self._loading.pop(key, None))
+        # Shielded, so one cancelled request doesn't cancel the others
+        return await asyncio.shield(future)
+
+    async def renderText(self, text, font=None, smushMode=None):
+        """
+        Render text in font, loading the font first if needed
+        """
+        font = font or self.font
+        if smushMode is None:
+            smushMode = self.smushMode
+        await self.loadFont(font, smushMode)
+
+        if len(text) <= self.inlineLimit:
+            return self.getFiglet(font, smushMode).renderText(text)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, _render, (font, smushMode, self.kwargs), text)
+
+    def getFiglet(self, font, smushMode):
+        """
+        Figlet for inline renders. Only used from the event loop thread,
+        so one per font is enough.
+        """
+        key = (font, smushMode)
+        figlet = self._figlets.get(key)
+        if figlet is None:
+            fontkwargs = {} if smushMode is None else {'smushMode': smushMode}
+            # The font was just loaded, so this finds it in FONT_CACHE
+            figlet = self._figlets[key] = Figlet(
+                font=font, fontkwargs=fontkwargs, **self.kwargs)
+        return figlet
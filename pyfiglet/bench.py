@@ -0,0 +1,404 @@
+#!/usr/bin/env python
+
+from __future__ import print_function, unicode_literals
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from optparse import OptionParser
+import pyfiglet
+from pyfiglet import FONT_CACHE, RENDER_CACHE, Figlet, FigletFont, bundle
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+clock = getattr(time, 'perf_counter', time.time)
+
+__version__ = '0.1'
+
+
+def timeit(func, repeat):
+    """
+    Best time of repeat calls to func, by the highest-resolution clock
+    """
+    best = None
+    for i in range(repeat):
+        start = clock()
+        func()
+        elapsed = clock() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def parseFont(font):
+    return FigletFont(font, data=FigletFont.preloadFont(font))
+
+
+def benchLoad(fonts, repeat):
+    """
+    Time reading and parsing every font file, bypassing the font cache
+    and the font archive
+    """
+    return [(timeit(lambda: parseFont(font), repeat), font)
+            for font in fonts]
+
+
+def archivedFonts(fonts):
+    """
+    Those of fonts that load from the font archive, if it was built
+    """
+    archive = bundle.getArchive()
+    if archive is None:
+        return []
+    return [font for font in fonts if font in archive]
+
+
+def benchArchive(fonts, repeat):
+    """
+    Time loading every font found in the font archive, bypassing the font
+    cache
+    """
+    return [(timeit(lambda: FigletFont(font), repeat), font)
+            for font in archivedFonts(fonts)]
+
+
+def benchRender(font, lengths, repeat):
+    """
+    Time rendering ever longer strings on one line, to show how render
+    time grows with input length
+    """
+    sample = 'The quick brown fox jumps over the lazy dog. '
+    results = []
+    for length in lengths:
+        text = (sample * (length // len(sample) + 1))[:length]
+        f = Figlet(font=font, width=length * 100)
+        results.append((length, timeit(lambda: f.renderText(text), repeat)))
+    return results
+
+
+def benchDaemon(calls, args):
+    """
+    Time calls runs of the pyfiglet command rendering in-process, then as
+    clients of a daemon. Returns the sorted per-call times of each.
+    """
+    # The command's entry point, which asks the daemon before importing
+    # pyfiglet
+    command = [sys.executable, '-m', 'pyfiglet_client']
+    address = os.path.join(tempfile.mkdtemp(), 'bench.sock')
+    daemon = subprocess.Popen(command + ['--serve', '--address', address],
+                              stderr=subprocess.PIPE)
+    try:
+        # Wait for it to listen
+        daemon.stderr.readline()
+        results = []
+        for extra in ([], ['--client', '--address', address]):
+            times = []
+            for i in range(calls):
+                start = clock()
+                subprocess.check_call(command + extra + args,
+                                      stdout=subprocess.PIPE)
+                times.append(clock() - start)
+            results.append(sorted(times))
+        return results
+    finally:
+        daemon.terminate()
+        daemon.wait()
+        try:
+            os.unlink(address)
+        except EnvironmentError:
+            pass
+        os.rmdir(os.path.dirname(address))
+
+
+### Suite ###
+
+# Inputs of the suite: a word, a paragraph that wraps, and text outside
+# ASCII, most of which fonts lack and skip
+SUITE_TEXTS = {
+    'short': 'Hello',
+    'long': ('The quick brown fox jumps over the lazy dog. ' * 12).strip(),
+    'unicode': '\xc4rger \xfcber \xdf, \u0394\u03b5\u03bb\u03c4\u03b1 '
+               '\u2192 \u65e5\u672c',
+}
+
+DIRECTIONS = ('left-to-right', 'right-to-left')
+JUSTIFIES = ('auto', 'left', 'center', 'right')
+
+
+def summarize(times, units=None):
+    """
+    Latency statistics of a list of times in seconds, in milliseconds, and
+    throughput in units (one per time by default) per second
+    """
+    times = sorted(times)
+    total = sum(times)
+
+    def percentile(p):
+        return 1000 * times[min(len(times) - 1, int(p * len(times)))]
+
+    if units is None:
+        units = len(times)
+    return {
+        'count': len(times),
+        'total': total,
+        'mean': 1000 * total / len(times),
+        'p50': percentile(0.5),
+        'p90': percentile(0.9),
+        'p99': percentile(0.99),
+        'max': 1000 * times[-1],
+        'throughput': units / total if total else None,
+    }
+
+
+def clearCaches():
+    FONT_CACHE.clear()
+    RENDER_CACHE.clear()
+    gc.collect()
+
+
+def benchSuite(fonts, repeat, progress=None):
+    """
+    Time every font over the suite: parsing and loading from the font
+    archive, cold and warm first render,
+    each of SUITE_TEXTS, every direction and justify, and reverse and
+    flip. Each sample is the best of repeat calls. Returns a dict ready
+    to be written as JSON.
+    """
+    samples = {}
+
+    def sample(name, seconds, units=1):
+        times, total = samples.setdefault(name, ([], [0]))
+        times.append(seconds)
+        total[0] += units
+
+    short = SUITE_TEXTS['short']
+    archived = set(archivedFonts(fonts))
+    capacity = FONT_CACHE.capacity
+    FONT_CACHE.capacity = len(fonts)
+    try:
+        clearCaches()
+        for n, font in enumerate(fonts):
+            if progress is not None:
+                progress(n, font)
+            sample('load.parse', timeit(lambda: parseFont(font), repeat))
+            if font in archived:
+                sample('load.archive',
+                       timeit(lambda: FigletFont(font), repeat))
+
+            # Cold: nothing of the font cached or decoded yet
+            FONT_CACHE.clear()
+            start = clock()
+            f = Figlet(font=font)
+            f.renderText(short)
+            sample('render.cold', clock() - start, len(short))
+            sample('render.warm', timeit(lambda: f.renderText(short), 1),
+                   len(short))
+
+            for name in sorted(SUITE_TEXTS):
+                text = SUITE_TEXTS[name]
+                sample('text.' + name,
+                       timeit(lambda: f.renderText(text), repeat), len(text))
+
+            for direction in DIRECTIONS:
+                for justify in JUSTIFIES:
+                    g = Figlet(font=font, direction=direction,
+                               justify=justify)
+                    sample('mode.%s.%s' % (direction, justify),
+                           timeit(lambda: g.renderText(short), repeat),
+                           len(short))
+
+            rendered = f.renderText(short)
+            sample('transform.reverse', timeit(rendered.reverse, repeat))
+            sample('transform.flip', timeit(rendered.flip, repeat))
+    finally:
+        FONT_CACHE.capacity = capacity
+        clearCaches()
+
+    return {
+        'meta': {
+            'pyfiglet': pyfiglet.__version__,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'fonts': len(fonts),
+            'repeat': repeat,
+        },
+        'results': dict((name, summarize(times, total[0]))
+                        for name, (times, total) in samples.items()),
+        'memory': benchMemory(fonts),
+    }
+
+
+def benchMemory(fonts):
+    """
+    Peak memory of loading every font and rendering each of SUITE_TEXTS,
+    from empty caches: the peak traced by tracemalloc, and the process's
+    peak resident size, in bytes
+    """
+    memory = {'tracedPeak': None, 'maxRSS': None}
+    if tracemalloc is not None:
+        capacity = FONT_CACHE.capacity
+        FONT_CACHE.capacity = len(fonts)
+        clearCaches()
+        tracemalloc.start()
+        try:
+            for font in fonts:
+                f = Figlet(font=font)
+                for text in SUITE_TEXTS.values():
+                    f.renderText(text)
+            memory['tracedPeak'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+            FONT_CACHE.capacity = capacity
+            clearCaches()
+    if resource is not None:
+        maxRSS = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS
+        memory['maxRSS'] = maxRSS if sys.platform == 'darwin' else 1024 * maxRSS
+    return memory
+
+
+def compareSuites(old, new, threshold):
+    """
+    Lines comparing the median latency of each result of two suite runs
+    and their peak memory, and whether any got worse by more than
+    threshold, a fraction
+    """
+    lines = []
+    regressed = False
+    rows = []
+    for name in sorted(set(old['results']) & set(new['results'])):
+        rows.append((name, old['results'][name]['p50'],
+                     new['results'][name]['p50'], 'ms'))
+    for name in sorted(set(old['memory']) & set(new['memory'])):
+        if old['memory'][name] and new['memory'][name]:
+            rows.append(('memory.' + name, old['memory'][name] / 1048576.0,
+                         new['memory'][name] / 1048576.0, 'MB'))
+
+    for name, before, after, unit in rows:
+        change = after / before - 1 if before else 0.0
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressed = True
+        elif change < -threshold:
+            flag = '  improved'
+        lines.append('%-34s %10.3f%s %10.3f%s %+7.1f%%%s' % (
+            name, before, unit, after, unit, 100 * change, flag))
+    return lines, regressed
+
+
+def main():
+    parser = OptionParser(version=__version__,
+                          usage='%prog [options] [font..]')
+
+    parser.add_option('-r', '--repeat', type='int', default=5,
+                      help='number of timed runs per font, the best is '
+                           'reported (default: %default)')
+    parser.add_option('-s', '--slowest', type='int', default=10,
+                      help='number of slowest fonts to list '
+                           '(default: %default)')
+    parser.add_option('-R', '--render', action='store_true', default=False,
+                      help='time rendering strings of growing length '
+                           'instead of loading fonts')
+    parser.add_option('-f', '--font', default='standard',
+                      help='font for --render (default: %default)')
+    parser.add_option('-d', '--daemon', type='int', metavar='CALLS',
+                      help='time CALLS runs of the pyfiglet command with '
+                           'and without a daemon, rendering the arguments')
+    parser.add_option('-S', '--suite', metavar='FILE',
+                      help='run the full suite over the fonts given, or all '
+                           'of them, and write the results to FILE as JSON '
+                           '(- for stdout)')
+    parser.add_option('-c', '--compare', action='store_true', default=False,
+                      help='compare two suite results, OLD.json NEW.json; '
+                           'exits 1 if anything regressed')
+    parser.add_option('-t', '--threshold', type='float', default=10.0,
+                      help='percentage by which a median must grow to count '
+                           'as a regression (default: %default)')
+
+    opts, args = parser.parse_args()
+
+    if opts.compare:
+        if len(args) != 2:
+            parser.error('--compare takes OLD.json NEW.json')
+        suites = []
+        for fn in args:
+            with open(fn) as f:
+                suites.append(json.load(f))
+        lines, regressed = compareSuites(suites[0], suites[1],
+                                         opts.threshold / 100)
+        print('%-34s %12s %12s %8s' % ('', 'old', 'new', 'change'))
+        print('\n'.join(lines))
+        return 1 if regressed else 0
+
+    if opts.suite:
+        fonts = args or sorted(FigletFont.getFonts())
+
+        def progress(n, font):
+            sys.stderr.write('\r%4d/%d %-30s' % (n + 1, len(fonts), font))
+            sys.stderr.flush()
+
+        results = benchSuite(fonts, opts.repeat, progress)
+        sys.stderr.write('\n')
+        data = json.dumps(results, indent=1, sort_keys=True)
+        if opts.suite == '-':
+            print(data)
+        else:
+            with open(opts.suite, 'w') as f:
+                f.write(data + '\n')
+        return 0
+
+    if opts.daemon:
+        args = ['-f', opts.font] + (args or ['Hello, World!'])
+        inProcess, client = benchDaemon(opts.daemon, args)
+        for name, times in (('in-process', inProcess), ('daemon', client)):
+            print('%-10s median %7.2fms  p90 %7.2fms  best %7.2fms' % (
+                name, 1000 * times[len(times) // 2],
+                1000 * times[len(times) * 9 // 10], 1000 * times[0]))
+        return 0
+
+    if opts.render:
+        lengths = [int(arg) for arg in args] or [250, 500, 1000, 2000, 4000]
+        print('Rendering with %s:' % opts.font)
+        for length, elapsed in benchRender(opts.font, lengths, opts.repeat):
+            print('  %6d chars %9.2fms %7.2fus per char' % (
+                length, 1000 * elapsed, 1e6 * elapsed / length))
+        return 0
+
+    fonts = args or sorted(FigletFont.getFonts())
+
+    results = benchLoad(fonts, opts.repeat)
+    total = sum(elapsed for elapsed, font in results)
+    print('Parsed %d fonts in %.3fs (%.2fms per font)' % (
+        len(results), total, 1000 * total / len(results)))
+
+    archived = benchArchive(fonts, opts.repeat)
+    if archived:
+        total = sum(elapsed for elapsed, font in archived)
+        print('Loaded %d fonts from the archive in %.3fs (%.2fms per font)'
+              % (len(archived), total, 1000 * total / len(archived)))
+    else:
+        print('No font archive built')
+
+    print('Slowest to parse:')
+    for elapsed, font in sorted(results, reverse=True)[:opts.slowest]:
+        print('  %8.2fms %s' % (1000 * elapsed, font))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,342 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Precompiled binary archive of the bundled fonts
+
+Every font is parsed once at build time and stored in one file laid out
+for memory mapping, so loading a font only reads its header and glyph
+index; glyph rows are decoded when the rendering engine first asks for
+them.
+
+Layout (little endian, every section aligned to 4 bytes):
+
+    magic 'PYFIGLET', uint32 version, uint32 font count
+    per font: uint32 offset, uint32 length, uint32 source size,
+              uint16 name length, name
+    per font, at its offset:
+        int32 height, baseLine, maxLength, oldLayout, commentLines,
+              printDirection (-1 if absent), smushMode, glyph count
+        uint32 hardBlank length, uint32 comment length
+        hardBlank, comment (UTF-8)
+        int32 codes[count]            sorted
+        int32 widths[count]
+        uint32 offsets[count + 1]     into the rows section
+        rows: each glyph's rows as UTF-8 joined by newlines
+"""
+
+from __future__ import print_function, unicode_literals
+
+import mmap
+import os
+import struct
+import sys
+import threading
+from bisect import bisect_left
+
+from . import FigletFont, GlyphView, LazyGlyphs, get_res_path
+
+MAGIC = b'PYFIGLET'
+VERSION = 1
+ARCHIVE = 'fonts.bin'
+
+_archiveHeader = struct.Struct('<8sII')
+_entryHeader = struct.Struct('<IIIH')
+_fontHeader = struct.Struct('<8i2I')
+
+
+# memoryview.cast (3.3+) reads in native byte order, so the tables are
+# only mapped in place where it exists and that is the archive's;
+# elsewhere they are unpacked
+_NATIVE = (sys.byteorder == 'little' and struct.calcsize('iI') == 8
+           and hasattr(memoryview, 'cast'))
+
+
+def _pad(size):
+    return -size % 4
+
+
+def _table(view, pos, code, count):
+    """
+    count little endian 4-byte integers of struct type code at pos
+    """
+    if _NATIVE:
+        return view[pos:pos + 4 * count].cast(code)
+    return struct.unpack_from('<%d%s' % (count, code), view, pos)
+
+
+class ArchiveGlyphs(LazyGlyphs):
+    """
+    Glyphs of one archived font, found by binary search of its sorted code
+    point index
+    """
+
+    def __init__(self, codes, widths, offsets, view, rows):
+        LazyGlyphs.__init__(self)
+        self.index = codes
+        self.widths = widths
+        self.offsets = offsets
+        self.view = view
+        # Where the rows section starts in view
+        self.rows = rows
+
+    def codes(self):
+        return self.index
+
+    def decode(self, code):
+        i = bisect_left(self.index, code)
+        if i == len(self.index) or self.index[i] != code:
+            raise KeyError(code)
+        start = self.rows + self.offsets[i]
+        end = self.rows + self.offsets[i + 1]
+        letter = bytes(self.view[start:end])
+        return self.widths[i], tuple(letter.decode('UTF-8').split('\n'))
+
+
+class FontArchive(object):
+    """
+    Memory-mapped font archive written by compileArchive, or held in
+    buffer if given
+    """
+
+    def __init__(self, path, buffer=None):
+        self.path = path
+        if buffer is None:
+            with open(path, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buffer = buffer
+        try:
+            self.view = memoryview(self.buffer)
+        except TypeError:
+            # Python 2's mmap only has the old buffer interface, which
+            # slicing and struct.unpack_from use directly
+            self.view = self.buffer
+
+        magic, version, count = _archiveHeader.unpack_from(self.buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('%s is not a version %d font archive' % (
+                path, VERSION))
+
+        self.fonts = {}
+        pos = _archiveHeader.size
+        for i in range(count):
+            offset, length, size, nameLength = _entryHeader.unpack_from(
+                self.buffer, pos)
+            pos += _entryHeader.size
+            name = self.buffer[pos:pos + nameLength].decode('UTF-8')
+            pos += nameLength
+            self.fonts[name] = (offset, length, size)
+
+    def __contains__(self, font):
+        return font in self.fonts
+
+    def entry(self, font):
+        """
+        The packed tables of font, as packFont returned them
+        """
+        offset, length, size = self.fonts[font]
+        return self.buffer[offset:offset + length]
+
+    def isCurrent(self, font, fn):
+        """
+        Cheap staleness check against the font file the entry was built
+        from
+        """
+        try:
+            return os.path.getsize(fn) == self.fonts[font][2]
+        except (KeyError, OSError):
+            return False
+
+    def loadFont(self, Font):
+        """
+        Fill in a FigletFont from its archived tables
+        """
+        offset, length, size = self.fonts[Font.font]
+        (height, baseLine, maxLength, oldLayout, commentLines,
+         printDirection, smushMode, count, hardBlankLength,
+         commentLength) = _fontHeader.unpack_from(self.buffer, offset)
+        pos = offset + _fontHeader.size
+
+        Font.height = height
+        Font.baseLine = baseLine
+        Font.maxLength = maxLength
+        Font.oldLayout = oldLayout
+        Font.commentLines = commentLines
+        Font.printDirection = None if printDirection < 0 else printDirection
+        Font.smushMode = smushMode
+
+        Font.hardBlank = self.buffer[pos:pos + hardBlankLength].decode(
+            'UTF-8')
+        pos += hardBlankLength
+        Font.comment = self.buffer[pos:pos + commentLength].decode('UTF-8')
+        pos += commentLength
+        pos += _pad(pos)
+
+        codes = _table(self.view, pos, 'i', count)
+        pos += 4 * count
+        widths = _table(self.view, pos, 'i', count)
+        pos += 4 * count
+        offsets = _table(self.view, pos, 'I', count + 1)
+        pos += 4 * (count + 1)
+        glyphs = ArchiveGlyphs(codes, widths, offsets, self.view, pos)
+        Font.chars = GlyphView(glyphs, 1)
+        Font.width = GlyphView(glyphs, 0)
+
+
+def packFont(Font):
+    """
+    Serialize a parsed FigletFont into an archive entry
+    """
+    codes = sorted(Font.chars)
+    hardBlank = Font.hardBlank.encode('UTF-8')
+    comment = Font.comment.encode('UTF-8')
+    printDirection = Font.printDirection
+    if printDirection is None:
+        printDirection = -1
+
+    out = [_fontHeader.pack(
+        Font.height, Font.baseLine, Font.maxLength, Font.oldLayout,
+        Font.commentLines, printDirection, Font.smushMode, len(codes),
+        len(hardBlank), len(comment))]
+    out.append(hardBlank)
+    out.append(comment)
+    out.append(b'\0' * _pad(_fontHeader.size + len(hardBlank) + len(comment)))
+
+    rows = [Font.chars[code] for code in codes]
+    rows = ['\n'.join(letter).encode('UTF-8') for letter in rows]
+    offsets = [0]
+    for letter in rows:
+        offsets.append(offsets[-1] + len(letter))
+
+    count = len(codes)
+    out.append(struct.pack('<%di' % count, *codes))
+    out.append(struct.pack('<%di' % count, *[Font.width[c] for c in codes]))
+    out.append(struct.pack('<%dI' % (count + 1), *offsets))
+    out.extend(rows)
+    return b''.join(out)
+
+
+def fontFiles(fontsDir):
+    for fn in sorted(os.listdir(fontsDir)):
+        name, ext = os.path.splitext(fn)
+        if ext in ('.flf', '.tlf'):
+            yield name, os.path.join(fontsDir, fn)
+
+
+def compileArchive(fontsDir, path):
+    """
+    Compile every font in fontsDir into the archive at path. Fonts that
+    fail to parse are left out and load from their text files instead.
+    """
+    entries = []
+    for name, fn in fontFiles(fontsDir):
+        with open(fn, 'rb') as f:
+            data = f.read()
+        try:
+            Font = FigletFont(name, data=data.decode('UTF-8', 'replace'))
+        except Exception as e:
+            print('skipping %s: %s' % (name, e), file=sys.stderr)
+            continue
+        entries.append((name, len(data), packFont(Font)))
+
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(packArchive(entries))
+    os.rename(tmp, path)
+    return len(entries)
+
+
+def packArchive(entries):
+    """
+    An archive of entries, (font name, source file size, packFont
+    output) each
+    """
+    entries = [(name.encode('UTF-8'), size, blob)
+               for name, size, blob in entries]
+    pos = _archiveHeader.size
+    pos += sum(_entryHeader.size + len(name) for name, size, blob in entries)
+    directory = [_archiveHeader.pack(MAGIC, VERSION, len(entries))]
+    blobs = []
+    for name, size, blob in entries:
+        padding = _pad(pos)
+        pos += padding
+        directory.append(_entryHeader.pack(pos, len(blob), size, len(name)))
+        directory.append(name)
+        blobs.append(b'\0' * padding)
+        blobs.append(blob)
+        pos += len(blob)
+    return b''.join(directory) + b''.join(blobs)
+
+
+_archive = None
+_archiveLock = threading.Lock()
+
+# Font stores searched before the archive, see pyfiglet.store
+stores = []
+
+
+def getArchive():
+    """
+    The archive installed next to the bundled fonts, or None when it has
+    not been built
+    """
+    global _archive
+    if _archive is None:
+        with _archiveLock:
+            if _archive is None:
+                try:
+                    _archive = FontArchive(
+                        get_res_path('pyfiglet.fonts', ARCHIVE))
+                except Exception:
+                    # Missing, stale or unreadable: fonts are parsed from
+                    # their files instead
+                    _archive = False
+    return _archive or None
+
+
+def currentArchive(font):
+    """
+    The archive if it holds an up to date copy of font, otherwise None
+    """
+    archive = getArchive()
+    if archive is None or font not in archive:
+        return None
+    for extension in ('tlf', 'flf'):
+        fn = get_res_path('pyfiglet.fonts', '%s.%s' % (font, extension))
+        if os.path.isfile(fn):
+            break
+    if not archive.isCurrent(font, fn):
+        return None
+    return archive
+
+
+def loadArchivedFont(Font):
+    """
+    Load Font from the archive if it holds an up to date copy; returns
+    False if the caller has to parse the font file instead
+    """
+    for store in stores:
+        if Font.font in store:
+            store.loadFont(Font)
+            return True
+    archive = currentArchive(Font.font)
+    if archive is None:
+        return False
+    try:
+        archive.loadFont(Font)
+    except Exception:
+        return False
+    return True
+
+
+def main():
+    fontsDir = get_res_path('pyfiglet.fonts', '')
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        fontsDir, ARCHIVE)
+    count = compileArchive(fontsDir, path)
+    print('compiled %d fonts into %s' % (count, path))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
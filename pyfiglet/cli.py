@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+The pyfiglet command
+
+Kept out of the package module so that importing pyfiglet doesn't load
+optparse and the rest of what only the command line needs.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import os
+import sys
+import time
+from optparse import OptionParser
+
+from . import DEFAULT_FONT, Figlet, FigletFont, __version__
+
+
+def readChunks(stream):
+    """
+    Lazily yield the lines of a text or binary stream as text, with line
+    endings normalized to a newline
+    """
+    stream = getattr(stream, 'buffer', stream)
+    while True:
+        # b'' at the end of a binary stream, '' at the end of a text one
+        line = stream.readline()
+        if not line:
+            break
+        if isinstance(line, bytes):
+            line = line.decode('UTF-8', 'replace')
+        if line.endswith('\r\n'):
+            line = line[:-2] + '\n'
+        yield line
+
+
+def renderStream(f, stream, reverse=False, flip=False, out=None):
+    """
+    Render stream with Figlet f, writing each line of FIGcharacters to out
+    (binary stdout by default) as soon as it is complete
+    """
+    if out is None:
+        out = getattr(sys.stdout, 'buffer', sys.stdout)
+    f.renderTo(out, readChunks(stream), reverse, flip)
+    return 0
+
+
+### Animation ###
+
+def renderAnimate(figlet, text):
+    """
+    Devuelve una lista de textos con cada "frame" de la animación de
+    figlet.
+    """
+    full_frame = figlet.renderText(text)
+    len_texto = len(full_frame.split("\n")[0])
+    res = []
+    p = 0   # principio del slice.
+    f = 0   # fin del slice
+    rows, columns = map(int, os.popen('stty size', 'r').read().split()) # FIXME: Size of console. Only Linux, I think.
+    lineas = full_frame.split("\n")
+    for nframe in range(len_texto-1)*2:
+        frame = "\n" * ((rows - len(lineas)) / 2)
+        for linea in lineas:
+            frame += linea[p:f] + "\n"
+        res.append(frame)
+        f += 1
+        if f > columns:
+            p += 1
+    return res
+
+def animate(figlet, text, fps=12):
+    """
+    Escribe y borra sucesivamente cada "frame" del texto. Un frame es un
+    "slice" del texto completo desde el principio hasta el final añadiendo
+    y después quitando una columna de cada línea.
+    """
+    for frame in renderAnimate(figlet, text):
+        print(frame)
+        time.sleep(1.0 / fps)
+        os.system("clear")  # FIXME: Solo sistemas UNIX
+    exit(0)
+
+
+def reportProfile(profile):
+    if profile is not None:
+        sys.stdout.flush()
+        sys.stderr.write(profile.report() + '\n')
+
+
+def main(daemon=True):
+    """
+    Run the pyfiglet command. daemon=False skips asking the daemon, for
+    when pyfiglet_client already has.
+    """
+    parser = OptionParser(version=__version__,
+                          usage='%prog [options] [text..]')
+    parser.add_option('-f', '--font', default=DEFAULT_FONT,
+                      help='font to render with (default: %default)',
+                      metavar='FONT')
+    parser.add_option('-D', '--direction', type='choice',
+                      choices=('auto', 'left-to-right', 'right-to-left'),
+                      default='auto', metavar='DIRECTION',
+                      help='set direction text will be formatted in '
+                           '(default: %default)')
+    parser.add_option('-j', '--justify', type='choice',
+                      choices=('auto', 'left', 'center', 'right'),
+                      default='auto', metavar='SIDE',
+                      help='set justification, defaults to print direction')
+    parser.add_option('-w', '--width', type='int', default=80, metavar='COLS',
+                      help='set terminal width for wrapping/justification '
+                           '(default: %default)')
+    parser.add_option('-p', '--paragraph', action='store_true',
+                      default=False,
+                      help='treat single newlines between lines of text as '
+                           'spaces, for wrapping paragraphs')
+    parser.add_option('-r', '--reverse', action='store_true', default=False,
+                      help='shows mirror image of output text')
+    parser.add_option('-F', '--flip', action='store_true', default=False,
+                      help='flips rendered output text over')
+    parser.add_option('-l', '--list_fonts', action='store_true', default=False,
+                      help='show installed fonts list')
+    parser.add_option('-i', '--info_font', action='store_true', default=False,
+                      help='show font\'s information, use with -f FONT')
+    parser.add_option('-s', '--smushmode', type='int',
+                      help='Set how much the text is smushed (forced together). Provided as binary options (power of 2 integers, see manual). Default is 128 (a lot of smushing).')
+    parser.add_option('-a', '--animate', action='store_true', default=False,
+                      help='Animate text across the screen cleaning and drawing slices of it. Incompatible with flip and reverse.')
+    parser.add_option('-L', '--file', metavar='FILE',
+                      help='render each line of FILE (- for stdin) instead '
+                           'of the arguments')
+    parser.add_option('-S', '--stdin', action='store_true', default=False,
+                      help='render standard input line by line as it is '
+                           'read')
+    parser.add_option('-J', '--jobs', type='int', default=1, metavar='N',
+                      help='number of processes to render --file with '
+                           '(default: %default)')
+    parser.add_option('--serve', action='store_true', default=False,
+                      help='run a render daemon at --address, keeping fonts '
+                           'loaded between calls')
+    parser.add_option('-C', '--client', action='store_true', default=False,
+                      help='have the daemon at --address render, rendering '
+                           'here if none is running; implied when '
+                           'PYFIGLET_ADDRESS is set')
+    parser.add_option('--address', metavar='ADDRESS',
+                      help='daemon Unix socket path, PORT or HOST:PORT '
+                           '(default: $PYFIGLET_ADDRESS or a per-user '
+                           'socket)')
+    parser.add_option('--profile', action='store_true', default=False,
+                      help='print where the time went, loading fonts and '
+                           'rendering, to standard error')
+    opts, args = parser.parse_args()
+
+    if opts.serve:
+        from .server import serve
+        return serve(opts.address)
+
+    if opts.list_fonts:
+        print('\n'.join(sorted(FigletFont.getFonts())))
+        exit(0)
+
+    if opts.info_font:
+        print(FigletFont.infoFont(opts.font))
+        exit(0)
+
+    if len(args) == 0 and opts.file is None and not opts.stdin:
+        parser.print_help()
+        return 1
+
+    fontkwargs = {}
+    if opts.smushmode:
+        fontkwargs['smushMode'] = opts.smushmode
+
+    text = ' '.join(args)
+
+    profile = None
+    if opts.profile:
+        from .profiler import Profile
+        profile = Profile()
+
+    if (daemon and (opts.client or os.environ.get('PYFIGLET_ADDRESS'))
+            and opts.file is None and not opts.stdin and not opts.animate
+            and profile is None):
+        from . import client
+        try:
+            output = client.request(
+                text, opts.address, font=opts.font,
+                direction=opts.direction, justify=opts.justify,
+                width=opts.width, smushMode=fontkwargs.get('smushMode'),
+                paragraph=opts.paragraph, reverse=opts.reverse,
+                flip=opts.flip)
+        except client.ServerUnavailable:
+            pass
+        else:
+            out = getattr(sys.stdout, 'buffer', sys.stdout)
+            out.write((output + '\n').encode('UTF-8'))
+            return 0
+
+    f = Figlet(
+        font=opts.font, direction=opts.direction,
+        justify=opts.justify, width=opts.width, fontkwargs=fontkwargs,
+        paragraph=opts.paragraph, observer=profile,
+    )
+
+    if opts.stdin:
+        status = renderStream(f, sys.stdin, opts.reverse, opts.flip)
+        reportProfile(profile)
+        return status
+
+    if sys.version_info > (3,):
+        # Set stdout to binary mode
+        sys.stdout = sys.stdout.detach()
+
+    if opts.animate:
+        f.animate(text)
+
+    if opts.file is not None:
+        if opts.file == '-':
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(opts.file, 'rb') as fh:
+                lines = fh.read().decode('UTF-8').splitlines()
+        rendered = f.renderBatch(lines, jobs=opts.jobs)
+        if opts.reverse or opts.flip:
+            from .transform import Transform
+            transform = Transform()
+            if opts.reverse:
+                transform = transform.reverse()
+            if opts.flip:
+                transform = transform.flip()
+            rendered = [transform(r) for r in rendered]
+        sys.stdout.write(('\n'.join(rendered) + '\n').encode('UTF-8'))
+    else:
+        f.renderTo(sys.stdout, text, opts.reverse, opts.flip)
+        sys.stdout.write(b'\n')
+    reportProfile(profile)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Client of the render daemon in pyfiglet.server
+
+The socket side lives in the top-level pyfiglet_client module, which the
+pyfiglet command starts from so that renders the daemon answers don't
+import the package. This module raises pyfiglet's exceptions for it.
+"""
+
+from __future__ import unicode_literals
+
+import pyfiglet
+from pyfiglet import FigletError
+from pyfiglet_client import TIMEOUT, Unavailable, exchange
+
+
+class ServerUnavailable(FigletError):
+    """
+    Raised by the client when no daemon answers at the address
+    """
+
+
+def errorType(name):
+    """
+    The exception class of pyfiglet named name, or FigletError for errors
+    pyfiglet doesn't define
+    """
+    cls = getattr(pyfiglet, name, None)
+    if isinstance(cls, type) and issubclass(cls, FigletError):
+        return cls
+    return FigletError
+
+
+def request(text, address=None, timeout=TIMEOUT, **options):
+    """
+    Have the daemon at address render text, returning its output. options
+    are the render options of pyfiglet.server.OPTIONS, plus reverse and
+    flip. Raises ServerUnavailable when nothing answers, otherwise an
+    exception of the type the render raised.
+    """
+    options['text'] = text
+    try:
+        reply = exchange(options, address, timeout)
+    except Unavailable as e:
+        raise ServerUnavailable(str(e))
+    if 'error' in reply:
+        raise errorType(reply['type'])(reply['error'])
+    return reply['output']
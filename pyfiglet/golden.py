@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Golden output corpus
+
+golden.json.gz holds the render of every bundled font for each of TEXTS,
+in each of LAYOUTS and DIRECTIONS, so changes to the rendering engine can
+be checked to be output-identical (see test_golden.py). It ships in the
+source distribution only, as a test fixture.
+
+The single-line texts of the checked-in corpus were rendered by the
+engine of the baseline revision BASELINE, before the parser and rendering
+engine were rewritten, so they check the rewrites are output-identical to
+it. Cases it can't render are snapshots of this engine's output: the
+Deutsch characters, line breaking, and the right-to-left cases and fonts
+the baseline engine fails on. The corpus lists those per font. Regenerate
+it with
+
+    python -m pyfiglet.golden [--baseline REV | --figlet BINARY]
+
+which renders with the pyfiglet engine at git revision REV where it can,
+or with BINARY, or with the rendering engine of this checkout otherwise.
+The corpus records which one it came from in its generators field.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import gzip
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+from optparse import OptionParser
+
+from . import Figlet, FigletFont, get_res_path, __version__
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                      'golden.json.gz')
+VERSION = 2
+
+# Revision of the checked-in corpus' reference renders
+BASELINE = '4190f82'
+
+# Wide enough for any font to render a line of TEXTS without breaking it
+WIDE = 4096
+
+# (text, width, justify). Single lines are left justified on a WIDE line,
+# as the baseline engine, which didn't break lines, rendered them.
+TEXTS = [
+    ('foo', WIDE, 'left'),
+    ('Hello, World!', WIDE, 'left'),
+    (''.join(chr(i) for i in range(33, 127)), WIDE, 'left'),
+    ('\xc4\xd6\xdc \xe4\xf6\xfc \xdf', 80, 'auto'),
+    ('Wrapping a line of text that is far too long for one row\nand a '
+     'second line', 80, 'auto'),
+]
+
+# Texts the baseline engine can render: one line, no Deutsch characters
+BASELINE_TEXTS = [0, 1, 2]
+
+# Layout name -> (smushMode for pyfiglet, C figlet flags)
+LAYOUTS = {
+    'default': (None, []),
+    'full': (0, ['-W']),
+    'kern': (64, ['-k']),
+}
+
+# Direction -> C figlet flag
+DIRECTIONS = {
+    'left-to-right': '-L',
+    'right-to-left': '-R',
+}
+
+# Justify -> C figlet flags
+JUSTIFY = {
+    'auto': [],
+    'left': ['-l'],
+}
+
+
+def cases():
+    """
+    Every (text index, layout, direction) of a font's entries, in the
+    order they are stored
+    """
+    return [(i, layout, direction)
+            for i in range(len(TEXTS))
+            for layout in sorted(LAYOUTS)
+            for direction in sorted(DIRECTIONS)]
+
+
+def options(font, i, layout, direction):
+    """
+    Figlet keyword arguments for case (i, layout, direction) of font
+    """
+    smushMode = LAYOUTS[layout][0]
+    fontkwargs = {} if smushMode is None else {'smushMode': smushMode}
+    text, width, justify = TEXTS[i]
+    return {'font': font, 'direction': direction, 'justify': justify,
+            'width': width, 'fontkwargs': fontkwargs}
+
+
+def renderEngine(font, i, layout, direction):
+    f = Figlet(**options(font, i, layout, direction))
+    return '%s' % f.renderText(TEXTS[i][0])
+
+
+def renderBinary(binary, font, i, layout, direction):
+    text, width, justify = TEXTS[i]
+    command = ([binary, '-d', get_res_path('pyfiglet.fonts', ''),
+                '-f', font, '-w', str(width), DIRECTIONS[direction]]
+               + LAYOUTS[layout][1] + JUSTIFY[justify] + [text])
+    return subprocess.check_output(command).decode('UTF-8')
+
+
+# Run by renderRevision in a python of its own, with the old pyfiglet
+# package in the directory argv[1]
+_revisionScript = """
+import json, sys
+sys.path.insert(0, sys.argv[1])
+from pyfiglet import Figlet
+renders = []
+for text, kwargs in json.load(sys.stdin):
+    try:
+        renders.append('%s' % Figlet(**kwargs).renderText(text))
+    except Exception:
+        renders.append(None)
+json.dump(renders, sys.stdout)
+"""
+
+
+def renderRevision(revision, todo):
+    """
+    Render each (font, text index, layout, direction) of todo with the
+    pyfiglet engine at git revision revision, None where it fails
+    """
+    root = os.path.dirname(os.path.dirname(CORPUS))
+    archive = subprocess.check_output(
+        ['git', 'archive', '--format=tar', revision, 'pyfiglet'], cwd=root)
+    jobs = [(TEXTS[case[1]][0], options(*case)) for case in todo]
+    tmp = tempfile.mkdtemp()
+    try:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(tmp)
+        process = subprocess.Popen(
+            [sys.executable, '-c', _revisionScript, tmp],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, cwd=tmp)
+        out, err = process.communicate(json.dumps(jobs).encode('UTF-8'))
+        if process.returncode:
+            raise RuntimeError('rendering with %s failed' % revision)
+        return json.loads(out.decode('UTF-8'))
+    finally:
+        shutil.rmtree(tmp)
+
+
+def generate(render):
+    """
+    The corpus of every font, rendering each case with
+    render(font, text index, layout, direction)
+    """
+    fonts = {}
+    for font in sorted(FigletFont.getFonts()):
+        fonts[font] = [render(font, i, layout, direction)
+                       for i, layout, direction in cases()]
+    return fonts
+
+
+def generateRevision(revision):
+    """
+    The corpus of every font, rendering BASELINE_TEXTS with the engine at
+    revision and the rest with this checkout's. Returns the renders and
+    the cases of each font that this checkout rendered.
+    """
+    todo = [(font, i, layout, direction)
+            for font in sorted(FigletFont.getFonts())
+            for i, layout, direction in cases()
+            if i in BASELINE_TEXTS]
+    renders = dict(zip(map(tuple, todo), renderRevision(revision, todo)))
+
+    fonts = {}
+    snapshot = {}
+    for font in sorted(FigletFont.getFonts()):
+        fonts[font] = []
+        for n, (i, layout, direction) in enumerate(cases()):
+            render = renders.get((font, i, layout, direction))
+            if render is None:
+                render = renderEngine(font, i, layout, direction)
+                snapshot.setdefault(font, []).append(n)
+            fonts[font].append(render)
+    return fonts, snapshot
+
+
+def save(corpus, fn=CORPUS):
+    data = json.dumps(corpus, sort_keys=True, separators=(',', ':'))
+    # No name or timestamp in the header, so unchanged corpora are
+    # byte-identical
+    with open(fn, 'wb') as raw:
+        with gzip.GzipFile('', 'wb', 9, raw, 0) as f:
+            f.write(data.encode('UTF-8'))
+
+
+def load(fn=CORPUS):
+    with gzip.open(fn, 'rb') as f:
+        return json.loads(f.read().decode('UTF-8'))
+
+
+def main():
+    parser = OptionParser(usage='%prog [options]')
+    parser.add_option('--baseline', metavar='REV',
+                      help='git revision of pyfiglet to render the texts '
+                           'it supports with, e.g. %s' % BASELINE)
+    parser.add_option('--figlet', metavar='BINARY',
+                      help='reference figlet binary to render with, '
+                           'instead of this checkout\'s engine')
+    parser.add_option('-o', '--output', default=CORPUS, metavar='FILE',
+                      help='where to write the corpus (default: %default)')
+    opts, args = parser.parse_args()
+
+    engine = 'pyfiglet %s FigletRenderingEngine' % __version__
+    snapshot = {}
+    if opts.figlet:
+        generator = opts.figlet
+        version = subprocess.check_output([opts.figlet, '-v'])
+        generator += ' ' + version.decode('UTF-8').splitlines()[0]
+
+        def render(*args):
+            return renderBinary(opts.figlet, *args)
+        fonts = generate(render)
+    elif opts.baseline:
+        generator = 'pyfiglet %s FigletRenderingEngine' % opts.baseline
+        fonts, snapshot = generateRevision(opts.baseline)
+    else:
+        generator = engine
+        fonts = generate(renderEngine)
+        snapshot = dict((font, list(range(len(cases())))) for font in fonts)
+
+    corpus = {
+        'version': VERSION,
+        # The reference renders came from generators['reference'], the
+        # cases listed in snapshot from generators['snapshot']
+        'generators': {'reference': generator, 'snapshot': engine},
+        'texts': [list(text) for text in TEXTS],
+        'cases': [list(case) for case in cases()],
+        'fonts': fonts,
+        'snapshot': snapshot,
+    }
+    save(corpus, opts.output)
+    print('wrote %d fonts to %s' % (len(corpus['fonts']), opts.output))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
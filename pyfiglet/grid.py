@@ -0,0 +1,367 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+NumPy glyph-grid backend for the rendering engine
+
+Each glyph of a font is kept as a fixed-height array of indices into the
+font's alphabet, the characters its glyphs are drawn with. A FIG-line is
+rendered into a preallocated array of the same indices. The overlap
+with each new glyph is found with vectorized scans of the edges of all
+its rows at once, and the glyph is placed by slicing.
+
+Smushing two characters only depends on which characters they are, so
+the smush table is mirrored as matrices over the alphabet, extended as
+glyphs bring in new characters.
+
+Select it with Figlet(backend='numpy'). It renders exactly what
+FigletRenderingEngine renders. Each glyph costs a few NumPy calls
+whatever its size, so it only pays off for tall fonts: it is faster for
+doh, caligraphy and fraktur, slower for standard and most other fonts.
+"""
+
+from __future__ import unicode_literals
+
+import weakref
+
+import numpy
+
+from . import FigletRenderingEngine, SmushTable
+
+# Alphabet index of the space, which also pads short glyph rows
+SPACE = 0
+
+
+class Glyph(object):
+    """
+    One glyph as alphabet indices, with its edges ready for the overlap
+    scans of either direction
+    """
+
+    def __init__(self, width, cells, mirrored, edges):
+        rows = numpy.arange(len(cells))
+        last = cells.shape[1] - 1
+        self.width = width
+        self.cells = cells          # height x width, rows left aligned
+        self.mirrored = mirrored    # each row mirrored within its length
+        self.lengths, self.firsts, self.lasts = [
+            numpy.array(column, dtype=numpy.intp) for column in zip(*edges)]
+        self.rectangular = bool((self.lengths == width).all())
+
+        # Its left edge, when it is to the right of the buffer
+        self.firstEdge = self.firsts < self.lengths
+        self.firstChars = cells[rows, numpy.minimum(self.firsts, last)]
+
+        # Its right edge, when it is to the left of the buffer
+        lastBd = numpy.maximum(self.lasts, 0)
+        self.lastEdge = lastBd < self.lengths
+        self.lastChars = cells[rows, numpy.minimum(lastBd, last)]
+        self.lastBd = numpy.where(self.lastEdge, lastBd, 0)
+
+        # Index of the last non-blank character of each row as stored,
+        # mirrored or not
+        self.ends = self.lasts
+        self.mirroredEnds = numpy.where(
+            self.lasts >= 0, self.lengths - 1 - self.firsts, -1)
+
+
+class SmushMatrices(object):
+    """
+    A SmushTable over a font's alphabet: touches[left, right] is whether
+    smushChars(left, right) gives a character, blankTouches the same when
+    the glyph widths rule smushing out, and merged[left, right] the
+    character it gives (left where there is none)
+    """
+
+    def __init__(self, grids, table):
+        self.grids = grids
+        self.table = table
+        self.size = 0
+        self.touches = numpy.zeros((0, 0), dtype=bool)
+        self.blankTouches = numpy.zeros((0, 0), dtype=bool)
+        self.merged = numpy.zeros((0, 0), dtype=numpy.uint16)
+
+    def update(self):
+        """
+        Fill in the pairs of characters added to the alphabet since the
+        last update
+        """
+        alphabet = self.grids.alphabet
+        while self.size < len(alphabet):
+            old, size = self.size, len(alphabet)
+            touches = numpy.zeros((size, size), dtype=bool)
+            merged = numpy.zeros((size, size), dtype=numpy.uint16)
+            touches[:old, :old] = self.touches
+            merged[:old, :old] = self.merged
+            for l in range(size):
+                left = alphabet[l]
+                for r in range(0 if l >= old else old, size):
+                    right = alphabet[r]
+                    if left.isspace():
+                        touches[l, r], merged[l, r] = True, r
+                    elif right.isspace():
+                        touches[l, r], merged[l, r] = True, l
+                    else:
+                        smushed = self.table[left, right]
+                        if smushed is not None:
+                            # May grow the alphabet, hence the while loop
+                            touches[l, r] = True
+                            merged[l, r] = self.grids.indexOf(smushed)
+                        else:
+                            merged[l, r] = l
+            spaces = numpy.array([c.isspace() for c in alphabet[:size]])
+            self.touches = touches
+            self.blankTouches = spaces[:, None] | spaces[None, :]
+            self.merged = merged
+            self.size = size
+        return self
+
+
+class FontGrids(object):
+    """
+    A font's alphabet, its glyphs as alphabet indices and the smush
+    matrices of its alphabet
+    """
+
+    def __init__(self, Font):
+        self.Font = Font
+        self.alphabet = []
+        self.index = {}
+        self.codes = []
+        self.glyphs = {}
+        self.matrices = {}
+        # Seeded with the characters smushing can make
+        for char in ' ' + Font.hardBlank + SmushTable.special:
+            self.indexOf(char)
+
+    def indexOf(self, char):
+        try:
+            return self.index[char]
+        except KeyError:
+            pass
+        i = self.index[char] = len(self.alphabet)
+        self.alphabet.append(char)
+        self.codes = numpy.array([ord(c) for c in self.alphabet],
+                                 dtype='<u4')
+        return i
+
+    def glyph(self, c):
+        try:
+            return self.glyphs[c]
+        except KeyError:
+            pass
+        Font = self.Font
+        rows = Font.chars[c]
+        width = Font.width[c]
+        # At least one column, so the edge scans can always index it
+        cells = numpy.zeros((Font.height, max(width, 1)), dtype=numpy.uint16)
+        mirrored = numpy.zeros_like(cells)
+        for i, row in enumerate(rows):
+            indices = [self.indexOf(char) for char in row]
+            cells[i, :len(row)] = indices
+            mirrored[i, :len(row)] = indices[::-1]
+        glyph = self.glyphs[c] = Glyph(width, cells, mirrored,
+                                       Font.getEdges(c))
+        return glyph
+
+    def smushMatrices(self, table):
+        matrices = self.matrices.get(id(table))
+        if matrices is None:
+            matrices = self.matrices[id(table)] = SmushMatrices(self, table)
+        return matrices.update()
+
+
+_fontGrids = weakref.WeakKeyDictionary()
+
+
+def fontGrids(Font):
+    try:
+        return _fontGrids[Font]
+    except KeyError:
+        grids = _fontGrids[Font] = FontGrids(Font)
+        return grids
+
+
+class GridRenderingEngine(FigletRenderingEngine):
+    """
+    FigletRenderingEngine rendering into a NumPy array
+    """
+
+    def reset(self):
+        """
+        Start rendering a new string with the current font and direction
+        """
+        self.curCharWidth = self.prevCharWidth = 0
+        self.Font = self.base.Font
+        self.rtl = self.base.direction == 'right-to-left'
+        self.updateSmushTable()
+        self.grids = fontGrids(self.Font)
+        self.matrices = self.grids.smushMatrices(self.smushTable)
+        self.rowIndex = numpy.arange(self.Font.height)
+        self.smushing = bool(
+            self.Font.smushMode & (self.SM_SMUSH | self.SM_KERN))
+
+        # As in FigletRenderingEngine, right-to-left rows are stored
+        # mirrored so glyphs are always placed at the end. Rows are only
+        # ragged if a font's glyphs are.
+        self.grid = numpy.zeros((self.Font.height, 64), dtype=numpy.uint16)
+        self.lengths = numpy.zeros(self.Font.height, dtype=numpy.intp)
+        self.lasts = numpy.full(self.Font.height, -1, dtype=numpy.intp)
+
+    def lineLength(self):
+        return int(self.lengths[0]) if len(self.lengths) else 0
+
+    def overlap(self, glyph):
+        """
+        smushAmount for glyph, over all rows at once
+        """
+        if not self.smushing:
+            return 0
+
+        if self.prevCharWidth < 2 or self.curCharWidth < 2:
+            touches = self.matrices.blankTouches
+        else:
+            touches = self.matrices.touches
+        lengths = self.lengths
+        lasts = self.lasts
+
+        if self.rtl:
+            # The glyph is on the left, the stored row's last character is
+            # the right edge
+            rightEdge = lasts >= 0
+            right = self.grid[self.rowIndex, numpy.maximum(lasts, 0)]
+            charbd = numpy.where(rightEdge, lengths - 1 - lasts, lengths)
+            amounts = charbd + glyph.lengths - 1 - glyph.lastBd
+            closer = (~glyph.lastEdge | (glyph.lastChars == SPACE)
+                      | (rightEdge & touches[glyph.lastChars, right]))
+        else:
+            linebd = numpy.maximum(lasts, 0)
+            leftEdge = linebd < lengths
+            left = self.grid[self.rowIndex, linebd]
+            amounts = glyph.firsts + lengths - 1 - numpy.where(
+                leftEdge, linebd, 0)
+            closer = (~leftEdge | (left == SPACE)
+                      | (glyph.firstEdge & touches[left, glyph.firstChars]))
+
+        return min(self.curCharWidth, int((amounts + closer).min()))
+
+    def merge(self, placed, glyph):
+        """
+        Characters of the glyph placed over those already in the row, as
+        addChar smushes them
+        """
+        if self.rtl:
+            return self.matrices.merged[glyph, placed]
+        return self.matrices.merged[placed, glyph]
+
+    def addChar(self, c, undo=False, limit=None):
+        Font = self.Font
+        if c not in Font.chars:
+            return () if undo else None
+        glyph = self.grids.glyph(c)
+        if self.matrices.size < len(self.grids.alphabet):
+            self.matrices.update()
+        self.curCharWidth = glyph.width
+        maxSmush = self.overlap(glyph)
+        length = self.lineLength()
+        if (limit is not None
+                and length + self.curCharWidth - maxSmush > limit):
+            return None
+
+        lengths = self.lengths
+        rectangular = glyph.rectangular and (lengths == length).all()
+        if rectangular:
+            longest = length
+            low = max(length - maxSmush, 0)
+        else:
+            longest = int(lengths.max())
+            low = max(int(lengths.min()) - maxSmush, 0)
+        if longest + glyph.width > self.grid.shape[1]:
+            grown = numpy.zeros(
+                (Font.height, max(longest + glyph.width,
+                                  2 * self.grid.shape[1])),
+                dtype=numpy.uint16)
+            grown[:, :self.grid.shape[1]] = self.grid
+            self.grid = grown
+        grid = self.grid
+
+        if undo:
+            record = (self.prevCharWidth, self.lasts.copy(), lengths.copy(),
+                      low, grid[:, low:longest].copy())
+
+        cells = glyph.mirrored if self.rtl else glyph.cells
+        starts = lengths - maxSmush
+        if rectangular:
+            start = length - maxSmush
+            skip = max(-start, 0)
+            if maxSmush > skip:
+                grid[:, start + skip:length] = self.merge(
+                    grid[:, start + skip:length], cells[:, skip:maxSmush])
+            grid[:, length:start + glyph.width] = (
+                cells[:, maxSmush:glyph.width])
+        else:
+            for row in range(Font.height):
+                start = int(starts[row])
+                size = int(glyph.lengths[row])
+                skip = max(-start, 0)
+                overlap = min(maxSmush, size)
+                if overlap > skip:
+                    grid[row, start + skip:start + overlap] = self.merge(
+                        grid[row, start + skip:start + overlap],
+                        cells[row, skip:overlap])
+                if size > maxSmush:
+                    grid[row, start + maxSmush:start + size] = (
+                        cells[row, maxSmush:size])
+
+        ends = glyph.mirroredEnds if self.rtl else glyph.ends
+        numpy.maximum(self.lasts, numpy.where(ends >= 0, starts + ends, -1),
+                      out=self.lasts)
+        self.lengths = starts + numpy.maximum(glyph.lengths, maxSmush)
+
+        self.prevCharWidth = self.curCharWidth
+        if undo:
+            return record
+
+    def undoChar(self, record):
+        if not record:
+            return
+        self.prevCharWidth, self.lasts, self.lengths, low, window = record
+        self.grid[:, low:low + window.shape[1]] = window
+
+    def putChar(self, c, limit):
+        rows = self.Font.chars[c]
+        if limit > 0:
+            if self.rtl:
+                rows = [row[-limit:] for row in rows]
+            else:
+                rows = [row[:limit] for row in rows]
+        if self.rtl:
+            rows = [row[::-1] for row in rows]
+        lengths = [len(row) for row in rows]
+        self.grid = numpy.zeros((self.Font.height, max(lengths + [1])),
+                                dtype=numpy.uint16)
+        for i, row in enumerate(rows):
+            self.grid[i, :len(row)] = [self.grids.indexOf(char)
+                                       for char in row]
+        self.lengths = numpy.array(lengths, dtype=numpy.intp)
+
+    def saveBuffer(self):
+        # At least one column, as for glyphs
+        width = max(int(self.lengths.max()) if len(self.lengths) else 0, 1)
+        return (self.grid[:, :width].copy(), self.lengths.copy(),
+                self.lasts.copy())
+
+    def restoreBuffer(self, saved):
+        self.grid, self.lengths, self.lasts = saved
+
+    def joinRows(self):
+        lengths = self.lengths.tolist()
+        width = max(lengths) if lengths else 0
+        codes = self.grids.codes[self.grid[:, :width]]
+        data = numpy.ascontiguousarray(codes, dtype='<u4').tobytes()
+        data = data.decode('utf-32-le')
+        rows = [data[i * width:i * width + length]
+                for i, length in enumerate(lengths)]
+        if self.rtl:
+            rows = [row[::-1] for row in rows]
+        return rows
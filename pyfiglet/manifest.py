@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Manifest of the installed fonts
+
+fonts/manifest.json records the header fields and comment summary of every
+font so listing and querying fonts doesn't have to open each font file.
+It is written at build time, or by `python -m pyfiglet.manifest`, and
+never at runtime. Each time it is consulted the fonts directory is
+listed and every entry checked against its file's size, which survives
+installation where modification times don't; fonts that were added or
+changed size are read again, in memory only.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import io
+import json
+import os
+import sys
+import threading
+
+from . import FigletFont, FontNotFound, get_res_path
+
+MANIFEST = 'manifest.json'
+VERSION = 2
+
+def readFont(fn):
+    """
+    Manifest entry of one font file, reading only its header, comments
+    and first few rows
+    """
+    name, ext = os.path.splitext(os.path.basename(fn))
+    lines = []
+    with io.open(fn, 'rb') as f:
+        for line in f:
+            lines.append(line.decode('UTF-8', 'replace').rstrip('\r\n'))
+            if len(lines) == 100:
+                break
+    if not lines:
+        raise ValueError('%s is empty' % fn)
+
+    (hardBlank, height, baseLine, maxLength, oldLayout, commentLines,
+     printDirection, fullLayout) = FigletFont.parseHeader(lines[0], name)
+    infos = FigletFont.infoLines(lines)
+
+    st = os.stat(fn)
+    return {
+        'name': name,
+        'format': ext[1:],
+        'height': height,
+        'direction': printDirection,
+        'layout': fullLayout,
+        'comment': infos[0] if infos else '',
+        'size': st.st_size,
+    }
+
+
+class FontManifest(object):
+    """
+    Font name -> metadata for every valid font in a fonts directory
+    """
+
+    def __init__(self, fontsDir):
+        self.fontsDir = fontsDir
+        self.path = os.path.join(fontsDir, MANIFEST)
+        self.lock = threading.Lock()
+        self.fonts = {}
+        # Font name -> size of files that aren't valid fonts
+        self.invalid = {}
+        self.load()
+
+    def load(self):
+        try:
+            with io.open(self.path, 'r', encoding='UTF-8') as f:
+                manifest = json.load(f)
+        except (EnvironmentError, ValueError):
+            return
+        if manifest.get('version') == VERSION:
+            self.fonts = manifest['fonts']
+            self.invalid = manifest['invalid']
+
+    def refresh(self):
+        """
+        Check every entry against the size of its font file, reading fonts
+        that were added or changed
+        """
+        with self.lock:
+            fonts = {}
+            invalid = {}
+            for fn in os.listdir(self.fontsDir):
+                name, ext = os.path.splitext(fn)
+                if ext not in ('.flf', '.tlf'):
+                    continue
+                path = os.path.join(self.fontsDir, fn)
+                size = os.stat(path).st_size
+                entry = self.fonts.get(name)
+                if (entry is not None and entry['size'] == size
+                        and entry['format'] == ext[1:]):
+                    fonts[name] = entry
+                    continue
+                if self.invalid.get(name) == size:
+                    invalid[name] = size
+                    continue
+                try:
+                    fonts[name] = readFont(path)
+                except Exception:
+                    # Not a valid font, leave it out like isValidFont did
+                    invalid[name] = size
+            self.fonts = fonts
+            self.invalid = invalid
+
+    def write(self):
+        manifest = {'version': VERSION, 'fonts': self.fonts,
+                    'invalid': self.invalid}
+        # Python 2's json.dumps returns str, which io.open's text files
+        # don't take
+        data = json.dumps(manifest, indent=1, sort_keys=True)
+        with io.open(self.path, 'wb') as f:
+            f.write(data.encode('UTF-8'))
+
+    def getFonts(self):
+        self.refresh()
+        return list(self.fonts)
+
+    def getFont(self, font):
+        self.refresh()
+        try:
+            return dict(self.fonts[font])
+        except KeyError:
+            raise FontNotFound(font)
+
+    def findFonts(self, **query):
+        self.refresh()
+        return sorted(
+            name for name, entry in self.fonts.items()
+            if all(entry.get(key) == value for key, value in query.items()))
+
+
+_manifest = None
+_manifestLock = threading.Lock()
+
+
+def getManifest():
+    """
+    Manifest of the bundled fonts directory
+    """
+    global _manifest
+    if _manifest is None:
+        with _manifestLock:
+            if _manifest is None:
+                _manifest = FontManifest(get_res_path('pyfiglet.fonts', ''))
+    return _manifest
+
+
+def main():
+    manifest = FontManifest(
+        sys.argv[1] if len(sys.argv) > 1 else
+        get_res_path('pyfiglet.fonts', ''))
+    # Read every font again, to catch edits that kept the size
+    manifest.fonts = {}
+    manifest.invalid = {}
+    manifest.refresh()
+    manifest.write()
+    print('wrote %d fonts to %s' % (len(manifest.fonts), manifest.path))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
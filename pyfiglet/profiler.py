@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Opt-in instrumentation of font loading and rendering
+
+Give Figlet an observer, any object with timing(phase, seconds) and
+count(name, n) methods such as Profile, and it loads fonts and renders
+through the instrumented classes here instead of the plain ones:
+
+    profile = Profile()
+    f = Figlet(font='slant', observer=profile)
+    f.renderText('hello')
+    print(profile.report())
+
+Phases are timed inclusively, so render includes addChar, which includes
+smushAmount, which includes smushChars. Without an observer none of this
+is imported and the rendering engine runs unchanged.
+
+Phases: font.archive (reading a font's index from the font archive),
+font.read (reading a font file), font.parse (parsing it), render (making
+the rows of a text), renderBatch, addChar, smushAmount, smushChars and
+justify.
+
+Counters: glyphs, glyphs.missing, smush.evaluations, fontCache.hits,
+fontCache.misses, renderCache.hits and renderCache.misses.
+"""
+
+from __future__ import unicode_literals
+
+import time
+
+from . import FONT_CACHE, FigletFont
+
+clock = getattr(time, 'perf_counter', time.time)
+
+
+class Profile(object):
+    """
+    Observer adding up the time spent in each phase and the counters
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.counters = {}
+
+    def timing(self, phase, seconds):
+        calls, total = self.phases.get(phase, (0, 0.0))
+        self.phases[phase] = (calls + 1, total + seconds)
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def clear(self):
+        self.phases.clear()
+        self.counters.clear()
+
+    def report(self):
+        """
+        The phases, slowest first, and the counters as a table
+        """
+        lines = ['%-20s %10s %12s %12s' % ('phase', 'calls', 'total ms',
+                                            'per call us')]
+        for total, phase, calls in sorted(
+                ((total, phase, calls)
+                 for phase, (calls, total) in self.phases.items()),
+                reverse=True):
+            lines.append('%-20s %10d %12.3f %12.3f' % (
+                phase, calls, 1000 * total, 1e6 * total / calls))
+        if self.counters:
+            lines.append('')
+            lines.append('%-20s %10s' % ('counter', 'count'))
+            for name in sorted(self.counters):
+                lines.append('%-20s %10d' % (name, self.counters[name]))
+        return '\n'.join(lines)
+
+
+def timed(phase, method):
+    """
+    method of an engine, reporting the time of each call to the
+    observer of the engine's Figlet
+    """
+    def wrapper(self, *args, **kwargs):
+        start = clock()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.base.observer.timing(phase, clock() - start)
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+_engines = {}
+
+
+def profilingEngine(Engine):
+    """
+    Subclass of rendering engine class Engine that reports to its Figlet's
+    observer
+    """
+    try:
+        return _engines[Engine]
+    except KeyError:
+        pass
+
+    def addChar(self, c, undo=False, limit=None):
+        observer = self.base.observer
+        start = clock()
+        try:
+            return Engine.addChar(self, c, undo, limit)
+        finally:
+            observer.timing('addChar', clock() - start)
+            observer.count('glyphs' if c in self.Font.chars
+                           else 'glyphs.missing')
+
+    def smushChars(self, left='', right=''):
+        self.base.observer.count('smush.evaluations')
+        return smushCharsTimed(self, left, right)
+
+    def iterRender(self, text):
+        # Only the time spent making rows counts, not the caller's
+        observer = self.base.observer
+        rows = Engine.iterRender(self, text)
+        elapsed = 0.0
+        try:
+            while True:
+                start = clock()
+                try:
+                    row = next(rows)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += clock() - start
+                yield row
+        finally:
+            observer.timing('render', elapsed)
+
+    smushCharsTimed = timed('smushChars', Engine.smushChars)
+    methods = {
+        '__doc__': Engine.__doc__,
+        'iterRender': iterRender,
+        'renderBatch': timed('renderBatch', Engine.renderBatch),
+        'addChar': addChar,
+        'smushAmount': timed('smushAmount', Engine.smushAmount),
+        'smushChars': smushChars,
+        'finishRows': timed('justify', Engine.finishRows),
+    }
+    cls = _engines[Engine] = type(str('Profiling' + Engine.__name__),
+                                  (Engine,), methods)
+    return cls
+
+
+class ProfilingFont(FigletFont):
+    """
+    FigletFont reporting the time it takes to find, read and parse the
+    font to observer
+    """
+
+    def __init__(self, observer, font, **kwargs):
+        self.observer = observer
+        FigletFont.__init__(self, font, **kwargs)
+        # The font outlives the profile in FONT_CACHE
+        del self.observer
+
+    def loadArchivedFont(self):
+        start = clock()
+        try:
+            return FigletFont.loadArchivedFont(self)
+        finally:
+            self.observer.timing('font.archive', clock() - start)
+
+    def preloadFont(self, font):
+        start = clock()
+        try:
+            return FigletFont.preloadFont(font)
+        finally:
+            self.observer.timing('font.read', clock() - start)
+
+    def loadFont(self):
+        start = clock()
+        try:
+            return FigletFont.loadFont(self)
+        finally:
+            self.observer.timing('font.parse', clock() - start)
+
+
+def getFont(observer, font, **kwargs):
+    """
+    FONT_CACHE.getFont, reporting cache hits and the loading of fonts that
+    miss to observer
+    """
+    key = FONT_CACHE.cacheKey(font, **kwargs)
+    Font = FONT_CACHE.get(key)
+    if Font is not None:
+        observer.count('fontCache.hits')
+        return Font
+    observer.count('fontCache.misses')
+    Font = ProfilingFont(observer, font, **kwargs)
+    FONT_CACHE.put(key, Font)
+    return Font
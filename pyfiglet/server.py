@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Render daemon
+
+Each run of the pyfiglet command pays interpreter startup, imports and a
+font load for a few lines of output. `pyfiglet --serve` keeps a process
+running that listens on a Unix socket, or on a localhost port, with fonts
+held in FONT_CACHE and renders in RENDER_CACHE. `pyfiglet --client`
+forwards the render to it through pyfiglet_client, without importing
+pyfiglet, and falls back to rendering in-process when no daemon answers.
+
+The protocol is one JSON object per line each way. A request holds the
+text and the render options; the reply holds the output, or the error
+raised and its type.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import errno
+import json
+import os
+import signal
+import socket
+import stat
+import sys
+import threading
+
+try:
+    import socketserver
+except ImportError:
+    import SocketServer as socketserver
+
+from pyfiglet_client import (TIMEOUT, checkDir, defaultAddress, parseAddress,
+                             runtimeDir)
+
+from . import Figlet, FigletError
+
+# Request fields passed on to Figlet, with their defaults
+OPTIONS = (('font', 'standard'), ('direction', 'auto'), ('justify', 'auto'),
+           ('width', 80), ('smushMode', None), ('paragraph', False))
+
+
+class RenderHandler(socketserver.StreamRequestHandler):
+    """
+    Answer each request line of a connection with a reply line
+    """
+
+    def handle(self):
+        self.connection.settimeout(TIMEOUT)
+        try:
+            for line in iter(self.rfile.readline, b''):
+                reply = self.server.reply(line)
+                self.wfile.write(
+                    json.dumps(reply).encode('UTF-8') + b'\n')
+                self.wfile.flush()
+        except (socket.timeout, EnvironmentError):
+            pass
+
+
+class RenderServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """
+    Threaded render server on a TCP or Unix socket. Figlet objects aren't
+    thread-safe, so each thread keeps its own, one per set of options;
+    fonts and renders are shared through FONT_CACHE and RENDER_CACHE.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address):
+        self.address_family, address = parseAddress(address)
+        if self.address_family == socket.AF_UNIX:
+            makeSocketDir(address)
+            removeStaleSocket(address)
+        socketserver.TCPServer.__init__(self, address, RenderHandler)
+        self.local = threading.local()
+
+    def getFiglet(self, options):
+        figlets = getattr(self.local, 'figlets', None)
+        if figlets is None:
+            figlets = self.local.figlets = {}
+        figlet = figlets.get(options)
+        if figlet is None:
+            font, direction, justify, width, smushMode, paragraph = options
+            fontkwargs = {} if smushMode is None else {'smushMode': smushMode}
+            figlet = figlets[options] = Figlet(
+                font=font, direction=direction, justify=justify, width=width,
+                fontkwargs=fontkwargs, renderCache=True, paragraph=paragraph)
+        return figlet
+
+    def reply(self, line):
+        try:
+            request = json.loads(line.decode('UTF-8'))
+            options = tuple(request.get(name, default)
+                            for name, default in OPTIONS)
+            output = self.getFiglet(options).renderText(request['text'])
+            if request.get('reverse'):
+                output = output.reverse()
+            if request.get('flip'):
+                output = output.flip()
+            return {'output': output}
+        except Exception as e:
+            return {'error': str(e), 'type': type(e).__name__}
+
+    def serve(self):
+        try:
+            self.serve_forever()
+        except (KeyboardInterrupt, SystemExit):
+            pass
+        finally:
+            self.server_close()
+            if self.address_family == socket.AF_UNIX:
+                try:
+                    os.unlink(self.server_address)
+                except EnvironmentError:
+                    pass
+
+
+def makeSocketDir(path):
+    """
+    Check the directory of the socket at path can't be tampered with by
+    other users, first creating runtimeDir() for this user alone if that
+    is where the socket goes
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    if directory == os.path.abspath(runtimeDir()):
+        try:
+            os.mkdir(directory, 0o700)
+        except EnvironmentError as e:
+            if e.errno != errno.EEXIST:
+                raise
+    try:
+        checkDir(directory)
+    except EnvironmentError as e:
+        raise FigletError('unsafe socket directory: %s' % e.strerror)
+
+
+def removeStaleSocket(path):
+    """
+    Remove the socket file at path if no daemon is listening on it
+    """
+    try:
+        st = os.lstat(path)
+    except EnvironmentError as e:
+        if e.errno == errno.ENOENT:
+            return
+        raise
+    # Connecting to a regular file is refused too, so check before
+    # unlinking anything
+    if not stat.S_ISSOCK(st.st_mode):
+        raise FigletError('%s exists and is not a socket' % path)
+    if hasattr(os, 'getuid') and st.st_uid != os.getuid():
+        raise FigletError('%s belongs to another user' % path)
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except EnvironmentError as e:
+        if e.errno in (errno.ECONNREFUSED, errno.ENOENT):
+            os.unlink(path)
+            return
+        raise
+    finally:
+        probe.close()
+    raise FigletError('a daemon is already listening on %s' % path)
+
+
+def serve(address=None):
+    """
+    Run the daemon at address until interrupted or terminated
+    """
+    address = address or defaultAddress()
+    server = RenderServer(address)
+
+    def terminate(signum, frame):
+        # Unwind through RenderServer.serve, which removes the socket
+        raise SystemExit(0)
+    signal.signal(signal.SIGTERM, terminate)
+    print('pyfiglet daemon listening on %s' % address, file=sys.stderr)
+    server.serve()
+    return 0
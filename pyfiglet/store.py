@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Font store shared by the workers of a pre-fork server
+
+A parsed FigletFont keeps its glyphs as dicts of tuples of strings, and
+every worker of a gunicorn or uwsgi server ends up with its own copy:
+even a copy inherited from the master is soon duplicated page by page,
+as reference counting and the garbage collector write to every object
+they touch. A SharedFontStore packs the fonts into one buffer in the
+font archive format instead, the glyph rows of each font back to back
+with arrays of code points, widths and offsets, in an anonymous shared
+memory mapping. Workers read glyphs out of it and decode only the ones
+they render; nothing ever writes to the mapping, so its pages stay
+shared however many workers there are.
+
+In the master, before forking:
+
+    from pyfiglet import store
+    store.prefork(['standard', 'slant'])
+
+prefork builds the store, installs it so fonts load from it, loads the
+fonts into FONT_CACHE and freezes the garbage collector's view of
+everything allocated so far (Python 3.7 and later), so the small objects
+left per font aren't copied by collections in the workers either.
+"""
+
+from __future__ import unicode_literals
+
+import gc
+import mmap
+
+from . import FONT_CACHE, FigletFont
+from .bundle import (FontArchive, currentArchive, packArchive, packFont,
+                     stores)
+
+
+class SharedFontStore(FontArchive):
+    """
+    Fonts packed into one anonymous shared memory mapping. fonts is a list
+    of font names or 'all'. failed maps each font that couldn't be loaded
+    to the exception it raised.
+    """
+
+    def __init__(self, fonts='all'):
+        if fonts == 'all':
+            fonts = sorted(FigletFont.getFonts())
+        self.failed = {}
+        entries = []
+        for font in fonts:
+            try:
+                archive = currentArchive(font)
+                if archive is not None:
+                    # Already packed, copy it as it is
+                    entry = archive.entry(font)
+                else:
+                    entry = packFont(FigletFont(font))
+            except Exception as e:
+                self.failed[font] = e
+                continue
+            entries.append((font, 0, entry))
+
+        data = packArchive(entries)
+        buffer = mmap.mmap(-1, len(data))
+        buffer.write(data)
+        FontArchive.__init__(self, '<shared font store>', buffer)
+
+    def install(self):
+        """
+        Have fonts in the store load from it, dropping any copies
+        FONT_CACHE already holds
+        """
+        if self not in stores:
+            stores.insert(0, self)
+        FONT_CACHE.discard(lambda key: key[0] in self.fonts)
+        return self
+
+    def uninstall(self):
+        if self in stores:
+            stores.remove(self)
+        FONT_CACHE.discard(lambda key: key[0] in self.fonts)
+
+    def preload(self):
+        """
+        Load every font of the store into FONT_CACHE, raising its capacity
+        to hold them
+        """
+        FONT_CACHE.reserve(len(self.fonts))
+        for font in sorted(self.fonts):
+            FONT_CACHE.getFont(font)
+        return self
+
+
+def freeze():
+    """
+    Move every object tracked so far out of reach of the garbage
+    collector, so collections in forked workers don't write to them
+    """
+    gc.collect()
+    if hasattr(gc, 'freeze'):
+        gc.freeze()
+
+
+def prefork(fonts='all'):
+    """
+    Build, install and preload a SharedFontStore of fonts and freeze the
+    garbage collector, ready to fork
+    """
+    store = SharedFontStore(fonts).install().preload()
+    freeze()
+    return store
@@ -5,6 +5,7 @@ import os.path
 import sys
 from optparse import OptionParser
 from pyfiglet import Figlet
+from pyfiglet.test_layout import CASES
 from subprocess import Popen, PIPE
 
 __version__ = '0.1'
@@ -72,6 +73,39 @@ def main():
             dump(outputFiglet)
             raw_input()
 
+    # Line layout, see test_layout.py
+    for font, width, options, text, expected in CASES:
+        name = '%s -w %d %r %r' % (font, width, options, text)
+        outputPyfiglet = Figlet(font=font, width=width,
+                                **options).renderText(text)
+
+        cmd = ['figlet', '-d', 'pyfiglet/fonts', '-f', font,
+               '-w', str(width)]
+        if options.get('direction') == 'right-to-left':
+            cmd.append('-R')
+        if options.get('paragraph'):
+            cmd.append('-p')
+        cmd.append(text)
+
+        p = Popen(cmd, bufsize=1, stdout=PIPE)
+        outputFiglet = p.communicate()[0].decode('UTF-8')
+
+        if outputPyfiglet == outputFiglet:
+            print('[OK] %s' % name)
+            ok += 1
+            continue
+
+        print('[FAIL] %s' % name)
+        fail += 1
+        failed.append(name)
+
+        if opts.show is True:
+            print('[PYTHON] *** %s\n\n' % name)
+            dump(outputPyfiglet)
+            print('[FIGLET] *** %s\n\n' % name)
+            dump(outputFiglet)
+            raw_input()
+
     print('OK = %d, FAIL = %d' % (ok, fail))
     if len(failed) > 0:
         print('FAILED = %s' % repr(failed))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+AsyncFiglet shares font loads between coroutines and keeps long renders
+off the event loop
+
+Written without async def, so that the module compiles on every Python
+the package supports; the tests only run on 3.7 and later.
+"""
+
+from __future__ import unicode_literals
+
+import sys
+import unittest
+
+from pyfiglet import FONT_CACHE, FontNotFound, figlet_format
+
+if sys.version_info >= (3, 7):
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+    from pyfiglet import aio
+else:
+    aio = None
+
+
+def run(*coroutines):
+    """
+    Run coroutines concurrently on a new event loop, returning their
+    tasks once all are done
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        tasks = [loop.create_task(coroutine) for coroutine in coroutines]
+        loop.run_until_complete(asyncio.wait(tasks))
+        return tasks
+    finally:
+        loop.close()
+
+
+@unittest.skipIf(aio is None, 'needs Python 3.7')
+class AsyncFigletTest(unittest.TestCase):
+
+    def setUp(self):
+        FONT_CACHE.clear()
+
+    def tearDown(self):
+        FONT_CACHE.clear()
+
+    def test_shared_load(self):
+        figlet = aio.AsyncFiglet()
+        tasks = run(*[figlet.loadFont('slant') for i in range(5)])
+        fonts = [task.result() for task in tasks]
+        self.assertTrue(all(Font is fonts[0] for Font in fonts))
+        self.assertEqual(FONT_CACHE.misses, 1)
+        self.assertEqual(figlet._loading, {})
+        # Once loaded, it comes from FONT_CACHE
+        self.assertIs(run(figlet.loadFont('slant'))[0].result(), fonts[0])
+        self.assertEqual((FONT_CACHE.hits, FONT_CACHE.misses), (1, 1))
+
+    def test_failed_load(self):
+        figlet = aio.AsyncFiglet()
+        tasks = run(*[figlet.loadFont('nosuchfont') for i in range(3)])
+        for task in tasks:
+            self.assertIsInstance(task.exception(), FontNotFound)
+        self.assertEqual(FONT_CACHE.misses, 1)
+        self.assertEqual(figlet._loading, {})
+        # The failure isn't kept, the next call loads again
+        task, = run(figlet.loadFont('nosuchfont'))
+        self.assertIsInstance(task.exception(), FontNotFound)
+        self.assertEqual(FONT_CACHE.misses, 2)
+
+    def test_start(self):
+        figlet = aio.AsyncFiglet(preload=['slant', 'nosuchfont'])
+        task, = run(figlet.start())
+        self.assertIsInstance(task.exception(), FontNotFound)
+        # The other fonts were loaded all the same
+        self.assertIn(('standard', None, False), FONT_CACHE)
+        self.assertIn(('slant', None, False), FONT_CACHE)
+
+    def test_inline_limit(self):
+        submitted = []
+
+        class Executor(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                submitted.append(args[-1])
+                return ThreadPoolExecutor.submit(self, fn, *args, **kwargs)
+
+        executor = Executor(1)
+        self.addCleanup(executor.shutdown)
+        figlet = aio.AsyncFiglet(executor=executor, inlineLimit=5,
+                                 width=120)
+        texts = ['hi', 'hello', 'hello world', 'hi there']
+        tasks = run(*[figlet.renderText(text, font='slant')
+                      for text in texts])
+        self.assertEqual([task.result() for task in tasks],
+                         [figlet_format(text, 'slant', width=120)
+                          for text in texts])
+        self.assertEqual(sorted(submitted), ['hello world', 'hi there'])
+
+
+if __name__ == '__main__':
+    unittest.main()
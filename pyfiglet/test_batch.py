@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Batch rendering gives the same strings as rendering one text at a time
+"""
+
+from __future__ import unicode_literals
+
+import unittest
+
+import pyfiglet
+from pyfiglet import Figlet
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = None
+
+TEXTS = [
+    'web-0001.prod.example.com',
+    'web-0002.prod.example.com',
+    # Duplicates, and prefixes of other texts
+    'web-0001.prod.example.com',
+    'web-0001',
+    'web',
+    '',
+    # Wrapped at words and inside words
+    'hello world foo bar baz',
+    'hello world foo bar',
+    'hello there',
+    'averyveryverylongwordindeed',
+    'a  b   c    d',
+    # Newlines, blank lines and paragraphs
+    'one\ntwo',
+    'one\ntwo\n\nthree\n four',
+    'one\n',
+    '\n',
+    # Tabs and control characters
+    'tab\there',
+    'bell\x07 and delete\x7f',
+]
+
+OPTIONS = [
+    {},
+    {'width': 20},
+    {'width': 20, 'paragraph': True},
+    {'width': 30, 'direction': 'right-to-left', 'justify': 'center'},
+    {'font': 'term', 'width': 8},
+    {'font': 'banner', 'width': 12, 'justify': 'right'},
+]
+
+
+class BatchTest(unittest.TestCase):
+
+    def test_batch(self):
+        for options in OPTIONS:
+            f = Figlet(**options)
+            self.assertEqual(f.renderBatch(TEXTS),
+                             [f.renderText(text) for text in TEXTS],
+                             options)
+
+    def test_engine(self):
+        f = Figlet(width=40)
+        self.assertEqual(f.engine.renderBatch(TEXTS),
+                         [f.engine.render(text) for text in TEXTS])
+        self.assertEqual(f.engine.renderBatch([]), [])
+
+
+class ParallelTest(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.f = Figlet(width=40)
+        renderParallel = self.f.renderParallel
+
+        def countingRenderParallel(texts, jobs):
+            self.calls.append(len(texts))
+            return renderParallel(texts, jobs)
+        self.f.renderParallel = countingRenderParallel
+
+    def test_small_batch(self):
+        # Not worth starting processes for
+        texts = ['host-%d' % i for i in range(pyfiglet.PARALLEL_MIN_TEXTS - 1)]
+        self.assertEqual(self.f.renderBatch(texts, jobs=2),
+                         [self.f.renderText(text) for text in texts])
+        self.assertEqual(self.calls, [])
+
+    @unittest.skipIf(ProcessPoolExecutor is None, 'no concurrent.futures')
+    def test_jobs(self):
+        texts = ['host-%d %s' % (i, TEXTS[i % len(TEXTS)])
+                 for i in range(pyfiglet.PARALLEL_MIN_TEXTS)]
+        # Duplicates, out of order
+        texts += texts[::-7]
+        expected = [self.f.renderText(text) for text in texts]
+        rendered = self.f.renderBatch(texts, jobs=2)
+        self.assertEqual(self.calls, [pyfiglet.PARALLEL_MIN_TEXTS])
+        self.assertEqual(rendered, expected)
+        self.assertTrue(all(isinstance(result, pyfiglet.FigletString)
+                            for result in rendered))
+
+    @unittest.skipIf(ProcessPoolExecutor is None, 'no concurrent.futures')
+    def test_render_parallel(self):
+        for options in OPTIONS:
+            f = Figlet(**options)
+            self.assertEqual(f.renderParallel(TEXTS, 3),
+                             [f.renderText(text) for text in TEXTS],
+                             options)
+
+    def test_render_chunk(self):
+        # Before python 3.7 there is no pool initializer and the options
+        # come with each chunk
+        worker = pyfiglet._worker
+        self.addCleanup(setattr, pyfiglet, '_worker', worker)
+        pyfiglet._worker = None
+        f = Figlet(font='slant', width=30, direction='right-to-left',
+                   paragraph=True)
+        options = (f.font, f._direction, f._justify, f.width, f.fontkwargs,
+                   f.paragraph, f.backend)
+        self.assertEqual(pyfiglet._renderChunk((options, TEXTS)),
+                         [f.renderText(text) for text in TEXTS])
+        self.assertEqual(pyfiglet._worker.font, 'slant')
+
+
+if __name__ == '__main__':
+    unittest.main()
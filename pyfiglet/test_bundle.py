@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Fonts loaded from a compiled font archive match the parsed font files
+"""
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from pyfiglet import FigletFont, bundle, get_res_path
+
+ATTRIBUTES = ['height', 'baseLine', 'maxLength', 'oldLayout',
+              'commentLines', 'printDirection', 'smushMode', 'hardBlank',
+              'comment']
+
+
+class ArchiveTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.mkdtemp()
+        path = os.path.join(cls.tmp, bundle.ARCHIVE)
+        bundle.compileArchive(get_res_path('pyfiglet.fonts', ''), path)
+        cls.archive = bundle.FontArchive(path)
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.archive
+        shutil.rmtree(cls.tmp)
+
+    def archivedFont(self, font):
+        archive = self.archive
+
+        class ArchivedFont(FigletFont):
+            def loadArchivedFont(self):
+                archive.loadFont(self)
+                return True
+        return ArchivedFont(font)
+
+    def assertSameFonts(self):
+        self.assertTrue(self.archive.fonts)
+        for font in sorted(self.archive.fonts):
+            parsed = FigletFont(font, data=FigletFont.preloadFont(font))
+            archived = self.archivedFont(font)
+            for name in ATTRIBUTES:
+                self.assertEqual(getattr(archived, name),
+                                 getattr(parsed, name), '%s %s' % (font, name))
+            self.assertEqual(sorted(archived.chars), sorted(parsed.chars),
+                             font)
+            for code in parsed.chars:
+                self.assertEqual(archived.chars[code], parsed.chars[code],
+                                 '%s %d' % (font, code))
+                self.assertEqual(archived.width[code], parsed.width[code],
+                                 '%s %d' % (font, code))
+
+    def test_fonts(self):
+        self.assertSameFonts()
+
+    def test_fonts_unpacked(self):
+        # The tables as they are read on big endian hosts
+        native = bundle._NATIVE
+        bundle._NATIVE = False
+        try:
+            self.assertSameFonts()
+        finally:
+            bundle._NATIVE = native
+
+    def test_fonts_old_buffer(self):
+        # Python 2's mmap can't be wrapped in a memoryview, so the archive
+        # is sliced and unpacked directly
+        view = self.archive.view
+        native = bundle._NATIVE
+        self.archive.view = self.archive.buffer
+        bundle._NATIVE = False
+        try:
+            self.assertSameFonts()
+        finally:
+            self.archive.view = view
+            bundle._NATIVE = native
+
+    def test_every_valid_font(self):
+        self.assertEqual(set(self.archive.fonts), set(FigletFont.getFonts()))
+
+
+class BrokenArchiveTest(unittest.TestCase):
+
+    def setUp(self):
+        self.archive = bundle._archive
+        self.FontArchive = bundle.FontArchive
+
+    def tearDown(self):
+        bundle._archive = self.archive
+        bundle.FontArchive = self.FontArchive
+
+    def test_unreadable_archive(self):
+        def FontArchive(path):
+            raise TypeError('cannot make memory view')
+        bundle._archive = None
+        bundle.FontArchive = FontArchive
+        self.assertIsNone(bundle.getArchive())
+        self.assertTrue(FigletFont('standard').chars)
+
+    def test_truncated_entry(self):
+        path = get_res_path('pyfiglet.fonts', 'standard.flf')
+        entry = FigletFont('standard', data=FigletFont.preloadFont(
+            'standard'))
+        blob = bundle.packFont(entry)
+        archive = bundle.FontArchive(path, buffer=bundle.packArchive(
+            [('standard', os.path.getsize(path), blob[:16])]))
+        bundle._archive = archive
+        font = FigletFont('standard')
+        for name in ATTRIBUTES:
+            self.assertEqual(getattr(font, name), getattr(entry, name))
+        self.assertEqual(dict(font.chars), dict(entry.chars))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Bounded caches of parsed fonts and rendered output
+"""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from pyfiglet import Figlet, FontCache, LRUCache, RenderCache
+
+
+class SizedCache(LRUCache):
+    """
+    Values are their own size in bytes
+    """
+
+    def sizeOf(self, key, value):
+        return value
+
+
+class LRUCacheTest(unittest.TestCase):
+
+    def test_capacity(self):
+        cache = LRUCache(capacity=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        # Reading a makes b the least recently used
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.evictions, 1)
+        # Putting a key again replaces it without evicting
+        cache.put('c', 4)
+        self.assertEqual(cache.get('c'), 4)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        cache.capacity = 1
+        self.assertEqual(list(cache._data), ['c'])
+
+    def test_bytes(self):
+        cache = SizedCache(capacity=10, maxBytes=10)
+        cache.put('a', 4)
+        cache.put('b', 4)
+        self.assertEqual(cache.bytes, 8)
+        cache.put('c', 4)
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.bytes, 8)
+        # One big value pushes out as many as it needs to
+        cache.put('d', 9)
+        self.assertEqual(list(cache._data), ['d'])
+        self.assertEqual(cache.bytes, 9)
+        self.assertEqual(cache.evictions, 3)
+        cache.put('d', 1)
+        self.assertEqual(cache.bytes, 1)
+        cache.put('e', 2)
+        cache.maxBytes = 2
+        self.assertEqual(list(cache._data), ['e'])
+        self.assertEqual(cache.bytes, 2)
+
+    def test_oversize(self):
+        # A value bigger than maxBytes is not cached and evicts nothing
+        cache = SizedCache(capacity=10, maxBytes=10)
+        cache.put('a', 4)
+        cache.put('b', 11)
+        self.assertNotIn('b', cache)
+        self.assertEqual(list(cache._data), ['a'])
+        self.assertEqual(cache.bytes, 4)
+        self.assertEqual(cache.evictions, 0)
+        # nor does it keep an older value for the same key
+        cache.put('a', 11)
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.bytes, 0)
+
+    def test_discard(self):
+        cache = SizedCache()
+        for key, value in (('a1', 1), ('b2', 2), ('a3', 3)):
+            cache.put(key, value)
+        cache.discard(lambda key: key.startswith('a'))
+        self.assertEqual(list(cache._data), ['b2'])
+        self.assertEqual(cache.bytes, 2)
+        self.assertEqual(cache.evictions, 0)
+        cache.discard(lambda key: True)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.bytes, 0)
+
+    def test_stats(self):
+        cache = SizedCache(capacity=2, maxBytes=100)
+        self.assertEqual(cache.stats()['hitRate'], 0.0)
+        cache.put('a', 5)
+        cache.get('a')
+        cache.get('a')
+        cache.get('b')
+        cache.put('b', 6)
+        cache.put('c', 7)
+        self.assertEqual(cache.stats(), {
+            'size': 2,
+            'capacity': 2,
+            'bytes': 13,
+            'maxBytes': 100,
+            'hits': 2,
+            'misses': 1,
+            'hitRate': 2.0 / 3,
+            'evictions': 1,
+        })
+        cache.clear()
+        stats = cache.stats()
+        self.assertEqual((stats['size'], stats['bytes'], stats['hits'],
+                          stats['misses'], stats['evictions']),
+                         (0, 0, 0, 0, 0))
+
+
+class FontCacheTest(unittest.TestCase):
+
+    def test_reserve(self):
+        cache = FontCache(capacity=3)
+        cache.put(('a', None, False), 1)
+        cache.put(('b', None, False), 2)
+        cache.reserve(1)
+        self.assertEqual(cache.capacity, 3)
+        cache.reserve(4)
+        self.assertEqual(cache.capacity, 6)
+        for font in 'cdef':
+            cache.put((font, None, False), 3)
+        self.assertEqual(len(cache), 6)
+        self.assertEqual(cache.stats()['evictions'], 0)
+
+    def test_keys(self):
+        cache = FontCache(capacity=4)
+        standard = cache.getFont('standard')
+        self.assertIs(cache.getFont('standard'), standard)
+        self.assertIs(cache.getFont(font='standard', lazy=False), standard)
+        others = [cache.getFont('slant'),
+                  cache.getFont('standard', smushMode=0),
+                  cache.getFont('standard', lazy=True)]
+        for other in others:
+            self.assertIsNot(other, standard)
+        self.assertEqual(others[1].smushMode, 0)
+        self.assertEqual(sorted(cache._data, key=repr), [
+            ('slant', None, False),
+            ('standard', 0, False),
+            ('standard', None, False),
+            ('standard', None, True),
+        ])
+        self.assertEqual(cache.stats()['hits'], 2)
+
+    def test_eviction(self):
+        cache = FontCache(capacity=2)
+        standard = cache.getFont('standard')
+        cache.getFont('slant')
+        cache.getFont('term')
+        self.assertNotIn(('standard', None, False), cache)
+        self.assertIsNot(cache.getFont('standard'), standard)
+        self.assertEqual(cache.evictions, 2)
+
+
+class RenderCacheTest(unittest.TestCase):
+
+    def test_bytes(self):
+        cache = RenderCache()
+        f = Figlet(renderCache=cache)
+        result = f.renderText('hello')
+        key, = cache._data
+        self.assertEqual(key[-1], 'hello')
+        self.assertEqual(cache.bytes, cache.sizeOf(key, result))
+        # A render bigger than the budget is returned but not kept
+        cache.maxBytes = cache.bytes - 1
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(f.renderText('hello'), result)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.bytes, 0)
+
+    def test_font_keys(self):
+        # Instances sharing a cache never get each other's renders
+        cache = RenderCache()
+        standard = Figlet(renderCache=cache)
+        slant = Figlet(font='slant', renderCache=cache)
+        wide = Figlet(fontkwargs={'smushMode': 0}, renderCache=cache)
+        outputs = [f.renderText('hello') for f in (standard, slant, wide)]
+        self.assertEqual(len(set(outputs)), 3)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual([f.renderText('hello')
+                          for f in (standard, slant, wide)], outputs)
+        self.assertEqual(cache.hits, 3)
+
+    def test_set_font(self):
+        # Switching font leaves the renders made with the old one cached
+        cache = RenderCache()
+        f = Figlet(renderCache=cache)
+        standard = f.renderText('hello')
+        f.setFont(font='slant')
+        slant = f.renderText('hello')
+        self.assertNotEqual(slant, standard)
+        self.assertEqual(len(cache), 2)
+        f.setFont(font='standard')
+        self.assertEqual(f.renderText('hello'), standard)
+        self.assertEqual(cache.hits, 1)
+        f.setFont(font='standard', smushMode=0)
+        self.assertNotEqual(f.renderText('hello'), standard)
+        self.assertEqual(cache.hits, 1)
+
+    def test_invalidate(self):
+        cache = RenderCache()
+        for font in ('standard', 'slant'):
+            Figlet(font=font, renderCache=cache).renderBatch(['a', 'b'])
+        Figlet(fontkwargs={'smushMode': 0},
+               renderCache=cache).renderText('a')
+        cache.invalidate('standard', Figlet().Font.smushMode)
+        self.assertEqual(sorted((key[0], key[1] == 0, key[-1])
+                                for key in cache._data),
+                         [('slant', False, 'a'), ('slant', False, 'b'),
+                          ('standard', True, 'a')])
+
+
+if __name__ == '__main__':
+    unittest.main()
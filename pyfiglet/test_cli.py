@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Rendering a stream from the command line ends at the end of the stream,
+text or binary, and gives what rendering the whole text at once does
+"""
+
+from __future__ import unicode_literals
+
+import io
+import unittest
+
+from pyfiglet import Figlet
+from pyfiglet.cli import readChunks, renderStream
+
+TEXTS = [
+    'hello\nworld\n',
+    'no newline at the end',
+    'windows\r\nline endings\r\n',
+    'blank\n\n\nlines\n',
+    'hello wörld\n',
+    '',
+]
+
+
+class EndOfStream(object):
+    """
+    Fail, rather than loop forever, when read from again after the end
+    """
+
+    def readline(self):
+        line = super(EndOfStream, self).readline()
+        if not line:
+            self.ends = getattr(self, 'ends', 0) + 1
+            if self.ends > 1:
+                raise AssertionError('read past the end of the stream')
+        return line
+
+
+class TextStream(EndOfStream, io.StringIO):
+    pass
+
+
+class BinaryStream(EndOfStream, io.BytesIO):
+    pass
+
+
+def streams(text):
+    yield TextStream(text)
+    yield BinaryStream(text.encode('UTF-8'))
+    # sys.stdin: text, read through its binary buffer
+    yield io.TextIOWrapper(BinaryStream(text.encode('UTF-8')), 'UTF-8')
+
+
+class StreamTest(unittest.TestCase):
+
+    def test_read_chunks(self):
+        for text in TEXTS:
+            for stream in streams(text):
+                self.assertEqual(''.join(readChunks(stream)),
+                                 text.replace('\r\n', '\n'),
+                                 type(stream).__name__)
+
+    def test_render_stream(self):
+        f = Figlet(width=40)
+        for text in TEXTS:
+            expected = f.renderText(text.replace('\r\n', '\n'))
+            for stream in streams(text):
+                out = io.BytesIO()
+                self.assertEqual(renderStream(f, stream, out=out), 0)
+                self.assertEqual(out.getvalue().decode('UTF-8'), expected,
+                                 '%s %r' % (type(stream).__name__, text))
+
+
+if __name__ == '__main__':
+    unittest.main()
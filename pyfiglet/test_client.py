@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Command lines the daemon client answers, its default address and the
+checks that keep other users from answering in the daemon's place
+"""
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+
+import pyfiglet_client
+from pyfiglet import FigletError, figlet_format
+
+# Command line -> request, None where it has to run in-process
+COMMAND_LINES = [
+    (['hello'], {'text': 'hello'}),
+    (['hello', 'world'], {'text': 'hello world'}),
+    (['-f', 'slant', 'hi'], {'font': 'slant', 'text': 'hi'}),
+    (['-fslant', 'hi'], {'font': 'slant', 'text': 'hi'}),
+    (['--font=slant', 'hi'], {'font': 'slant', 'text': 'hi'}),
+    (['--font', 'slant', 'hi'], {'font': 'slant', 'text': 'hi'}),
+    # Options and text interspersed, as optparse allows
+    (['hi', '-w', '40', 'there'], {'width': 40, 'text': 'hi there'}),
+    (['-w40', 'hi'], {'width': 40, 'text': 'hi'}),
+    (['--width=40', 'hi'], {'width': 40, 'text': 'hi'}),
+    # Bundled flags, the last one may take a value
+    (['-rF', 'hi'], {'reverse': True, 'flip': True, 'text': 'hi'}),
+    (['-rf', 'slant', 'hi'], {'reverse': True, 'font': 'slant',
+                              'text': 'hi'}),
+    (['-rfslant', 'hi'], {'reverse': True, 'font': 'slant', 'text': 'hi'}),
+    (['-pC', 'hi'], {'paragraph': True, 'client': True, 'text': 'hi'}),
+    # The command ignores -s 0
+    (['-s', '0', 'hi'], {'text': 'hi'}),
+    (['-s', '64', 'hi'], {'smushMode': 64, 'text': 'hi'}),
+    (['-D', 'right-to-left', '-j', 'center', 'hi'],
+     {'direction': 'right-to-left', 'justify': 'center', 'text': 'hi'}),
+    (['--address', '/tmp/x.sock', 'hi'],
+     {'address': '/tmp/x.sock', 'text': 'hi'}),
+    # After --, and a lone -, everything is text
+    (['--', '-f', 'x'], {'text': '-f x'}),
+    (['-', 'x'], {'text': '- x'}),
+    # Errors, options the daemon can't answer and no text at all
+    (['-w', 'wide', 'hi'], None),
+    (['-w=40', 'hi'], None),
+    (['-D', 'upwards', 'hi'], None),
+    (['-f'], None),
+    (['-l'], None),
+    (['-rl', 'hi'], None),
+    (['--list_fonts'], None),
+    (['--fon', 'slant', 'hi'], None),
+    (['-f', 'slant'], None),
+    ([], None),
+]
+
+
+class ParseArgsTest(unittest.TestCase):
+
+    def test_command_lines(self):
+        for args, request in COMMAND_LINES:
+            self.assertEqual(pyfiglet_client.parseArgs(args), request,
+                             ' '.join(args))
+
+
+class EnvironmentTest(unittest.TestCase):
+
+    VARIABLES = (pyfiglet_client.ADDRESS_VARIABLE, 'XDG_RUNTIME_DIR',
+                 'TMPDIR', 'TEMP', 'TMP')
+
+    def setUp(self):
+        self.environ = dict((name, os.environ.pop(name, None))
+                            for name in self.VARIABLES)
+
+    def tearDown(self):
+        for name, value in self.environ.items():
+            os.environ.pop(name, None)
+            if value is not None:
+                os.environ[name] = value
+
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'no Unix sockets')
+class AddressTest(EnvironmentTest):
+
+    def test_variable(self):
+        os.environ[pyfiglet_client.ADDRESS_VARIABLE] = '8970'
+        self.assertEqual(pyfiglet_client.defaultAddress(), '8970')
+
+    def test_runtime_dir(self):
+        os.environ['XDG_RUNTIME_DIR'] = '/run/user/1000'
+        self.assertEqual(pyfiglet_client.defaultAddress(),
+                         '/run/user/1000/pyfiglet.sock')
+
+    def test_private_dir(self):
+        os.environ['TMPDIR'] = '/var/tmp'
+        self.assertEqual(pyfiglet_client.defaultAddress(),
+                         '/var/tmp/pyfiglet-%d/pyfiglet.sock' % os.getuid())
+
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX') and hasattr(os, 'getuid'),
+                     'no Unix sockets')
+class SocketTest(EnvironmentTest):
+
+    def setUp(self):
+        EnvironmentTest.setUp(self)
+        self.tmp = tempfile.mkdtemp()
+        os.environ['TMPDIR'] = self.tmp
+        self.dir = pyfiglet_client.runtimeDir()
+        self.path = pyfiglet_client.defaultAddress()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+        EnvironmentTest.tearDown(self)
+
+    def listen(self):
+        os.mkdir(self.dir, 0o700)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.addCleanup(sock.close)
+        sock.bind(self.path)
+        sock.listen(1)
+        return sock
+
+    def test_own_socket(self):
+        self.listen()
+        pyfiglet_client.checkSocket(self.path)
+
+    def test_not_a_socket(self):
+        os.mkdir(self.dir, 0o700)
+        open(self.path, 'w').close()
+        with self.assertRaises(EnvironmentError):
+            pyfiglet_client.checkSocket(self.path)
+
+    def test_shared_dir(self):
+        self.listen()
+        os.chmod(self.dir, 0o777)
+        with self.assertRaises(EnvironmentError):
+            pyfiglet_client.checkSocket(self.path)
+        # Sticky directories like /tmp are fine
+        os.chmod(self.dir, 0o1777)
+        pyfiglet_client.checkSocket(self.path)
+
+    @unittest.skipUnless(os.getuid() == 0, 'needs root to chown')
+    def test_other_users(self):
+        self.listen()
+        os.chown(self.path, 12345, -1)
+        with self.assertRaises(EnvironmentError):
+            pyfiglet_client.checkSocket(self.path)
+        with self.assertRaises(pyfiglet_client.Unavailable):
+            pyfiglet_client.exchange({'text': 'hi'}, self.path, 1)
+
+        from pyfiglet.server import RenderServer
+        with self.assertRaises(FigletError):
+            RenderServer(self.path)
+        self.assertTrue(os.path.exists(self.path))
+
+        os.chown(self.path, 0, -1)
+        os.chown(self.dir, 12345, -1)
+        with self.assertRaises(FigletError):
+            RenderServer(self.path)
+
+    def test_round_trip(self):
+        from pyfiglet.server import RenderServer
+        server = RenderServer(self.path)
+        self.assertEqual(os.stat(self.dir).st_mode & 0o777, 0o700)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            reply = pyfiglet_client.exchange(
+                {'text': 'hi', 'font': 'slant'}, timeout=5)
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+        self.assertEqual(reply['output'], figlet_format('hi', 'slant'))
+
+
+if __name__ == '__main__':
+    unittest.main()
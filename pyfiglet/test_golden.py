@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Check the rendering engine against the golden corpus in golden.json.gz
+
+Cases the baseline engine renders are checked against its output, the
+rest against a snapshot of pyfiglet's own; see pyfiglet.golden. A failure
+means the output changed, not that it stopped matching C figlet.
+
+One test per font, so pytest-xdist can spread them over processes:
+
+    python -m pytest pyfiglet/test_golden.py -n auto
+"""
+
+from __future__ import unicode_literals
+
+import os
+
+import pytest
+
+from pyfiglet import Figlet, golden
+
+if not os.path.exists(golden.CORPUS):
+    # Installed packages don't carry the corpus, only the sdist does
+    pytest.skip('no golden corpus', allow_module_level=True)
+
+CORPUS = golden.load()
+
+
+@pytest.mark.parametrize('font', sorted(CORPUS['fonts']))
+def test_font(font):
+    expected = CORPUS['fonts'][font]
+    snapshot = set(CORPUS['snapshot'].get(font, ()))
+    for n, (i, layout, direction) in enumerate(CORPUS['cases']):
+        text, width, justify = CORPUS['texts'][i]
+        smushMode = golden.LAYOUTS[layout][0]
+        fontkwargs = {} if smushMode is None else {'smushMode': smushMode}
+        f = Figlet(font=font, direction=direction, justify=justify,
+                   width=width, fontkwargs=fontkwargs)
+        source = 'snapshot' if n in snapshot else 'reference'
+        assert f.renderText(text) == expected[n], '%s %s %s %r (%s: %s)' % (
+            font, layout, direction, text, source,
+            CORPUS['generators'][source])
+
+
+def test_corpus():
+    # The corpus was made with this module's texts and cases
+    assert CORPUS['version'] == golden.VERSION
+    assert CORPUS['texts'] == [list(text) for text in golden.TEXTS]
+    assert CORPUS['cases'] == [list(case) for case in golden.cases()]
+
+
+def test_every_font():
+    assert sorted(CORPUS['fonts']) == sorted(Figlet().getFonts())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Parity of the NumPy glyph-grid backend with the python engine
+"""
+
+from __future__ import unicode_literals
+
+import string
+import unittest
+
+from pyfiglet import Figlet, FigletError, FigletFont
+from pyfiglet.test_batch import TEXTS as BATCH_TEXTS
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+TEXTS = [
+    string.printable[:95],
+    'Hello, World! /\\ []{}()<>|_ XY',
+    '\xc4\xd6\xdc\xe4\xf6\xfc\xdf',
+]
+
+# Default layout, full width, kerning, universal smushing, all rules
+SMUSH_MODES = [None, 0, 64, 128, 191]
+
+
+def renderers(font, direction, smushMode, **kwargs):
+    fontkwargs = {} if smushMode is None else {'smushMode': smushMode}
+    return [Figlet(font=font, direction=direction, fontkwargs=fontkwargs,
+                   backend=backend, **kwargs)
+            for backend in ('python', 'numpy')]
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class GridParityTest(unittest.TestCase):
+
+    def assertSameRender(self, python, grid, text, msg):
+        try:
+            expected = python.renderText(text)
+        except Exception as e:
+            with self.assertRaises(type(e), msg=msg):
+                grid.renderText(text)
+            return
+        self.assertEqual(grid.renderText(text), expected, msg)
+
+    def test_fonts(self):
+        for font in sorted(FigletFont.getFonts()):
+            for direction in ('left-to-right', 'right-to-left'):
+                for smushMode in SMUSH_MODES:
+                    python, grid = renderers(font, direction, smushMode,
+                                             width=100)
+                    for text in TEXTS:
+                        self.assertSameRender(
+                            python, grid, text,
+                            '%s %s %r' % (font, direction, smushMode))
+
+    def test_layout(self):
+        text = ('wrap me please, this is long text\n'
+                'with a newline\n\n  and an indented paragraph')
+        for font in ('standard', 'banner3', 'doh', 'slant', 'term'):
+            for direction in ('left-to-right', 'right-to-left'):
+                for paragraph in (False, True):
+                    python, grid = renderers(font, direction, None,
+                                             width=60, paragraph=paragraph)
+                    self.assertSameRender(
+                        python, grid, text,
+                        '%s %s %r' % (font, direction, paragraph))
+
+    def test_narrow(self):
+        # Characters wider than the line are output cut down to it
+        for direction in ('left-to-right', 'right-to-left'):
+            for width in (2, 8, 12):
+                python, grid = renderers('standard', direction, None,
+                                         width=width)
+                self.assertSameRender(python, grid, 'iWi MW',
+                                      '%s %d' % (direction, width))
+
+    def test_batch(self):
+        for direction in ('left-to-right', 'right-to-left'):
+            python, grid = renderers('standard', direction, None, width=20)
+            self.assertEqual(grid.renderBatch(BATCH_TEXTS),
+                             python.renderBatch(BATCH_TEXTS), direction)
+
+
+class BackendTest(unittest.TestCase):
+
+    def test_unknown_backend(self):
+        with self.assertRaises(FigletError):
+            Figlet(backend='fortran')
+
+
+if __name__ == '__main__':
+    unittest.main()
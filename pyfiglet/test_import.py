@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+"""
+Import-time budget of the pyfiglet package
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+# Microseconds `import pyfiglet` may take, as reported by -X importtime.
+# It takes about 5ms here, and took 15ms before the command line and
+# regexes were deferred; the ceiling is generous so loaded machines don't
+# flake, and the environment variable can set a tighter one.
+BUDGET = 20000
+BUDGET_VARIABLE = 'PYFIGLET_IMPORT_BUDGET'
+
+# Modules only the command line, font discovery, preloading and the
+# daemon need
+DEFERRED = ['optparse', 're', 'json', 'threading', 'pyfiglet.cli',
+            'pyfiglet.manifest', 'pyfiglet.bundle']
+
+
+def python(*args):
+    """
+    Run a fresh interpreter that can import this checkout of pyfiglet,
+    returning its stdout and stderr
+    """
+    env = dict(os.environ)
+    # Timing bytecode compilation would say nothing about the import
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env['PYTHONPATH'] = os.pathsep.join(
+        [root] + [p for p in [env.get('PYTHONPATH')] if p])
+    process = subprocess.Popen([sys.executable] + list(args), env=env,
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    out, err = process.communicate()
+    if process.returncode:
+        raise AssertionError(err.decode('UTF-8', 'replace'))
+    return out.decode('UTF-8'), err.decode('UTF-8')
+
+
+def importTime():
+    """
+    Cumulative microseconds of the pyfiglet line of -X importtime
+    """
+    out, err = python('-X', 'importtime', '-c', 'import pyfiglet')
+    for line in err.splitlines():
+        fields = [field.strip() for field in line.split('|')]
+        if len(fields) == 3 and fields[2] == 'pyfiglet':
+            return int(fields[1])
+    raise AssertionError('pyfiglet missing from:\n' + err)
+
+
+@unittest.skipIf(sys.version_info < (3, 7), '-X importtime needs 3.7')
+class ImportTimeTest(unittest.TestCase):
+
+    def test_budget(self):
+        budget = int(os.environ.get(BUDGET_VARIABLE) or BUDGET)
+        # Once to write bytecode, then the best of three
+        importTime()
+        best = min(importTime() for i in range(3))
+        self.assertLess(best, budget, 'import pyfiglet took %dus' % best)
+
+    def test_deferred(self):
+        out, err = python('-c', 'import sys, pyfiglet; '
+                                'print(" ".join(sys.modules))')
+        loaded = set(out.split())
+        for module in DEFERRED:
+            self.assertNotIn(module, loaded)
+
+    def test_lazy_api(self):
+        out, err = python('-c', 'import pyfiglet; '
+                                'print(pyfiglet.figlet_format("x", "term"))')
+        self.assertEqual(out, 'x\n\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
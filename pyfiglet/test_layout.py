@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Line layout matches C figlet: word wrapping at figlet -w N, newlines and
+figlet -p paragraphs
+
+The expected outputs are what figlet 2.2 prints for the same options,
+traced through its addchar(), splitline() and putstring(). pyfiglet/test.py
+runs the same cases against the figlet binary when it is installed.
+"""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from pyfiglet import Figlet
+
+# (font, width, options, text, expected output lines)
+CASES = [
+    # Broken after the last word that fits
+    ('term', 12, {}, 'hello world foo', ['hello world', 'foo']),
+    # and inside a word that doesn't, which moves on to the next line
+    ('term', 9, {}, 'hello world', ['hello', 'world']),
+    # A run of spaces at a break is dropped, before and after it
+    ('term', 7, {}, 'ab   cd   ef', ['ab', 'cd', 'ef']),
+    ('term', 7, {}, 'abcde   fg', ['abcde', 'fg']),
+    # A word wider than the line is broken between characters
+    ('term', 6, {}, 'a verylongword b', ['a', 'veryl', 'ongwo', 'rd b']),
+    # Newlines end lines, an empty line is output, leading spaces are kept
+    ('term', 80, {}, 'one\ntwo\n\nthree\n four',
+     ['one', 'two', '', 'three', ' four']),
+    # -p: a newline followed by text is a space, also at the end of input
+    ('term', 80, {'paragraph': True}, 'one\ntwo\n\nthree\n four',
+     ['one two', '', 'three', ' four']),
+    ('term', 80, {'paragraph': True}, 'one\ntwo\n', ['one two ']),
+    # Right-to-left lines are right justified to width - 1
+    ('term', 9, {'direction': 'right-to-left'}, 'hello world',
+     ['   olleh', '   dlrow']),
+    # Breaks account for smushing; the spaces before "you" are dropped
+    ('standard', 30, {}, 'Hi there  you', [
+        ' _   _ _ ',
+        '| | | (_)',
+        '| |_| | |',
+        '|  _  | |',
+        '|_| |_|_|',
+        '         ',
+        ' _   _                   ',
+        '| |_| |__   ___ _ __ ___ ',
+        "| __| '_ \\ / _ \\ '__/ _ \\",
+        '| |_| | | |  __/ | |  __/',
+        ' \\__|_| |_|\\___|_|  \\___|',
+        '                         ',
+        '                   ',
+        ' _   _  ___  _   _ ',
+        '| | | |/ _ \\| | | |',
+        '| |_| | (_) | |_| |',
+        ' \\__, |\\___/ \\__,_|',
+        ' |___/             ',
+    ]),
+    ('standard', 30, {'direction': 'right-to-left'}, 'Hi there  you', [
+        '                     _ _   _ ',
+        '                    (_) | | |',
+        '                    | | |_| |',
+        '                    | |  _  |',
+        '                    |_|_| |_|',
+        '                             ',
+        '                   _     _   ',
+        '      ___ _ __ ___| |__ | |_ ',
+        "     / _ \\ '__/ _ \\ '_ \\| __|",
+        '    |  __/ | |  __/ | | | |_ ',
+        '     \\___|_|  \\___|_| |_|\\__|',
+        '                             ',
+        '                             ',
+        '           _   _  ___  _   _ ',
+        '          | | | |/ _ \\| | | |',
+        '          | |_| | (_) | |_| |',
+        '           \\__,_|\\___/ \\__, |',
+        '                       |___/ ',
+    ]),
+    # A character wider than the line is output as it is in the font, cut
+    # down to width - 1 from the end it is read from
+    ('standard', 8, {}, 'iWi', [
+        ' _ ',
+        '(_)',
+        '| |',
+        '| |',
+        '|_|',
+        '   ',
+        ' __    ',
+        ' \\ \\   ',
+        '  \\ \\ /',
+        '   \\ V ',
+        '    \\_/',
+        '       ',
+        ' _ ',
+        '(_)',
+        '| |',
+        '| |',
+        '|_|',
+        '   ',
+    ]),
+    ('standard', 8, {'direction': 'right-to-left'}, 'iWi', [
+        '     _ ',
+        '    (_)',
+        '    | |',
+        '    | |',
+        '    |_|',
+        '       ',
+        '     __',
+        '    / /',
+        '/\\ / / ',
+        '  V /  ',
+        '/\\_/   ',
+        '       ',
+        '     _ ',
+        '    (_)',
+        '    | |',
+        '    | |',
+        '    |_|',
+        '       ',
+    ]),
+]
+
+
+def render(font, width, options, text):
+    return Figlet(font=font, width=width, **options).renderText(text)
+
+
+class LayoutTest(unittest.TestCase):
+
+    def test_cases(self):
+        for font, width, options, text, expected in CASES:
+            self.assertEqual(render(font, width, options, text),
+                             '\n'.join(expected) + '\n',
+                             '%s -w %d %r %r' % (font, width, options, text))
+
+    def test_iter_render(self):
+        for font, width, options, text, expected in CASES:
+            f = Figlet(font=font, width=width, **options)
+            self.assertEqual(list(f.iterRender(text)), expected)
+
+    def test_ragged_rows_cut(self):
+        # Rows of a font with ragged glyphs can run past the line, figlet
+        # cuts them to width - 1
+        text = ''.join(chr(i) for i in range(33, 127))
+        rows = render('dwhistled', 80, {}, text).split('\n')
+        self.assertTrue(rows)
+        self.assertTrue(all(len(row) <= 79 for row in rows))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Fonts loaded with lazy glyph decoding match fonts parsed up front
+"""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from pyfiglet import FigletFont
+
+
+def parsed(font, lazy):
+    return FigletFont(font, data=FigletFont.preloadFont(font), lazy=lazy)
+
+
+class LazyTest(unittest.TestCase):
+
+    def test_fonts(self):
+        for font in sorted(FigletFont.getFonts()):
+            eager = parsed(font, False)
+            lazy = parsed(font, True)
+            self.assertEqual(sorted(lazy.chars), sorted(eager.chars), font)
+            for code in eager.chars:
+                self.assertEqual(lazy.chars[code], eager.chars[code],
+                                 '%s %d' % (font, code))
+                self.assertEqual(lazy.width[code], eager.width[code],
+                                 '%s %d' % (font, code))
+
+    def test_missing(self):
+        font = parsed('standard', True)
+        for code in (31, 0x10ffff, -1, 'a', None):
+            self.assertNotIn(code, font.chars)
+            with self.assertRaises(KeyError):
+                font.chars[code]
+
+    def test_index(self):
+        # Glyphs are sliced out of the font's text, no lines are kept
+        font = parsed('mnemonic', True)
+        glyphs = font.chars.glyphs
+        self.assertIs(glyphs.data, font.data)
+        self.assertFalse(glyphs.decoded)
+        font.chars[ord('a')]
+        self.assertEqual(list(glyphs.decoded), [ord('a')])
+        self.assertFalse([value for value in vars(glyphs).values()
+                          if isinstance(value, list)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+The font manifest finds fonts added at runtime, reads fonts again when
+their size changes and answers font queries
+"""
+
+from __future__ import unicode_literals
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from pyfiglet import FigletFont, FontNotFound, get_res_path, manifest
+
+
+def copyFont(font, fontsDir, name=None):
+    shutil.copy(get_res_path('pyfiglet.fonts', '%s.flf' % font),
+                os.path.join(fontsDir, '%s.flf' % (name or font)))
+
+
+class FontManifestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.fontsDir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.fontsDir)
+        self.reads = []
+        readFont = manifest.readFont
+
+        def countingReadFont(fn):
+            self.reads.append(os.path.basename(fn))
+            return readFont(fn)
+        manifest.readFont = countingReadFont
+        self.addCleanup(setattr, manifest, 'readFont', readFont)
+
+    def test_added_font(self):
+        copyFont('standard', self.fontsDir)
+        fonts = manifest.FontManifest(self.fontsDir)
+        self.assertEqual(fonts.getFonts(), ['standard'])
+        copyFont('slant', self.fontsDir)
+        self.assertEqual(sorted(fonts.getFonts()), ['slant', 'standard'])
+        self.assertEqual(fonts.getFont('slant')['height'], 6)
+        # Fonts already read aren't read again
+        self.assertEqual(sorted(self.reads), ['slant.flf', 'standard.flf'])
+        os.remove(os.path.join(self.fontsDir, 'standard.flf'))
+        self.assertEqual(fonts.getFonts(), ['slant'])
+        with self.assertRaises(FontNotFound):
+            fonts.getFont('standard')
+
+    def test_size_change(self):
+        copyFont('standard', self.fontsDir, 'test')
+        fonts = manifest.FontManifest(self.fontsDir)
+        self.assertEqual(fonts.getFont('test')['height'], 6)
+        # The same file with another font's contents
+        copyFont('banner', self.fontsDir, 'test')
+        self.assertEqual(fonts.getFont('test')['height'],
+                         FigletFont('banner').height)
+        self.assertEqual(self.reads, ['test.flf', 'test.flf'])
+
+    def test_invalid(self):
+        copyFont('standard', self.fontsDir)
+        path = os.path.join(self.fontsDir, 'bad.flf')
+        with io.open(path, 'wb') as f:
+            f.write(b'not a font\n')
+        fonts = manifest.FontManifest(self.fontsDir)
+        self.assertEqual(fonts.getFonts(), ['standard'])
+        self.assertEqual(fonts.invalid, {'bad': os.path.getsize(path)})
+        del self.reads[:]
+        # Remembered by size, so not read again until that changes
+        self.assertEqual(fonts.getFonts(), ['standard'])
+        self.assertEqual(self.reads, [])
+        with io.open(path, 'ab') as f:
+            f.write(b'still not a font\n')
+        self.assertEqual(fonts.getFonts(), ['standard'])
+        self.assertEqual(self.reads, ['bad.flf'])
+
+    def test_write(self):
+        copyFont('standard', self.fontsDir)
+        copyFont('slant', self.fontsDir)
+        with io.open(os.path.join(self.fontsDir, 'bad.flf'), 'wb') as f:
+            f.write(b'not a font\n')
+        fonts = manifest.FontManifest(self.fontsDir)
+        fonts.refresh()
+        fonts.write()
+        del self.reads[:]
+        written = manifest.FontManifest(self.fontsDir)
+        self.assertEqual(sorted(written.getFonts()), ['slant', 'standard'])
+        self.assertEqual(written.fonts, fonts.fonts)
+        self.assertEqual(written.invalid, fonts.invalid)
+        self.assertEqual(self.reads, [])
+
+
+class MetadataTest(unittest.TestCase):
+
+    def test_metadata(self):
+        metadata = FigletFont.getMetadata('standard')
+        self.assertEqual(metadata['name'], 'standard')
+        self.assertEqual(metadata['format'], 'flf')
+        self.assertEqual(metadata['height'], 6)
+        self.assertEqual(metadata['comment'],
+                         FigletFont.infoFont('standard').split('\n')[0])
+        with self.assertRaises(FontNotFound):
+            FigletFont.getMetadata('nosuchfont')
+
+    def test_info_short(self):
+        for font in ('standard', 'slant', 'term'):
+            self.assertEqual(FigletFont.infoFont(font, short=True),
+                             FigletFont.infoFont(font).split('\n')[0])
+
+    def test_find_fonts(self):
+        found = FigletFont.findFonts(height=6, format='flf')
+        self.assertIn('standard', found)
+        self.assertNotIn('banner', found)
+        self.assertEqual(found, sorted(found))
+        for font in found:
+            self.assertEqual(FigletFont(font).height, 6, font)
+        self.assertEqual(FigletFont.findFonts(height=-1), [])
+        self.assertEqual(sorted(FigletFont.findFonts()),
+                         sorted(FigletFont.getFonts()))
+
+
+if __name__ == '__main__':
+    unittest.main()
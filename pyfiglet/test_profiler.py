@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A Profile observer records the phases and counters of loading fonts and
+rendering, and a Figlet without one keeps the plain engine
+"""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from pyfiglet import (FONT_CACHE, Figlet, FigletRenderingEngine, RenderCache,
+                      bundle, figlet_format)
+from pyfiglet.profiler import Profile, ProfilingFont, profilingEngine
+
+
+class ProfileTest(unittest.TestCase):
+
+    def setUp(self):
+        FONT_CACHE.clear()
+        # Parse the font file even where the font archive has been built
+        archive = bundle._archive
+        bundle._archive = False
+        self.addCleanup(setattr, bundle, '_archive', archive)
+
+    def tearDown(self):
+        FONT_CACHE.clear()
+
+    def test_phases(self):
+        profile = Profile()
+        f = Figlet(font='slant', observer=profile, renderCache=RenderCache())
+        self.assertIsInstance(f.Font, ProfilingFont)
+        self.assertEqual(f.renderText('hi there'),
+                         figlet_format('hi there', 'slant'))
+        for phase in ('font.archive', 'font.read', 'font.parse', 'render',
+                      'justify'):
+            self.assertEqual(profile.phases[phase][0], 1, phase)
+        self.assertEqual(profile.phases['addChar'][0], len('hi there'))
+        self.assertIn('smushAmount', profile.phases)
+        self.assertIn('smushChars', profile.phases)
+        for phase in profile.phases:
+            self.assertIn(phase, profile.report())
+
+    def test_counters(self):
+        profile = Profile()
+        f = Figlet(font='slant', observer=profile, renderCache=RenderCache())
+        # € isn't in the font
+        f.renderText('hi €')
+        f.renderText('hi €')
+        Figlet(font='slant', observer=profile)
+        counters = dict(profile.counters)
+        self.assertGreater(counters.pop('smush.evaluations'), 0)
+        self.assertEqual(counters, {
+            'fontCache.misses': 1,
+            'fontCache.hits': 1,
+            'glyphs': 3,
+            'glyphs.missing': 1,
+            'renderCache.misses': 1,
+            'renderCache.hits': 1,
+        })
+        profile.clear()
+        self.assertEqual((profile.phases, profile.counters), ({}, {}))
+
+    def test_no_observer(self):
+        Figlet(observer=Profile())
+        f = Figlet()
+        self.assertIs(type(f.engine), FigletRenderingEngine)
+        # The ProfilingFont the first Figlet loaded is shared through
+        # FONT_CACHE, and no longer reports to that profile
+        self.assertFalse(hasattr(f.Font, 'observer'))
+        # Engine classes are made once per plain class
+        self.assertIs(profilingEngine(FigletRenderingEngine),
+                      profilingEngine(FigletRenderingEngine))
+
+
+if __name__ == '__main__':
+    unittest.main()
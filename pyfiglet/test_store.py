@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Fonts served from a SharedFontStore match the parsed font files
+"""
+
+from __future__ import unicode_literals
+
+import gc
+import os
+import unittest
+
+from pyfiglet import FONT_CACHE, FigletFont, bundle, get_res_path, store
+from pyfiglet.test_bundle import ATTRIBUTES
+
+FONTS = ['standard', 'slant', 'mnemonic', 'term', 'doh']
+
+
+def parsed(font):
+    return FigletFont(font, data=FigletFont.preloadFont(font))
+
+
+class StoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.capacity = FONT_CACHE.capacity
+        FONT_CACHE.clear()
+
+    def tearDown(self):
+        for installed in list(bundle.stores):
+            installed.uninstall()
+        FONT_CACHE.clear()
+        FONT_CACHE.capacity = self.capacity
+
+    def assertSameFont(self, font, expected):
+        for name in ATTRIBUTES:
+            self.assertEqual(getattr(font, name), getattr(expected, name),
+                             '%s %s' % (font.font, name))
+        self.assertEqual(dict(font.chars), dict(expected.chars), font.font)
+        self.assertEqual(dict(font.width), dict(expected.width), font.font)
+
+    def test_fonts(self):
+        shared = store.SharedFontStore(FONTS + ['nosuchfont'])
+        self.assertEqual(sorted(shared.fonts), sorted(FONTS))
+        self.assertEqual(list(shared.failed), ['nosuchfont'])
+        shared.install()
+        for font in FONTS:
+            loaded = FigletFont(font)
+            self.assertIsInstance(loaded.chars.glyphs, bundle.ArchiveGlyphs)
+            self.assertSameFont(loaded, parsed(font))
+
+    def test_install(self):
+        standard = FONT_CACHE.getFont('standard')
+        shared = store.SharedFontStore(['standard']).install()
+        # Copies parsed before the store was installed are dropped
+        self.assertNotIn(('standard', None, False), FONT_CACHE)
+        self.assertIsNot(FONT_CACHE.getFont('standard'), standard)
+        slant = FONT_CACHE.getFont('slant')
+
+        shared.uninstall()
+        self.assertNotIn(shared, bundle.stores)
+        self.assertNotIn(('standard', None, False), FONT_CACHE)
+        self.assertIs(FONT_CACHE.getFont('slant'), slant)
+        glyphs = getattr(FigletFont('standard').chars, 'glyphs', None)
+        self.assertIsNot(getattr(glyphs, 'view', None), shared.view)
+
+    def test_stale_archive(self):
+        # An archive entry built from another version of the font file is
+        # not copied; the store packs the font file as it is now
+        path = get_res_path('pyfiglet.fonts', 'standard.flf')
+        blob = bundle.packFont(parsed('slant'))
+        archive = bundle._archive
+        for size in (os.path.getsize(path), os.path.getsize(path) + 1):
+            bundle._archive = bundle.FontArchive(
+                path, buffer=bundle.packArchive([('standard', size, blob)]))
+            try:
+                shared = store.SharedFontStore(['standard']).install()
+                loaded = FigletFont('standard')
+                shared.uninstall()
+            finally:
+                bundle._archive = archive
+            if size == os.path.getsize(path):
+                self.assertSameFont(loaded, parsed('slant'))
+            else:
+                self.assertSameFont(loaded, parsed('standard'))
+
+    def test_prefork(self):
+        FONT_CACHE.capacity = 1
+        shared = store.prefork(FONTS)
+        try:
+            self.assertIn(shared, bundle.stores)
+            self.assertEqual(FONT_CACHE.capacity, len(FONTS))
+            for font in FONTS:
+                self.assertIn((font, None, False), FONT_CACHE)
+        finally:
+            if hasattr(gc, 'unfreeze'):
+                gc.unfreeze()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Transforms of rendered text, on both backends, and the reverse and flip
+Figlet.renderTo applies as it writes
+"""
+
+from __future__ import unicode_literals
+
+import io
+import unittest
+
+from pyfiglet import Figlet, FigletString, RenderCache, figlet_format
+from pyfiglet.transform import IDENTITY, Transform
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+TEXTS = [
+    figlet_format('Hello /\\ <[{}]>', 'standard'),
+    figlet_format('AbM vw', 'slant'),
+    # Ragged rows, a blank row and characters beyond Latin-1
+    'ab\n/\\_\n\nx\n',
+    '██ ▀\n▄\n',
+    '\n',
+    '',
+]
+
+CHAINS = [
+    Transform(),
+    Transform().reverse(),
+    Transform().flip(),
+    Transform().reverse().flip(),
+    Transform().rotate(),
+    Transform().rotate(2),
+    Transform().rotate(-1),
+    Transform().crop(1, 2, 3, 4),
+    Transform().crop(left=3),
+    Transform().pad(1, 2, 3, 4),
+    Transform().justify('right', 30),
+    Transform().justify('center', 30).reverse(),
+    Transform().flip().pad(1, 0, 0, 2).rotate().crop(0, 1),
+    Transform().crop(0, 1, None, 5).justify('right', 12).flip().rotate(3),
+]
+
+
+class TransformTest(unittest.TestCase):
+
+    def test_reverse_and_flip(self):
+        for text in TEXTS:
+            s = FigletString(text)
+            for backend in backends():
+                self.assertEqual(
+                    Transform().reverse().apply(text, backend), s.reverse())
+                self.assertEqual(
+                    Transform().flip().apply(text, backend), s.flip())
+                self.assertEqual(
+                    Transform().reverse().flip().apply(text, backend),
+                    s.reverse().flip())
+
+    def test_cancelling_chains(self):
+        # The geometry cancels out; the translations don't have to, as the
+        # flip map isn't its own inverse
+        self.assertEqual(Transform().reverse().reverse().plan(),
+                         ([], IDENTITY))
+        for chain, ops in ((Transform().flip().flip(), 'ff'),
+                           (Transform().flip().reverse().reverse().flip(),
+                            'frrf')):
+            self.assertEqual(chain.plan()[0], [])
+            for text in TEXTS:
+                expected = FigletString(text)
+                for op in ops:
+                    expected = (expected.flip() if op == 'f'
+                                else expected.reverse())
+                for backend in backends():
+                    self.assertEqual(chain.apply(text, backend), expected)
+
+    def test_whole_turns(self):
+        # Four quarter turns still fill the rows out, as a zero pad does
+        chain = Transform().rotate().rotate().rotate().rotate()
+        self.assertEqual(chain.plan(), ([('rotate', 0)], IDENTITY))
+        for text in TEXTS:
+            for backend in backends():
+                self.assertEqual(chain.apply(text, backend),
+                                 Transform().pad().apply(text, backend))
+
+    def test_rotate(self):
+        self.assertEqual(Transform().rotate().apply('ab\n-/\n'),
+                         '|a\n\\b\n')
+        self.assertEqual(Transform().rotate(2).apply('ab\nc\n'),
+                         ' c\nba\n')
+
+    def test_crop_pad_justify(self):
+        text = 'abc\nd\nefgh\n'
+        self.assertEqual(Transform().crop(1, 1, 2, 2).apply(text), '\nfg\n')
+        self.assertEqual(Transform().pad(1, 1, 0, 1).apply(text),
+                         '      \n abc  \n d    \n efgh \n')
+        self.assertEqual(Transform().justify('right', 6).apply(text),
+                         '  abc\n    d\n efgh\n')
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_backends_agree(self):
+        for chain in CHAINS:
+            for text in TEXTS:
+                self.assertEqual(chain.apply(text, 'numpy'),
+                                 chain.apply(text, 'python'),
+                                 '%r %r' % (chain.ops, text))
+
+
+class RenderToTest(unittest.TestCase):
+
+    def assertRendersTo(self, f, text, expected, reverse, flip):
+        binary = io.BytesIO()
+        f.renderTo(binary, text, reverse, flip)
+        self.assertEqual(binary.getvalue().decode('UTF-8'), expected)
+        textual = io.StringIO()
+        f.renderTo(textual, text, reverse, flip)
+        self.assertEqual(textual.getvalue(), expected)
+
+    def test_reverse_and_flip(self):
+        texts = ['Hello /\\ <[{}]>', 'AbM vw\nsecond line', 'wrapped ' * 4,
+                 '']
+        for renderCache in (None, RenderCache()):
+            f = Figlet(font='slant', width=40, renderCache=renderCache)
+            for text in texts:
+                s = f.renderText(text)
+                for reverse, flip, expected in (
+                        (False, False, s),
+                        (True, False, s.reverse()),
+                        (False, True, s.flip()),
+                        (True, True, s.reverse().flip())):
+                    self.assertRendersTo(f, text, expected, reverse, flip)
+                    # Chunks go through iterRender, never the cache
+                    chunks = [text[i:i + 3] for i in range(0, len(text), 3)]
+                    self.assertRendersTo(f, chunks, expected, reverse, flip)
+            if renderCache is not None:
+                # Strings were rendered once, by renderText
+                self.assertEqual(renderCache.misses, len(texts))
+
+
+def backends():
+    return ['python'] if numpy is None else ['python', 'numpy']
+
+
+if __name__ == '__main__':
+    unittest.main()
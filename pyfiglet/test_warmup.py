@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Preloading fonts: failures, progress reports and waiting for the end
+"""
+
+from __future__ import unicode_literals
+
+import threading
+import time
+import unittest
+
+from pyfiglet import FONT_CACHE, FigletFont, FontNotFound, preload
+
+FONTS = ['standard', 'nosuchfont', 'slant', 'term', 'banner', 'big',
+         'mnemonic', 'doh', 'alsonosuchfont', 'small', 'mini', 'script']
+
+# Long enough for any of the tests to finish, short enough for a hang
+# to fail rather than stall the suite
+TIMEOUT = 30
+
+
+class Dying(BaseException):
+    """
+    Not caught by the workers, so it ends the thread that raised it
+    """
+
+
+class PreloadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.capacity = FONT_CACHE.capacity
+        FONT_CACHE.clear()
+
+    def tearDown(self):
+        FONT_CACHE.clear()
+        FONT_CACHE.capacity = self.capacity
+
+    def test_failures(self):
+        FONT_CACHE.capacity = 2
+        warmup = preload(FONTS, parallel=3)
+        self.assertTrue(warmup.done())
+        self.assertEqual(sorted(warmup.failed),
+                         ['alsonosuchfont', 'nosuchfont'])
+        for error in warmup.failed.values():
+            self.assertIsInstance(error, FontNotFound)
+        self.assertEqual(sorted(warmup.loaded),
+                         sorted(set(FONTS) - set(warmup.failed)))
+        # Capacity was raised so that none of them was evicted
+        for font in warmup.loaded:
+            self.assertIn((font, None, False), FONT_CACHE)
+
+    def test_progress(self):
+        calls = []
+        running = []
+        overlaps = []
+
+        def progress(done, total, font, error):
+            # Failed assertions would be swallowed here, like any error
+            # from the callback, so overlapping calls are only recorded.
+            # The sleep gives another worker time to overlap.
+            running.append(font)
+            time.sleep(0.002)
+            overlaps.append(len(running) > 1)
+            calls.append((done, total, font, error))
+            running.remove(font)
+
+        warmup = preload(FONTS, parallel=4, progress=progress)
+        self.assertFalse(any(overlaps))
+        self.assertEqual([done for done, total, font, error in calls],
+                         list(range(1, len(FONTS) + 1)))
+        self.assertEqual(set(total for done, total, font, error in calls),
+                         set([len(FONTS)]))
+        self.assertEqual(sorted(font for done, total, font, error in calls),
+                         sorted(FONTS))
+        for done, total, font, error in calls:
+            self.assertIs(error, warmup.failed.get(font))
+
+    def test_wait(self):
+        release = threading.Event()
+
+        def progress(done, total, font, error):
+            release.wait(TIMEOUT)
+
+        warmup = preload(['standard', 'slant'], parallel=1,
+                         progress=progress, wait=False)
+        self.assertFalse(warmup.wait(0.01))
+        self.assertFalse(warmup.done())
+        release.set()
+        self.assertTrue(warmup.wait(TIMEOUT))
+        self.assertEqual(sorted(warmup.loaded), ['slant', 'standard'])
+
+    def test_nothing(self):
+        warmup = preload([], wait=False)
+        self.assertTrue(warmup.wait(0))
+
+    def test_raising_progress(self):
+        def progress(done, total, font, error):
+            raise ValueError(font)
+
+        warmup = preload(FONTS, parallel=2, progress=progress, wait=False)
+        self.assertTrue(warmup.wait(TIMEOUT))
+        self.assertEqual(len(warmup.loaded) + len(warmup.failed),
+                         len(FONTS))
+
+    def test_dying_worker(self):
+        # Every worker dies after its first font, wait() returns all the
+        # same
+        excepthook = getattr(threading, 'excepthook', None)
+        if excepthook is not None:
+            threading.excepthook = lambda args: None
+
+        def progress(done, total, font, error):
+            raise Dying(font)
+
+        try:
+            warmup = preload(FONTS, parallel=2, progress=progress,
+                             wait=False)
+            self.assertTrue(warmup.wait(TIMEOUT))
+        finally:
+            if excepthook is not None:
+                threading.excepthook = excepthook
+        self.assertEqual(len(warmup.loaded) + len(warmup.failed), 2)
+
+    def test_all(self):
+        warmup = preload(parallel=False, wait=False)
+        self.assertTrue(warmup.wait(TIMEOUT))
+        self.assertEqual(sorted(warmup.loaded + list(warmup.failed)),
+                         sorted(FigletFont.getFonts()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,328 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Transforms of rendered text
+
+A Transform is a chain of operations on the grid of characters of a
+rendered string: reverse, flip, rotate, crop, pad and justify. Building
+the chain doesn't touch any text. When it is applied, the character
+translations of every step are folded into one table, steps that undo
+each other are dropped, and the text is split once, transformed and
+joined once.
+
+Rows may be ragged. Each row holds its own characters, and reverse,
+flip and crop work on those exactly as FigletString.reverse and flip do.
+pad and rotate first fill short rows out with spaces to the widest one.
+
+There are two backends. The pure python one works on the rows as
+strings; str slicing and translate are hard to beat for everything but
+rotation. The NumPy one works on the grid as one array of Latin-1 bytes,
+or of code points when the text needs them. In that array flips, crops
+and rotations are views, so rotating a large grid costs one copy instead
+of a join per column. By default NumPy is used when it is installed and
+the chain rotates a grid of at least NUMPY_CELLS cells.
+"""
+
+from __future__ import unicode_literals
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from . import FigletString
+
+try:
+    unichr
+except NameError:
+    unichr = chr
+
+
+def _table(pairs=''):
+    """
+    Latin-1 translation table swapping each pair of characters
+    """
+    table = [unichr(i) for i in range(256)]
+    for a, b in zip(pairs[::2], pairs[1::2]):
+        table[ord(a)], table[ord(b)] = b, a
+    return ''.join(table)
+
+
+IDENTITY = _table()
+
+# A quarter turn makes horizontal strokes vertical and swaps diagonals
+ROTATE_MAP = _table('-|/\\')
+
+# Smallest grid a rotating chain is handed to NumPy for
+NUMPY_CELLS = 16384
+
+
+class Transform(object):
+    """
+    Chain of grid operations, applied to text with apply() or by calling
+    the Transform. Each operation returns a new, longer chain.
+    """
+
+    def __init__(self, ops=()):
+        self.ops = tuple(ops)
+
+    def _then(self, *op):
+        return Transform(self.ops + (op,))
+
+    def reverse(self):
+        """
+        Mirror each row, as FigletString.reverse
+        """
+        return self._then('reverse')
+
+    def flip(self):
+        """
+        Turn the rows upside down, as FigletString.flip
+        """
+        return self._then('flip')
+
+    def rotate(self, turns=1):
+        """
+        Fill the rows out to the widest and rotate by turns quarter turns
+        clockwise
+        """
+        return self._then('rotate', turns % 4)
+
+    def crop(self, top=0, left=0, height=None, width=None):
+        """
+        Keep height rows from top, and of each up to width characters from
+        column left
+        """
+        return self._then('crop', top, left, height, width)
+
+    def pad(self, top=0, right=0, bottom=0, left=0):
+        """
+        Fill the rows out to the widest and add margins of spaces
+        """
+        return self._then('pad', top, right, bottom, left)
+
+    def justify(self, side, width=80):
+        """
+        Indent each row to justify it in width columns, as the rendering
+        engine does
+        """
+        return self._then('justify', side, width)
+
+    def plan(self):
+        """
+        Fuse the chain: returns the geometric steps left once steps that
+        cancel out are dropped, and one translation table for all of them
+        """
+        table = IDENTITY
+        steps = []
+        for op in self.ops:
+            name = op[0]
+            if name == 'reverse':
+                table = _compose(table, FigletString.__reverse_map__)
+            elif name == 'flip':
+                table = _compose(table, FigletString.__flip_map__)
+            elif name == 'rotate':
+                if op[1] % 2:
+                    table = _compose(table, ROTATE_MAP)
+                if steps and steps[-1][0] == 'rotate':
+                    # Whole turns are kept, they still fill out the rows
+                    op = ('rotate', (steps.pop()[1] + op[1]) % 4)
+            if name in ('reverse', 'flip') and steps and steps[-1] == op:
+                steps.pop()
+                continue
+            steps.append(op)
+        return steps, table
+
+    def apply(self, text, backend=None):
+        """
+        Transform text, returning a FigletString. backend is 'python' or
+        'numpy', chosen as described above by default.
+        """
+        steps, table = self.plan()
+        rows = text.splitlines()
+        if backend is None:
+            backend = 'python'
+            if numpy is not None and any(op[0] == 'rotate' for op in steps):
+                cells = len(rows) * max([len(row) for row in rows] or [0])
+                if cells >= NUMPY_CELLS:
+                    backend = 'numpy'
+        if backend == 'numpy' and numpy is None:
+            raise ImportError('the numpy backend needs NumPy installed')
+        if backend == 'numpy':
+            rows = _applyArray(rows, steps, table)
+        else:
+            rows = _applyRows(rows, steps, table)
+        return FigletString('\n'.join(rows) + '\n')
+
+    __call__ = apply
+
+
+def _compose(first, second):
+    return ''.join(second[ord(c)] for c in first)
+
+
+def _indent(side, width, length):
+    if side == 'right':
+        return max(width - length - 1, 0)
+    elif side == 'center':
+        return max(int((width - length) / 2), 0)
+    return 0
+
+
+### Pure python backend ###
+
+def _fill(rows):
+    width = max([len(row) for row in rows] or [0])
+    return [row.ljust(width) for row in rows], width
+
+
+def _applyRows(rows, steps, table):
+    for op in steps:
+        name = op[0]
+        if name == 'reverse':
+            rows = [row[::-1] for row in rows]
+        elif name == 'flip':
+            rows = rows[::-1]
+        elif name == 'crop':
+            top, left, height, width = op[1:]
+            bottom = None if height is None else top + height
+            right = None if width is None else left + width
+            rows = [row[left:right] for row in rows[top:bottom]]
+        elif name == 'pad':
+            top, right, bottom, left = op[1:]
+            rows, width = _fill(rows)
+            blank = ' ' * (left + width + right)
+            rows = ([blank] * top
+                    + [' ' * left + row + ' ' * right for row in rows]
+                    + [blank] * bottom)
+        elif name == 'rotate':
+            rows, width = _fill(rows)
+            if not width and op[1]:
+                rows = []
+            if op[1] >= 2:
+                rows = [row[::-1] for row in rows[::-1]]
+            if op[1] % 2:
+                rows = [''.join(column) for column in zip(*rows[::-1])]
+        elif name == 'justify':
+            side, width = op[1:]
+            rows = [' ' * _indent(side, width, len(row)) + row
+                    for row in rows]
+    if table != IDENTITY:
+        rows = [row.translate(table) for row in rows]
+    return rows
+
+
+### NumPy backend ###
+
+# Cells past the end of a short row
+_EMPTY = 0
+
+
+def _toArray(rows):
+    """
+    Rows as a 2D array of Latin-1 bytes, or of UTF-32 code points if they
+    don't all fit, with short rows padded with _EMPTY; the length of each
+    row; and the encoding used
+    """
+    lengths = numpy.array([len(row) for row in rows], dtype=numpy.intp)
+    width = int(lengths.max()) if len(rows) else 0
+    data = ''.join(row.ljust(width, '\0') for row in rows)
+    try:
+        data = data.encode('latin-1')
+        encoding, dtype = 'latin-1', numpy.uint8
+    except UnicodeEncodeError:
+        data = data.encode('utf-32-le')
+        encoding, dtype = 'utf-32-le', numpy.dtype('<u4')
+    grid = numpy.frombuffer(data, dtype=dtype)
+    return grid.reshape(len(rows), width), lengths, encoding
+
+
+def _byLength(lengths):
+    """
+    (length, row mask) for each distinct row length
+    """
+    for length in numpy.unique(lengths).tolist():
+        yield length, lengths == length
+
+
+def _fillArray(grid, lengths):
+    """
+    Fill short rows out with spaces, returning the grid and new lengths
+    """
+    if (lengths != grid.shape[1]).any():
+        grid = numpy.where(grid == _EMPTY, ord(' '), grid).astype(grid.dtype)
+    return grid, numpy.full(grid.shape[0], grid.shape[1], dtype=numpy.intp)
+
+
+def _applyArray(rows, steps, table):
+    grid, lengths, encoding = _toArray(rows)
+    for op in steps:
+        height, width = grid.shape
+        name = op[0]
+        if name == 'reverse':
+            if (lengths == width).all():
+                grid = grid[:, ::-1]
+            else:
+                # Short rows are mirrored in place, not against the widest
+                mirrored = numpy.zeros_like(grid)
+                for length, rowMask in _byLength(lengths):
+                    if length:
+                        mirrored[rowMask, :length] = (
+                            grid[rowMask, length - 1::-1])
+                grid = mirrored
+        elif name == 'flip':
+            grid = grid[::-1]
+            lengths = lengths[::-1]
+        elif name == 'crop':
+            top, left, cropHeight, cropWidth = op[1:]
+            bottom = None if cropHeight is None else top + cropHeight
+            right = None if cropWidth is None else left + cropWidth
+            grid = grid[top:bottom, left:right]
+            lengths = numpy.clip(lengths[top:bottom] - left, 0,
+                                 grid.shape[1])
+            # Keep the grid as wide as its widest row
+            grid = grid[:, :int(lengths.max()) if len(lengths) else 0]
+        elif name == 'pad':
+            top, right, bottom, left = op[1:]
+            grid, lengths = _fillArray(grid, lengths)
+            grid = numpy.pad(grid, ((top, bottom), (left, right)),
+                             constant_values=ord(' '))
+            lengths = numpy.full(grid.shape[0], grid.shape[1],
+                                 dtype=numpy.intp)
+        elif name == 'rotate':
+            grid, lengths = _fillArray(grid, lengths)
+            if not width and op[1]:
+                # Rows of no characters turn into no rows at all
+                grid = grid.reshape(0, 0)
+            grid = numpy.rot90(grid, -op[1])
+            lengths = numpy.full(grid.shape[0], grid.shape[1],
+                                 dtype=numpy.intp)
+        elif name == 'justify':
+            side, justifyWidth = op[1:]
+            indents = numpy.array(
+                [_indent(side, justifyWidth, length)
+                 for length in lengths.tolist()], dtype=numpy.intp)
+            if not indents.any():
+                continue
+            justified = numpy.zeros(
+                (height, int((indents + lengths).max())), dtype=grid.dtype)
+            for indent, rowMask in _byLength(indents):
+                longest = int(lengths[rowMask].max())
+                justified[rowMask, :indent] = ord(' ')
+                justified[rowMask, indent:indent + longest] = (
+                    grid[rowMask, :longest])
+            grid = justified
+            lengths = indents + lengths
+
+    if table != IDENTITY:
+        lookup = numpy.array([ord(c) for c in table], dtype=grid.dtype)
+        if encoding == 'latin-1':
+            grid = lookup[grid]
+        else:
+            grid = numpy.where(grid < 256, lookup[numpy.minimum(grid, 255)],
+                               grid)
+    data = numpy.ascontiguousarray(grid).tobytes().decode(encoding)
+    width = grid.shape[1]
+    return [data[i * width:i * width + length]
+            for i, length in enumerate(lengths.tolist())]
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Loading fonts ahead of time, see pyfiglet.preload
+"""
+
+from __future__ import unicode_literals
+
+import threading
+
+from . import FONT_CACHE, FigletFont
+
+# Most worker threads parallel=True starts
+MAX_JOBS = 4
+
+
+class Preload(object):
+    """
+    Fonts being loaded into FONT_CACHE by background threads. loaded lists
+    the fonts loaded so far and failed maps each font that couldn't be
+    loaded to the exception it raised.
+    """
+
+    def __init__(self, fonts, jobs=1, progress=None, fontkwargs=None):
+        self.fonts = list(fonts)
+        self.jobs = max(1, min(jobs, len(self.fonts)))
+        self.progress = progress
+        self.fontkwargs = fontkwargs or {}
+        self.loaded = []
+        self.failed = {}
+        self._pending = self.fonts[::-1]
+        self._lock = threading.Lock()
+        # Held to record a font and report it, so progress calls don't
+        # overlap or arrive out of order
+        self._reportLock = threading.Lock()
+        self._finished = threading.Event()
+        self._threads = []
+        self._running = 0
+
+    def start(self):
+        # Every font has to fit, or the warm-up would evict its own fonts
+        FONT_CACHE.reserve(len(self.fonts))
+        if not self.fonts:
+            self._finished.set()
+            return self
+        self._running = self.jobs
+        for i in range(self.jobs):
+            thread = threading.Thread(target=self._work,
+                                      name='pyfiglet-preload-%d' % i)
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def _work(self):
+        try:
+            self._loadFonts()
+        finally:
+            # However a worker ends, the last one out finishes the warm-up,
+            # so wait() can't block forever
+            with self._lock:
+                self._running -= 1
+                if self._running == 0:
+                    self._finished.set()
+
+    def _loadFonts(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    return
+                font = self._pending.pop()
+            error = None
+            try:
+                FONT_CACHE.getFont(font, **self.fontkwargs)
+            except Exception as e:
+                # One bad font doesn't stop the others
+                error = e
+            with self._reportLock:
+                if error is None:
+                    self.loaded.append(font)
+                else:
+                    self.failed[font] = error
+                if self.progress is not None:
+                    done = len(self.loaded) + len(self.failed)
+                    try:
+                        self.progress(done, len(self.fonts), font, error)
+                    except Exception:
+                        # A broken callback doesn't stop the warm-up either
+                        pass
+
+    def done(self):
+        return self._finished.is_set()
+
+    def wait(self, timeout=None):
+        """
+        Wait for every font to be loaded or to fail, returning whether
+        they all were before timeout
+        """
+        self._finished.wait(timeout)
+        return self.done()
+
+
+def preload(fonts='all', parallel=True, progress=None, wait=True,
+            **fontkwargs):
+    if fonts == 'all':
+        fonts = sorted(FigletFont.getFonts())
+    elif isinstance(fonts, (str, type(''))):
+        fonts = [fonts]
+    if parallel is True:
+        jobs = MAX_JOBS
+    elif parallel:
+        jobs = int(parallel)
+    else:
+        jobs = 1
+    warmup = Preload(fonts, jobs, progress, fontkwargs).start()
+    if wait:
+        warmup.wait()
+    return warmup
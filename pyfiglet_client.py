@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Entry point of the pyfiglet command, and the client side of the render
+daemon in pyfiglet.server
+
+This module lives outside the package so that a render the daemon
+answers costs no more than starting the interpreter and importing json
+and socket: importing anything from pyfiglet would load the whole
+package first. When client mode is on (--client, or PYFIGLET_ADDRESS set)
+and the command line only holds render options and text, the text is
+sent to the daemon. Anything else, or any failure, runs the full command
+in pyfiglet.cli, which renders in-process.
+"""
+
+from __future__ import unicode_literals
+
+import errno
+import json
+import os
+import socket
+import stat
+import sys
+
+# Environment variable naming the daemon's address
+ADDRESS_VARIABLE = 'PYFIGLET_ADDRESS'
+
+# Seconds a client waits for the daemon before rendering itself
+TIMEOUT = 5.0
+
+# Command line options the daemon can answer: option -> (request field,
+# whether it takes a value)
+OPTIONS = {
+    '-f': ('font', True), '--font': ('font', True),
+    '-D': ('direction', True), '--direction': ('direction', True),
+    '-j': ('justify', True), '--justify': ('justify', True),
+    '-w': ('width', True), '--width': ('width', True),
+    '-s': ('smushMode', True), '--smushmode': ('smushMode', True),
+    '-p': ('paragraph', False), '--paragraph': ('paragraph', False),
+    '-r': ('reverse', False), '--reverse': ('reverse', False),
+    '-F': ('flip', False), '--flip': ('flip', False),
+    '-C': ('client', False), '--client': ('client', False),
+    '--address': ('address', True),
+}
+
+CHOICES = {
+    'direction': ('auto', 'left-to-right', 'right-to-left'),
+    'justify': ('auto', 'left', 'center', 'right'),
+}
+
+
+class Unavailable(EnvironmentError):
+    """
+    Raised by exchange when no daemon answers at the address
+    """
+
+
+def runtimeDir():
+    """
+    Directory of the default socket: $XDG_RUNTIME_DIR, or else a
+    pyfiglet-<uid> directory in the temporary directory, which the daemon
+    creates for its user alone
+    """
+    runtime = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime:
+        return runtime
+    # Where tempfile.gettempdir() looks first, without importing it
+    tmp = (os.environ.get('TMPDIR') or os.environ.get('TEMP')
+           or os.environ.get('TMP') or '/tmp')
+    uid = os.getuid() if hasattr(os, 'getuid') else 0
+    return os.path.join(tmp, 'pyfiglet-%d' % uid)
+
+
+def defaultAddress():
+    """
+    The address in PYFIGLET_ADDRESS, or else a socket in runtimeDir(), or
+    localhost port 8970 where there are no Unix sockets
+    """
+    address = os.environ.get(ADDRESS_VARIABLE)
+    if address:
+        return address
+    if hasattr(socket, 'AF_UNIX'):
+        return os.path.join(runtimeDir(), 'pyfiglet.sock')
+    return 'localhost:8970'
+
+
+def checkDir(path):
+    """
+    Raise EnvironmentError unless only this user, or root, can add or
+    replace entries of the directory at path: it is theirs and not
+    writable by others, or it is sticky like /tmp
+    """
+    if not hasattr(os, 'getuid'):
+        return
+    st = os.stat(path)
+    if st.st_uid not in (os.getuid(), 0):
+        raise EnvironmentError(errno.EPERM,
+                               '%s belongs to another user' % path)
+    if st.st_mode & (stat.S_IWGRP | stat.S_IWOTH) and not (
+            st.st_mode & stat.S_ISVTX):
+        raise EnvironmentError(errno.EPERM,
+                               '%s is writable by other users' % path)
+
+
+def checkSocket(path):
+    """
+    Raise EnvironmentError unless path is a socket of this user's, in a
+    directory other users can't swap it out of (see checkDir), so that
+    nobody else can answer in the daemon's place
+    """
+    if not hasattr(os, 'getuid'):
+        return
+    checkDir(os.path.dirname(os.path.abspath(path)))
+    st = os.lstat(path)
+    if not stat.S_ISSOCK(st.st_mode):
+        raise EnvironmentError(errno.EPERM, '%s is not a socket' % path)
+    if st.st_uid != os.getuid():
+        raise EnvironmentError(errno.EPERM,
+                               '%s belongs to another user' % path)
+
+
+def parseAddress(address):
+    """
+    Socket family and address of 'host:port', a bare port on localhost,
+    or a Unix socket path
+    """
+    if address.isdigit():
+        return socket.AF_INET, ('127.0.0.1', int(address))
+    host, sep, port = address.rpartition(':')
+    if sep and port.isdigit() and os.sep not in address:
+        return socket.AF_INET, (host or '127.0.0.1', int(port))
+    return socket.AF_UNIX, address
+
+
+def exchange(request, address=None, timeout=TIMEOUT):
+    """
+    Send request to the daemon at address and return its reply. Raises
+    Unavailable when nothing answers.
+    """
+    family, address = parseAddress(address or defaultAddress())
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        try:
+            if family != socket.AF_INET:
+                checkSocket(address)
+            sock.connect(address)
+            sock.sendall(json.dumps(request).encode('UTF-8') + b'\n')
+            # Not a context manager on python2
+            f = sock.makefile('rb')
+            try:
+                line = f.readline()
+            finally:
+                f.close()
+        except (socket.timeout, EnvironmentError) as e:
+            raise Unavailable('no daemon at %s: %s' % (address, e))
+    finally:
+        sock.close()
+    if not line:
+        raise Unavailable('no reply from %s' % (address,))
+    return json.loads(line.decode('UTF-8'))
+
+
+def parseArgs(args):
+    """
+    The request a command line asks for, or None when it asks for more
+    than the daemon does or would make the command print an error
+    """
+    request = {}
+    text = []
+    args = list(args)
+    while args:
+        arg = args.pop(0)
+        if arg == '--':
+            text.extend(args)
+            break
+        if not arg.startswith('-') or arg == '-':
+            text.append(arg)
+            continue
+        if arg.startswith('--') and '=' in arg:
+            arg, value = arg.split('=', 1)
+            args.insert(0, value)
+        elif not arg.startswith('--') and len(arg) > 2:
+            if arg[:2] not in OPTIONS:
+                return None
+            if OPTIONS[arg[:2]][1]:
+                args.insert(0, arg[2:])
+            else:
+                # Bundled flags, as in -rF
+                args.insert(0, '-' + arg[2:])
+            arg = arg[:2]
+        if arg not in OPTIONS:
+            return None
+        field, takesValue = OPTIONS[arg]
+        if not takesValue:
+            request[field] = True
+            continue
+        if not args:
+            return None
+        value = args.pop(0)
+        if field in ('width', 'smushMode'):
+            try:
+                value = int(value)
+            except ValueError:
+                return None
+        elif value not in CHOICES.get(field, (value,)):
+            return None
+        request[field] = value
+
+    if not text:
+        return None
+    if not request.get('smushMode'):
+        # As the command, which ignores -s 0
+        request.pop('smushMode', None)
+    request['text'] = ' '.join(text)
+    return request
+
+
+def render(args):
+    """
+    The daemon's output for the command line args, or None when the
+    command has to run in-process
+    """
+    request = parseArgs(args)
+    if request is None:
+        return None
+    address = request.pop('address', None)
+    if not (request.pop('client', False) or os.environ.get(ADDRESS_VARIABLE)):
+        return None
+    try:
+        reply = exchange(request, address)
+    except Unavailable:
+        return None
+    # Errors are raised again in-process, exactly as without a daemon
+    return reply.get('output')
+
+
+def main():
+    output = render(sys.argv[1:])
+    if output is not None:
+        out = getattr(sys.stdout, 'buffer', sys.stdout)
+        out.write((output + '\n').encode('UTF-8'))
+        return 0
+    from pyfiglet.cli import main
+    return main(daemon=False)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
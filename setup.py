@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 
 from setuptools import setup
+from setuptools.command.build_py import build_py
+import os
 import sys
 
 
@@ -10,6 +12,38 @@ def get_version():
     sys.path.pop(0)
     return __version__
 
+class build_py_with_archive(build_py):
+    """
+    Also compile the bundled fonts into the memory-mapped font archive and
+    write the font manifest, and leave out pyfiglet.aio where it can't run
+    """
+
+    def find_package_modules(self, package, package_dir):
+        modules = build_py.find_package_modules(self, package, package_dir)
+        if sys.version_info < (3, 7):
+            # pyfiglet.aio is asyncio code for Python 3.7 and later, which
+            # older versions can't even byte-compile
+            modules = [module for module in modules
+                       if module[:2] != ('pyfiglet', 'aio')]
+        return modules
+
+    def run(self):
+        build_py.run(self)
+        if self.dry_run:
+            return
+        sys.path.insert(0, self.build_lib)
+        try:
+            from pyfiglet import bundle, manifest
+            fontsDir = os.path.join(self.build_lib, 'pyfiglet', 'fonts')
+            bundle.compileArchive(
+                fontsDir, os.path.join(fontsDir, bundle.ARCHIVE))
+            fontManifest = manifest.FontManifest(fontsDir)
+            fontManifest.refresh()
+            fontManifest.write()
+        finally:
+            sys.path.pop(0)
+
+
 setup(
     name='pyfiglet',
     version=get_version(),
@@ -34,12 +68,12 @@ setup(
         'Operating System :: Unix',
         'Programming Language :: Python',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 2.6',
         'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3.1',
         'Programming Language :: Python :: 3.2',
         'Programming Language :: Python :: 3.3',
         'Programming Language :: Python :: 3.4',
+        'Programming Language :: Python :: 3.7',
         'Topic :: Text Processing',
         'Topic :: Text Processing :: Fonts',
     ],
@@ -47,10 +81,16 @@ setup(
     author_email='peter.waller@gmail.com',
     url='https://github.com/pwaller/pyfiglet',
     packages=['pyfiglet', 'pyfiglet.fonts'],
+    py_modules=['pyfiglet_client'],
+    python_requires='>=2.7',
+    cmdclass={'build_py': build_py_with_archive},
     package_data={'pyfiglet.fonts': ['*.flf']},
+    extras_require={
+        'numpy': ['numpy'],
+    },
     entry_points={
         'console_scripts': [
-            'pyfiglet = pyfiglet:main',
+            'pyfiglet = pyfiglet_client:main',
         ],
     }
 )